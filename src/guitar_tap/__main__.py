@@ -62,8 +62,23 @@ if sys.platform != "win32" and _fh_target is not None:
 # os.path.dirname(__file__) is src/guitar_tap/.
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Process-pool workers (batch analysis, large imports in views/measurement_import.py)
+# re-launch a frozen build's executable; hand them over before anything else runs.
+if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+# Headless batch mode: `python -m guitar_tap analyze <dir> ...`.  Dispatched
+# before any GUI setup.  The MainWindow import lives in the __main__ block
+# below, so its worker processes (which re-import this module as
+# __mp_main__) never load the main window either; they import only the
+# view-layer helpers the pipeline needs (AppSettings, measurements_to_json),
+# and views/__init__.py imports MainWindow lazily.
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "analyze":
+    from batch_analyze import main as _analyze_main
+    sys.exit(_analyze_main(sys.argv[2:]))
+
 from PySide6 import QtCore, QtGui, QtWidgets
-from views.tap_tone_analysis_view import MainWindow, basedir
 
 if os.name == "nt":
     from ctypes import windll
@@ -147,6 +162,8 @@ if __name__ == "__main__":
 
     sys.excepthook = _excepthook
 
+    from views.tap_tone_analysis_view import MainWindow, basedir
+
     rc = 0
     try:
         app = MainWindow()
@@ -0,0 +1,239 @@
+"""
+Headless batch analysis — ``python -m guitar_tap analyze <dir> ...``.
+
+Python-only; Swift has no command-line entry point.  Re-analyzes a directory
+of tap recordings (session WAVs from ``finish_session_recording``, capture
+dumps from ``_dump_capture_wav``, or any mono/stereo audio file soundfile can
+read) into ``.guitartap`` files without opening a window.
+
+Each file runs through the SAME pipeline as the GUI's file playback —
+``TapToneAnalyzer.for_testing()`` + ``play_file_for_testing()`` — in offline
+mode (``realtime=False``: no chunk pacing, timers on the audio clock), so a
+batch result is the measurement the app would have produced for that file.
+
+Files are fanned out across a process pool, one fresh analyzer per file.
+Workers share nothing but the input path and options, so throughput scales
+with the number of cores.  Each worker writes its own ``<name>.guitartap``
+(through ``measurements_to_json``, the same encoder as Export) and returns a
+small timing record; the parent only prints the summary.
+
+The saved-measurements library is never touched: measurements are built with
+``build_measurement``, not ``save_measurement``.  Nor are the user's settings:
+each file runs inside ``AppSettings.in_memory_suite()``, so its measurement
+type stays in the worker, and Dump Capture Audio is forced off there (a batch
+run writes no session or capture WAVs).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+# Extensions picked up from the input directory (soundfile-readable formats).
+AUDIO_EXTENSIONS: tuple[str, ...] = (".wav", ".aif", ".aiff", ".flac")
+
+# --type choices → MeasurementType raw values.
+_TYPE_CHOICES: dict[str, str] = {
+    "guitar": "Generic Guitar",
+    "plate": "Material (Plate)",
+    "brace": "Material (Brace)",
+}
+
+
+# MARK: - Result record
+
+@dataclass
+class FileResult:
+    """Outcome of analyzing one file (returned from the worker process)."""
+
+    path: str
+    output_path: str | None
+    elapsed_s: float
+    audio_s: float
+    taps: int
+    peaks: int
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# MARK: - Worker
+
+def _init_worker() -> None:
+    """Process-pool initializer: no display, and model imports resolvable."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    here = os.path.dirname(os.path.abspath(__file__))
+    if here not in sys.path:
+        sys.path.insert(0, here)
+
+
+def analyze_file(
+    path: str,
+    measurement_type: str,
+    number_of_taps: int,
+    output_dir: str,
+    calibration_path: str | None = None,
+    tap_threshold: float | None = None,
+) -> FileResult:
+    """Analyze one recording and write ``<output_dir>/<name>.guitartap``.
+
+    Runs in a worker process.  Never raises — failures are reported in
+    ``FileResult.error`` so one bad file does not abort the batch.
+    """
+    _init_worker()
+    t0 = time.perf_counter()
+    name = os.path.splitext(os.path.basename(path))[0]
+    try:
+        import soundfile as sf
+
+        from models.measurement_type import MeasurementType
+        from models.tap_tone_analyzer import TapToneAnalyzer
+        from views.tap_analysis_results_view import measurements_to_json
+        from views.utilities.tap_settings_view import AppSettings
+
+        # The analyzer sets the measurement type; keep that (and the forced-off
+        # dump) out of the user's preferences and the other workers.
+        with AppSettings.in_memory_suite():
+            AppSettings.set_dump_capture_audio(False)
+            mt = MeasurementType(measurement_type)
+            info = sf.info(path)
+            analyzer = TapToneAnalyzer.for_testing(sample_rate=int(info.samplerate))
+            if tap_threshold is not None:
+                analyzer.tap_detection_threshold = tap_threshold
+            analyzer.play_file_for_testing(
+                path=path,
+                measurement_type=mt,
+                number_of_taps=number_of_taps,
+                calibration_path=calibration_path,
+                realtime=False,
+            )
+            captured = len(analyzer.captured_taps)
+            if not analyzer.is_measurement_complete:
+                return FileResult(
+                    path, None, time.perf_counter() - t0, float(info.duration), captured, 0,
+                    error=f"measurement incomplete ({captured}/{number_of_taps} taps)",
+                )
+
+            measurement = analyzer.build_measurement(
+                measurement_name=name,
+                selected_longitudinal_peak_id=(
+                    analyzer.effective_longitudinal_peak_id if not mt.is_guitar else None
+                ),
+                selected_cross_peak_id=analyzer.effective_cross_peak_id if mt.is_plate else None,
+                selected_flc_peak_id=analyzer.effective_flc_peak_id if mt.is_plate else None,
+                calibration_name=analyzer._active_calibration_name,
+                sample_rate=float(info.samplerate),
+            )
+            out_path = os.path.join(output_dir, f"{name}.guitartap")
+            tmp = out_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(measurements_to_json([measurement]))
+            os.replace(tmp, out_path)
+            return FileResult(
+                path, out_path, time.perf_counter() - t0, float(info.duration),
+                captured, len(measurement.peaks),
+            )
+    except Exception as exc:  # reported per file, never fatal to the batch
+        return FileResult(
+            path, None, time.perf_counter() - t0, 0.0, 0, 0,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+
+
+# MARK: - Driver
+
+def find_recordings(directory: str) -> list[str]:
+    """Audio files directly inside *directory*, sorted by name."""
+    return sorted(
+        os.path.join(directory, entry)
+        for entry in os.listdir(directory)
+        if entry.lower().endswith(AUDIO_EXTENSIONS)
+        and os.path.isfile(os.path.join(directory, entry))
+    )
+
+
+def _format_summary(results: list[FileResult], wall_s: float, jobs: int) -> str:
+    width = max([len(os.path.basename(r.path)) for r in results] + [4])
+    lines = [f"{'file':<{width}}  {'audio':>7}  {'time':>7}  {'x rt':>6}  {'taps':>4}  {'peaks':>5}  result"]
+    for r in results:
+        ratio = f"{r.audio_s / r.elapsed_s:6.1f}" if r.elapsed_s > 0 and r.audio_s > 0 else "     -"
+        status = os.path.basename(r.output_path) if r.ok and r.output_path else f"FAILED: {r.error}"
+        lines.append(
+            f"{os.path.basename(r.path):<{width}}  {r.audio_s:6.2f}s  {r.elapsed_s:6.2f}s  "
+            f"{ratio}  {r.taps:>4}  {r.peaks:>5}  {status}"
+        )
+    cpu_s = sum(r.elapsed_s for r in results)
+    failed = sum(1 for r in results if not r.ok)
+    lines.append(
+        f"{len(results)} file(s), {failed} failed — wall {wall_s:.2f}s, "
+        f"sum of per-file {cpu_s:.2f}s, {jobs} job(s), "
+        f"parallel speedup {cpu_s / wall_s if wall_s > 0 else 0.0:.1f}x"
+    )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m guitar_tap analyze",
+        description="Analyze a directory of tap recordings into .guitartap files (no window).",
+    )
+    parser.add_argument("directory", help="directory containing the recordings")
+    parser.add_argument("--type", dest="measurement_type", choices=sorted(_TYPE_CHOICES),
+                        default="guitar", help="measurement type (default: guitar)")
+    parser.add_argument("--taps", type=int, default=1,
+                        help="number of taps per measurement (default: 1)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: number of CPUs)")
+    parser.add_argument("--out", dest="output_dir", default=None,
+                        help="where to write the .guitartap files (default: the input directory)")
+    parser.add_argument("--calibration", default=None,
+                        help="microphone calibration file (.txt/.cal) applied to every file")
+    parser.add_argument("--threshold", type=float, default=None,
+                        help="tap detection threshold in dB (default: the saved setting)")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for ``python -m guitar_tap analyze``.  Returns the exit status."""
+    args = build_parser().parse_args(argv)
+    if not os.path.isdir(args.directory):
+        print(f"error: not a directory: {args.directory}", file=sys.stderr)
+        return 2
+    if args.taps < 1 or args.jobs < 1:
+        print("error: --taps and --jobs must be at least 1", file=sys.stderr)
+        return 2
+
+    paths = find_recordings(args.directory)
+    if not paths:
+        print(f"No recordings found in {args.directory}", file=sys.stderr)
+        return 1
+    output_dir = args.output_dir or args.directory
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = min(args.jobs, len(paths))
+    mt_value = _TYPE_CHOICES[args.measurement_type]
+
+    t0 = time.perf_counter()
+    results: list[FileResult] = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+        futures = [
+            pool.submit(analyze_file, path, mt_value, args.taps, output_dir,
+                        args.calibration, args.threshold)
+            for path in paths
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            mark = "ok" if result.ok else "FAILED"
+            print(f"[{len(results)}/{len(paths)}] {os.path.basename(result.path)}: "
+                  f"{mark} ({result.elapsed_s:.2f}s)", flush=True)
+    wall_s = time.perf_counter() - t0
+
+    results.sort(key=lambda r: r.path)
+    print(_format_summary(results, wall_s, jobs))
+    return 0 if all(r.ok for r in results) else 1
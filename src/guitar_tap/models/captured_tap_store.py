@@ -0,0 +1,146 @@
+"""
+Compact storage for the multi-tap capture buffer (``TapToneAnalyzer.captured_taps``).
+
+Python-only.  Swift keeps ``capturedTaps`` / ``materialCapturedTaps`` as arrays
+of ``(magnitudes: [Float], frequencies: [Float], captureTime: Date)`` tuples.
+The Python port copied that literally as tuples of two Python float lists, so a
+65536-point guitar tap cost ~2 MB (two 32769-element lists of boxed floats),
+and the frequency list was the same for every tap.
+
+``CapturedTapStore`` holds:
+
+* ``magnitudes`` — one preallocated ``(n_taps, n_bins)`` float32 matrix (the
+  same precision as Swift ``[Float]``), grown by doubling;
+* ``frequencies`` — one shared frequency axis (the first tap's);
+* ``capture_times`` — a ``datetime64[us]`` timestamp vector;
+* ``power`` — the running ``PowerSpectrumAccumulator`` that ``average_spectra``
+  reduces to one vectorised log.
+
+It still reads like the old list of 3-tuples (``len``, iteration, indexing,
+``append``, ``clear``), yielding ``(row_view, frequencies, datetime)``, so the
+Swift-parity call sites are unchanged.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+import numpy.typing as npt
+
+from guitar_tap.utilities.power_spectrum_accumulator import PowerSpectrumAccumulator
+
+
+class CapturedTapStore:
+    """Captured tap spectra of one phase / tap sequence, as a 2-D float32 array."""
+
+    def __init__(self, capacity: int = 8) -> None:
+        self._capacity: int = max(int(capacity), 1)
+        self._mags: npt.NDArray[np.float32] | None = None
+        self._times: npt.NDArray[np.datetime64] = np.empty(self._capacity, dtype="datetime64[us]")
+        self._freqs: npt.NDArray[np.float64] | None = None
+        self._count: int = 0
+        self.power = PowerSpectrumAccumulator(track_variance=True)
+
+    @classmethod
+    def from_taps(cls, taps: Iterable[tuple]) -> "CapturedTapStore":
+        """Build a store from ``(magnitudes, frequencies, captureTime)`` tuples."""
+        taps = list(taps)
+        store = cls(capacity=max(len(taps), 1))
+        for tap in taps:
+            store.append(tap)
+        return store
+
+    # MARK: - Mutation
+
+    def add(self, magnitudes: npt.ArrayLike, frequencies: npt.ArrayLike,
+            capture_time: _dt.datetime | None = None) -> bool:
+        """Append one tap spectrum.  Returns False (and stores nothing) if its
+        bin count differs from the taps already stored."""
+        mags = np.asarray(magnitudes, dtype=np.float32).reshape(-1)
+        if self._mags is None or (self._count == 0 and mags.size != self._mags.shape[1]):
+            self._mags = np.empty((self._capacity, mags.size), dtype=np.float32)
+        elif mags.size != self._mags.shape[1]:
+            return False
+        if self._freqs is None:
+            self._freqs = np.array(frequencies, dtype=np.float64).reshape(-1)
+        if self._count == self._capacity:
+            self._grow()
+        self._mags[self._count] = mags
+        self._times[self._count] = np.datetime64(capture_time or _dt.datetime.now(), "us")
+        self._count += 1
+        self.power.add(self._mags[self._count - 1])
+        return True
+
+    def append(self, tap: tuple) -> None:
+        """list.append compatibility: *tap* is ``(magnitudes, frequencies, captureTime)``."""
+        magnitudes, frequencies, capture_time = tap
+        self.add(magnitudes, frequencies,
+                 capture_time if isinstance(capture_time, _dt.datetime) else None)
+
+    def clear(self) -> None:
+        """Drop every tap; the allocated matrix is kept for the next sequence."""
+        self._count = 0
+        self._freqs = None
+        self.power.reset()
+
+    def _grow(self) -> None:
+        assert self._mags is not None
+        self._capacity *= 2
+        mags = np.empty((self._capacity, self._mags.shape[1]), dtype=np.float32)
+        mags[:self._count] = self._mags[:self._count]
+        times = np.empty(self._capacity, dtype="datetime64[us]")
+        times[:self._count] = self._times[:self._count]
+        self._mags, self._times = mags, times
+
+    # MARK: - Views
+
+    @property
+    def n_bins(self) -> int:
+        return 0 if self._mags is None else int(self._mags.shape[1])
+
+    @property
+    def magnitudes(self) -> npt.NDArray[np.float32]:
+        """``(n_taps, n_bins)`` view of the stored dB spectra (aliases the store)."""
+        if self._mags is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self._mags[:self._count]
+
+    @property
+    def frequencies(self) -> npt.NDArray[np.float64]:
+        """The shared frequency axis (the first tap's)."""
+        return self._freqs if self._freqs is not None else np.zeros(0, dtype=np.float64)
+
+    @property
+    def capture_times(self) -> list[_dt.datetime]:
+        return self._times[:self._count].astype(object).tolist()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the magnitude matrix, axis and timestamps."""
+        total = self._times.nbytes
+        if self._mags is not None:
+            total += self._mags.nbytes
+        if self._freqs is not None:
+            total += self._freqs.nbytes
+        return total
+
+    # MARK: - Sequence protocol (list-of-tuples compatibility)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __getitem__(self, index: int) -> tuple:
+        if not -self._count <= index < self._count:
+            raise IndexError("captured tap index out of range")
+        index %= self._count
+        assert self._mags is not None
+        return (self._mags[index], self.frequencies, self._times[index].item())
+
+    def __iter__(self) -> Iterator[tuple]:
+        for i in range(self._count):
+            yield self[i]
@@ -90,6 +90,7 @@ import sounddevice as sd
 from PySide6 import QtCore
 
 from guitar_tap.utilities.logging import gt_log
+from guitar_tap.utilities.sample_ring_buffer import SampleRingBuffer
 from .realtime_fft_analyzer_device_management import RealtimeFFTAnalyzerDeviceManagementMixin
 from .realtime_fft_analyzer_engine_control import RealtimeFFTAnalyzerEngineControlMixin
 
@@ -99,7 +100,9 @@ from .realtime_fft_analyzer_engine_control import RealtimeFFTAnalyzerEngineContr
 #   f_a.dft_anal(...)
 # continues to work unchanged.
 from .realtime_fft_analyzer_fft_processing import (
+    FftPlan,
     dft_anal,
+    fft_plan,
 )
 
 if platform.system() == "Darwin":
@@ -221,8 +224,7 @@ class _FftProcessingThread(QtCore.QThread):
         mic = self._mic_ref()
         if mic is None:
             return  # analyzer gone — nothing to reset.
-        mic._input_buffer = []
-        mic._input_buffer_len = 0
+        mic._input_buffer.clear()
         with mic._recent_peak_lock:
             mic._recent_peak_db = -100.0
             mic._recent_peak_time = 0.0
@@ -259,8 +261,10 @@ class RealtimeFFTAnalyzer(RealtimeFFTAnalyzerEngineControlMixin, RealtimeFFTAnal
     Python FFT configuration properties (mirrors Swift RealtimeFFTAnalyzer):
       fft_size    ↔  Swift fftSize      — FFT window size (power of 2)
       window_fcn  ↔  Swift window       — pre-computed window function array (length fft_size)
+      fft_plan    ↔  Swift fftSetup     — cached FftPlan (normalised window + scratch buffers)
       m_t         ↔  (same as fft_size) — ring-buffer length; equals fft_size, matching Swift
       h_fft_size  —  Python-only fft_size // 2 convenience field
+      hop_size    —  Python-only STFT hop (samples between frames); defaults to fft_size
 
     Swift-only properties (no Python equivalent):
       audioEngine, inputNode, audioProcessingQueue, bufferAccessQueue
@@ -420,6 +424,23 @@ class RealtimeFFTAnalyzer(RealtimeFFTAnalyzerEngineControlMixin, RealtimeFFTAnal
         # numpy.ones is identical to scipy.signal.get_window("boxcar", N).
         self.window_fcn = np.ones(fft_size)
 
+        # Cached FFT plan for window_fcn at fft_size — normalised window,
+        # rotation split and scratch buffers built once and shared by every
+        # live frame (perform_fft) and the guitar gated capture.
+        # Mirrors Swift fftSetup (vDSP_DFT_zrop_CreateSetup), created once in init.
+        self.fft_plan: FftPlan = fft_plan(fft_size, "rectangular")
+
+        # STFT hop size in samples — how many NEW samples must arrive before the
+        # next fft_size-point frame is computed.  The default (== fft_size) is the
+        # original non-overlapping behaviour, matching Swift's inputBuffer which
+        # drains exactly fftSize samples per FFT (≈0.73 frames/s at 48 kHz).
+        # A smaller hop (e.g. 4096 or 8192) slides the same 65 536-point window
+        # forward by that many samples per frame, giving a faster display update
+        # with unchanged frequency resolution.  Set via set_hop_size(); start()
+        # applies the persisted AppSettings.fft_hop_size().
+        # Python-only: Swift has no overlapping-frame mode.
+        self.hop_size: int = fft_size
+
         # Python-only: audio chunk delivery via Queue
         # Swift delivers audio via rawSampleHandler callback + inputBuffer accumulation
         self._stop_lock: threading.Lock = threading.Lock()
@@ -467,6 +488,18 @@ class RealtimeFFTAnalyzer(RealtimeFFTAnalyzerEngineControlMixin, RealtimeFFTAnal
         # capture's pre-roll seed.  Mirrors Swift postEngineStopHandler.
         self._on_post_engine_stop: Callable[[], None] | None = None
 
+        # Python-only: accelerated (offline) file playback.  True while
+        # process_file_data runs with realtime=False — chunks are pumped
+        # back-to-back with no sleep, and time-based callbacks are driven by
+        # the audio clock instead of the wall clock.
+        self.is_offline_playback: bool = False
+
+        # Python-only: (audio_time, end_of_stream) callback invoked after every
+        # chunk during offline playback, and once more with end_of_stream=True
+        # after the pre-mic-restart flush.  Set by TapToneAnalyzer to advance
+        # its virtual timer queue.
+        self.virtual_clock_handler: "Callable[[float, bool], None] | None" = None
+
         # MARK: - Device Lists (mirrors Swift RealtimeFFTAnalyzer @Published properties)
 
         # Live list of available input devices.
@@ -508,9 +541,11 @@ class RealtimeFFTAnalyzer(RealtimeFFTAnalyzerEngineControlMixin, RealtimeFFTAnal
         # Moved here so process_raw_samples can access them directly.
         # Mirrors Swift processRawSamples state on RealtimeFFTAnalyzer.
 
-        # Input buffer — growing accumulator for FFT.
-        self._input_buffer: list[npt.NDArray[np.float32]] = []
-        self._input_buffer_len: int = 0
+        # Input buffer — preallocated float32 FIFO accumulating samples for the FFT.
+        # Mirrors Swift inputBuffer.  Capacity covers one full frame plus up to
+        # fft_size of pending audio, so steady-state frame assembly is a
+        # zero-copy view (see SampleRingBuffer) with no per-frame allocation.
+        self._input_buffer: SampleRingBuffer = SampleRingBuffer(2 * fft_size)
 
         # Thread-safe settings (calibration).
         self._settings_lock = threading.Lock()
@@ -636,6 +671,35 @@ class RealtimeFFTAnalyzer(RealtimeFFTAnalyzerEngineControlMixin, RealtimeFFTAnal
             except Exception:
                 pass
 
+    # MARK: - STFT hop size (Python-only)
+
+    def set_hop_size(self, hop_size: int) -> None:
+        """Set the number of new samples between consecutive FFT frames.
+
+        ``hop_size == fft_size`` (the default) reproduces Swift's
+        non-overlapping frames.  A smaller hop turns the live path into an
+        overlapping STFT: once the first ``fft_size`` samples have arrived,
+        every further ``hop_size`` samples produce a fresh frame over the most
+        recent ``fft_size`` samples.
+
+        Safe to call while audio is running — the new hop takes effect at the
+        next frame boundary.
+
+        Python-only: Swift has no overlapping-frame mode.
+
+        Args:
+            hop_size: Samples per hop, in ``[1, fft_size]``.
+
+        Raises:
+            ValueError: If ``hop_size`` is outside ``[1, fft_size]``.
+        """
+        hop_size = int(hop_size)
+        if not 1 <= hop_size <= self.fft_size:
+            raise ValueError(
+                f"hop_size must be in [1, {self.fft_size}], got {hop_size}"
+            )
+        self.hop_size = hop_size
+
     # MARK: - process_raw_samples (mirrors Swift processRawSamples)
 
     def process_raw_samples(self, chunk: npt.NDArray) -> None:
@@ -655,6 +719,7 @@ class RealtimeFFTAnalyzer(RealtimeFFTAnalyzerEngineControlMixin, RealtimeFFTAnal
         6. Clipping detection → clippingChanged Qt signal
         7. Recent peak history update
         8. Input buffer accumulation → FFT → fft_frame_handler callback + fftFrameReady Qt signal
+           (one frame per ``hop_size`` new samples once ``fft_size`` are buffered)
         """
         from .realtime_fft_analyzer_fft_processing import perform_fft as _perform_fft
 
@@ -761,7 +826,6 @@ class RealtimeFFTAnalyzer(RealtimeFFTAnalyzerEngineControlMixin, RealtimeFFTAnal
         # Accumulate samples — mirrors Swift bufferAccessQueue.sync { inputBuffer.append }.
         # In Swift this comes after the level-crossing and rmsLevelHandler blocks.
         self._input_buffer.append(chunk_f32)
-        self._input_buffer_len += len(chunk_f32)
 
         # ── Input-clipping detection ─────────────────────────────
         peak_abs = float(np.max(np.abs(chunk.astype(np.float64))))
@@ -786,14 +850,19 @@ class RealtimeFFTAnalyzer(RealtimeFFTAnalyzerEngineControlMixin, RealtimeFFTAnal
                 self._recent_peak_db = level_db
                 self._recent_peak_time = enter_now
 
-        # Fire an FFT for each complete fft_size-sample chunk available.
+        # Fire an FFT for each complete fft_size-sample frame available.
+        # After each frame only the oldest hop_size samples are dropped, so with
+        # hop_size < fft_size consecutive frames overlap by fft_size - hop_size
+        # samples (sliding-window STFT).  hop_size == fft_size drains the whole
+        # frame, matching Swift's non-overlapping inputBuffer.
         fft_size = self.fft_size
-        while self._input_buffer_len >= fft_size:
-            flat = np.concatenate(self._input_buffer)
-            samples = flat[:fft_size]
-            remainder = flat[fft_size:]
-            self._input_buffer = [remainder] if len(remainder) else []
-            self._input_buffer_len = len(remainder)
+        hop_size = self.hop_size
+        #
+        # ``samples`` is a view into the ring buffer; perform_fft consumes it
+        # before the next append can overwrite those slots.
+        input_buffer = self._input_buffer
+        while len(input_buffer) >= fft_size:
+            samples = input_buffer.oldest(fft_size)
 
             sample_dt = enter_now - self._last_fft_time
             self._last_fft_time = enter_now
@@ -801,6 +870,7 @@ class RealtimeFFTAnalyzer(RealtimeFFTAnalyzerEngineControlMixin, RealtimeFFTAnal
             # FFT + post-processing — perform_fft now reads calibration
             # from self (the analyzer) instead of the thread.
             mag_y_db, mag_y, fft_peak_amp = _perform_fft(self, samples, fft_size)
+            input_buffer.discard(hop_size)
 
             exit_now = time.time()
             processing_dt = exit_now - enter_now
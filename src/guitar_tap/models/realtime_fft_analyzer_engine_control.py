@@ -268,6 +268,12 @@ class RealtimeFFTAnalyzerEngineControlMixin:
         microphone permission; Python starts the PortAudio InputStream directly.
         """
         gt_log("🎤 === Starting Audio Engine ===")
+        # Python-only: apply the persisted live-FFT hop (Settings → Analysis).
+        try:
+            from views.utilities.tap_settings_view import AppSettings as _AS
+            self.set_hop_size(min(_AS.fft_hop_size(), self.fft_size))
+        except Exception:
+            pass
         self.stream.start()
         gt_log("🎤 Audio engine started")
         gt_log(f"🎤 Hardware sample rate: {self.rate} Hz, hardware channels: 1 (tap will use mono)")
@@ -327,6 +333,7 @@ class RealtimeFFTAnalyzerEngineControlMixin:
         samples: "npt.NDArray[np.float32]",
         sample_rate: int,
         file_name: str,
+        realtime: bool = True,
     ) -> None:
         """Process pre-read mono audio through the FFT pipeline.
 
@@ -337,10 +344,22 @@ class RealtimeFFTAnalyzerEngineControlMixin:
 
         Mirrors Swift ``RealtimeFFTAnalyzer.processFileData(samples:sampleRate:fileName:)``.
 
+        Python-only ``realtime=False`` (offline / accelerated mode): chunks
+        are pumped back-to-back with no sleep and no event-loop pumping.
+        Instead ``virtual_clock_handler(audio_elapsed, False)`` is called
+        after every chunk so the consumer can fire its time-based callbacks
+        (cooldowns, capture windows, safety timeouts) on the audio clock, and
+        ``virtual_clock_handler(audio_elapsed, True)`` is called once after
+        the pre-mic-restart flush so it can drain whatever is still pending.
+        Because every delay is then measured in audio time, the results are
+        the same as real-time playback, independent of CPU load.
+
         Args:
             samples:     Mono float32 PCM array.
             sample_rate: Sample rate in Hz.
             file_name:   Display name for logging.
+            realtime:    Pace chunks at the audio rate (default).  False runs
+                         the file as fast as the pipeline allows.
         """
         from utilities.logging import TAP_DEBUG as _td
         from .realtime_fft_analyzer_fft_processing import perform_fft as _perform_fft
@@ -350,18 +369,25 @@ class RealtimeFFTAnalyzerEngineControlMixin:
         self.is_playing_file = True
         self.playing_file_name = file_name
         self.is_stopped = False
+        self.is_offline_playback = not realtime
+        clock_handler = self.virtual_clock_handler if not realtime else None
 
         chunksize = self.chunksize
         fft_size = self.fft_size
+        hop_size = self.hop_size
         chunk_duration = chunksize / sample_rate
         expected_duration_s = n_samples / float(sample_rate)
+        expected_fft_frames = (
+            (n_samples - fft_size) // hop_size + 1 if n_samples >= fft_size else 0
+        )
 
         _td("file_playback",
             f"START | path={file_name} "
             f"samples={n_samples} rate={int(sample_rate)}Hz "
             f"chunksize={chunksize} chunkDuration={chunk_duration*1000:.1f}ms "
             f"expectedDuration={expected_duration_s:.3f}s "
-            f"fftSize={fft_size} expectedFftFrames={n_samples // fft_size}"
+            f"fftSize={fft_size} hopSize={hop_size} expectedFftFrames={expected_fft_frames} "
+            f"realtime={realtime}"
         )
         t0 = time.time()
         idx = 0
@@ -380,6 +406,12 @@ class RealtimeFFTAnalyzerEngineControlMixin:
             self.process_raw_samples(chunk)
             idx += chunksize
             chunks_pumped += 1
+            if not realtime:
+                # Offline: no pacing — advance the consumer's virtual clock
+                # to this chunk's audio time instead.
+                if clock_handler is not None:
+                    clock_handler(self.audio_elapsed, False)
+                continue
             # Sleep + pump the Qt event loop so QTimer.singleShot callbacks
             # fire between chunks.  Mirrors Swift processFileData which uses
             # Thread.sleep (blocking the background thread) while the main
@@ -400,18 +432,15 @@ class RealtimeFFTAnalyzerEngineControlMixin:
 
         # Force-flush any partial audio still in the input buffer.
         # Mirrors Swift processFileData partial flush.
-        if self._input_buffer:
-            partial = np.concatenate(self._input_buffer)
-        else:
-            partial = np.zeros(0, dtype=np.float32)
+        # oldest() is a zero-copy view into the ring buffer; the zero-pad
+        # below copies, and perform_fft only reads it.
+        partial = self._input_buffer.oldest(fft_size)
         _td("file_playback", f"PARTIAL_FLUSH | partialSamples={len(partial)} fftSize={fft_size}")
         if len(partial) > 0:
             if len(partial) < fft_size:
                 partial = np.concatenate(
                     [partial, np.zeros(fft_size - len(partial), dtype=np.float32)]
                 )
-            else:
-                partial = partial[:fft_size]
             # Emit the final FFT frame via perform_fft ONLY — do NOT call
             # process_raw_samples.  Mirrors Swift processFileData which calls
             # performFFT(on: partial), NOT processRawSamples.  This is critical
@@ -432,8 +461,7 @@ class RealtimeFFTAnalyzerEngineControlMixin:
             )
             _td("file_playback", "PARTIAL_FLUSH_DONE")
         # Clear the input buffer so the caller starts from a clean slate.
-        self._input_buffer = []
-        self._input_buffer_len = 0
+        self._input_buffer.clear()
 
         # Flush any active gated capture by zero-padding the remaining
         # window.  Must happen BEFORE the mic restarts.
@@ -444,6 +472,12 @@ class RealtimeFFTAnalyzerEngineControlMixin:
             pre_restart()
         _td("file_playback", "PRE_MIC_RESTART_DONE")
 
+        # Offline: let the consumer drain the timers still pending at end of
+        # stream (e.g. the capture-window finish scheduled by the flush above).
+        if clock_handler is not None:
+            clock_handler(self.audio_elapsed, True)
+        self.is_offline_playback = False
+
     # @parity dsp/wav
     def start_from_file(self, path: str) -> None:
         """Feed a WAV (or other audio) file through the same queue as the microphone.
@@ -530,8 +564,7 @@ class RealtimeFFTAnalyzerEngineControlMixin:
             # 4. Clear the FFT accumulator and reset frame counters.
             #    Mirrors Swift: bufferAccessQueue.sync { inputBuffer.removeAll() }
             #    and fftFrameCounter = 0; samplesConsumed = 0.
-            self._input_buffer = []
-            self._input_buffer_len = 0
+            self._input_buffer.clear()
             self._fft_frame_counter = 0
             self._samples_consumed = 0
             self._diag_total_samples = 0  # DIAG: reset sample counter for file playback
@@ -19,6 +19,8 @@ Python ↔ Swift correspondence:
   peak_q_factor   ↔  findPeaks — −3 dB bandwidth Q calculation
   hps_peak_freq   ↔  HPS dominant-peak selection inside computeGatedFFT
   is_power2       ↔  (utility; implicit in Swift vDSP_DFT_zrop_CreateSetup)
+  FftPlan         ↔  fftSetup (vDSP_DFT_zrop_CreateSetup) — built once, reused per frame
+  fft_plan        ↔  (cache of FftPlan keyed by FFT size + window kind)
 
 Python-only functions (no direct Swift equivalent):
   is_power2       — explicit check; Swift lets vDSP validate the size at setup time
@@ -39,7 +41,7 @@ and call `f_a.dft_anal(...)` continue to work unchanged.
 
 NOTE — Python vs Swift implementation differences:
   Swift uses vDSP_DFT_zrop (Accelerate framework) via deinterleaved split-complex format;
-  Python uses numpy.fft.fft on a zero-phase-shifted buffer (fftbuffer rotation trick).
+  Python uses numpy.fft.rfft on a zero-phase-shifted buffer (fftbuffer rotation trick).
   Both implementations apply the same window choice and the same window size (fft_size /
   fftSize), so neither implementation uses zero-padding in the continuous path:
     - Rectangular (all ones) window of fftSize samples for the live display path
@@ -72,6 +74,118 @@ def is_power2(num: int) -> bool:
     return ((num & (num - 1)) == 0) and num > 0
 
 
+# MARK: - FFT Plan
+
+class FftPlan:
+    """Precomputed per-(FFT size, window) state for the one-sided magnitude FFT.
+
+    Python-only counterpart of Swift's ``fftSetup`` (vDSP_DFT_zrop_CreateSetup),
+    which RealtimeFFTAnalyzer creates once and reuses for every frame.  Holds:
+
+      - the window normalised by its sum (computed once, with the same builtin
+        ``sum`` dft_anal always used, so the normalised values are unchanged);
+      - the zero-phase rotation split points;
+      - a preallocated time-domain scratch buffer whose zero-padded middle is
+        never written, so it stays zero between frames;
+      - a preallocated complex output buffer for ``numpy.fft.rfft``.
+
+    ``rfft`` computes only bins 0 … N/2 — exactly the one-sided spectrum the
+    full complex ``fft`` was sliced down to — at roughly half the cost.
+
+    The returned spectra are freshly allocated on every call: they travel to
+    the main thread through the queued ``fftFrameReady`` signal, so they must
+    not alias the plan's scratch.  ``execute`` is serialised by a lock because
+    the live processing thread and the main-thread guitar gated capture share
+    the analyzer's plan.
+
+    Obtain shared instances with :func:`fft_plan`; construct directly for a
+    one-off window.
+    """
+
+    def __init__(self, n_freq_samples: int, window_function: Float64_1D) -> None:
+        """Build a plan for *window_function* analysed with an N-point FFT.
+
+        Raises:
+            ValueError: N is not a power of 2, or the window is longer than N.
+        """
+        import threading
+
+        if not is_power2(n_freq_samples):
+            raise ValueError("FFT size (N) is not a power of 2")
+        if window_function.size > n_freq_samples:
+            raise ValueError("Window size (M) is bigger than FFT size")
+
+        self.n_freq_samples: int = n_freq_samples
+        self.window_size: int = int(window_function.size)
+        self.window: Float64_1D = window_function / sum(window_function)
+        self._half_1: int = (self.window_size + 1) // 2
+        self._half_2: int = self.window_size // 2
+        self._fftbuffer: Float64_1D = np.zeros(n_freq_samples)
+        self._spectrum: npt.NDArray[np.complex128] = np.empty(
+            n_freq_samples // 2 + 1, dtype=np.complex128
+        )
+        self._lock = threading.Lock()
+
+    def execute(
+        self, chunk: npt.NDArray[np.float32]
+    ) -> tuple[Float64_1D, Float64_1D]:
+        """Return ``(magnitude_db, abs_fft)`` for *chunk* — see :func:`dft_anal`."""
+        h1, h2 = self._half_1, self._half_2
+        window = self.window
+        fftbuffer = self._fftbuffer
+        with self._lock:
+            # Zero-phase rotation: second half of the windowed chunk to the
+            # front, first half to the back.  The middle stays zero.
+            np.multiply(chunk[h2:], window[h2:], out=fftbuffer[:h1])
+            if h2:
+                np.multiply(chunk[:h2], window[:h2], out=fftbuffer[-h2:])
+            np.fft.rfft(fftbuffer, out=self._spectrum)
+            abs_fft = np.abs(self._spectrum)
+
+        # One-sided amplitude correction — see dft_anal.
+        abs_fft[1:-1] *= 2.0
+
+        eps = np.finfo(float).eps
+        abs_fft[abs_fft < eps] = eps  # guard against log(0)
+
+        magnitude = np.log10(abs_fft)
+        magnitude *= 20
+        return magnitude, abs_fft
+
+
+_FFT_PLANS: dict[tuple[int, str], FftPlan] = {}
+
+
+def fft_plan(n_freq_samples: int, window_kind: str = "rectangular") -> FftPlan:
+    """Return the shared :class:`FftPlan` for an N-point FFT with a named window.
+
+    Plans are built on first request and cached by ``(n_freq_samples,
+    window_kind)``.  The window spans the full FFT size (no zero-padding), as
+    in both the live display path and the guitar gated-capture path.
+
+    The plate/brace gated capture does not use a plan: compute_gated_fft
+    (realtime_fft_analyzer.py) Hann-windows the zero-padded capture and scales
+    by 1/N, whereas a plan zero-phase-rotates and normalises by the window sum.
+
+    Args:
+        n_freq_samples: FFT size N (power of 2).
+        window_kind:    ``"rectangular"`` (live display, guitar capture) — the
+                        only window any path caches.
+
+    Raises:
+        ValueError: Unknown ``window_kind`` or invalid N.
+    """
+    key = (n_freq_samples, window_kind)
+    plan = _FFT_PLANS.get(key)
+    if plan is None:
+        if window_kind == "rectangular":
+            window = np.ones(n_freq_samples)
+        else:
+            raise ValueError(f"Unknown window kind: {window_kind!r}")
+        plan = _FFT_PLANS.setdefault(key, FftPlan(n_freq_samples, window))
+    return plan
+
+
 # MARK: - FFT Analysis
 
 def dft_anal(
@@ -106,49 +220,23 @@ def dft_anal(
       calculations.  Mirrors Swift's identical choice documented in performFFT and
       computeGatedFFT.
     """
-    # numpy.fft.fft is numerically identical to scipy.fft.fft for power-of-2 sizes
-    # (both use pocketfft since NumPy 1.17) and avoids the ~8 s scipy cold-import
-    # cost on Windows.
-    from numpy.fft import fft
-    if not is_power2(n_freq_samples):
-        raise ValueError("FFT size (N) is not a power of 2")
-
-    if window_function.size > n_freq_samples:
-        raise ValueError("Window size (M) is bigger than FFT size")
-
-    half_n_freq_samples = (n_freq_samples // 2) + 1
-    half_time_samples_1 = (window_function.size + 1) // 2
-    half_time_samples_2 = window_function.size // 2
-
+    # The DSP itself lives in FftPlan.execute; a throwaway plan keeps this
+    # entry point stateless for arbitrary windows.  Hot paths (perform_fft,
+    # the guitar gated capture) use the cached plan from fft_plan() instead.
+    #
     # Zero-phase rotation into fftbuffer (equivalent to fftshift).
     # Swift achieves the same via deinterleaving into split-complex format
     # before calling vDSP_DFT_Execute.
-    fftbuffer = np.zeros(n_freq_samples)
-    window_function = window_function / sum(window_function)
-    windowed_chunk = chunk * window_function
-    fftbuffer[:half_time_samples_1] = windowed_chunk[half_time_samples_2:]
-    fftbuffer[-half_time_samples_2:] = windowed_chunk[:half_time_samples_2]
-
-    complex_fft = fft(fftbuffer)
-
-    # One-sided spectrum: bins 0 … N/2 inclusive.
-    abs_fft = abs(complex_fft[:half_n_freq_samples])
-
-    # Apply one-sided spectrum amplitude correction.
     #
-    # scipy/numpy fft() returns the full two-sided DFT.  When we take only
-    # the positive-frequency half (bins 0 … N/2) we discard the mirror
-    # image, so the interior bins each hold only half the total signal power.
-    # Multiplying by 2 restores the correct amplitude — matching the factor
-    # already present in Swift's vDSP_DFT_zrop output, which folds the
-    # two-sided spectrum into the one-sided form before returning.
-    # DC (bin 0) and Nyquist (bin N/2) have no mirror, so they are not doubled.
-    abs_fft[1:-1] *= 2.0
-
-    abs_fft[abs_fft < np.finfo(float).eps] = np.finfo(float).eps  # guard against log(0)
-
-    magnitude = 20 * np.log10(abs_fft)
-    return magnitude, abs_fft
+    # One-sided spectrum amplitude correction:
+    # numpy's full fft() returns the two-sided DFT; rfft() returns only the
+    # positive-frequency half (bins 0 … N/2), so the interior bins each hold
+    # only half the total signal power.  Multiplying by 2 restores the correct
+    # amplitude — matching the factor already present in Swift's vDSP_DFT_zrop
+    # output, which folds the two-sided spectrum into the one-sided form
+    # before returning.  DC (bin 0) and Nyquist (bin N/2) have no mirror, so
+    # they are not doubled.
+    return FftPlan(n_freq_samples, window_function).execute(chunk)
 
 
 # MARK: - perform_fft (mirrors Swift performFFT(on:) post-FFT block)
@@ -188,7 +276,11 @@ def perform_fft(analyzer, samples: "npt.NDArray[np.float32]", fft_size: int):
     with analyzer._settings_lock:
         calibration = analyzer._calibration
 
-    mag_y_db, mag_y = dft_anal(samples, analyzer.window_fcn, fft_size)
+    plan = analyzer.fft_plan
+    if plan.n_freq_samples == fft_size:
+        mag_y_db, mag_y = plan.execute(samples)
+    else:
+        mag_y_db, mag_y = dft_anal(samples, analyzer.window_fcn, fft_size)
     if calibration is not None:
         mag_y_db = mag_y_db + calibration
 
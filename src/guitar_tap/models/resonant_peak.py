@@ -17,7 +17,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
-from guitar_tap.utilities.json_float import f32
+from guitar_tap.utilities.json_float import f32, f32_list
 
 
 def _now_iso() -> str:
@@ -145,12 +145,34 @@ class ResonantPeak:
         # frequency/magnitude/quality/bandwidth are Swift `Float` -> quantise to
         # float32 so the JSON matches Swift exactly.  pitchCents/pitchFrequency
         # are Swift `Double` and are left at full float64 precision.
+        return self._encode(
+            f32(self.frequency), f32(self.magnitude), f32(self.quality), f32(self.bandwidth),
+            include_mode_label,
+        )
+
+    @staticmethod
+    def to_dicts(peaks: "list[ResonantPeak]", include_mode_label: bool = True) -> list[dict]:
+        """``[p.to_dict(include_mode_label) for p in peaks]``, quantised in bulk.
+
+        The float32 fields of every peak go through one ``f32_list`` call
+        instead of four ``f32`` calls per peak; the dicts are identical.
+
+        Python-only.
+        """
+        q = f32_list([v for p in peaks
+                      for v in (p.frequency, p.magnitude, p.quality, p.bandwidth)])
+        return [
+            p._encode(q[4 * i], q[4 * i + 1], q[4 * i + 2], q[4 * i + 3], include_mode_label)
+            for i, p in enumerate(peaks)
+        ]
+
+    def _encode(self, frequency, magnitude, quality, bandwidth, include_mode_label: bool) -> dict:
         d: dict = {
             "id": self.id,
-            "frequency": f32(self.frequency),
-            "magnitude": f32(self.magnitude),
-            "quality": f32(self.quality),
-            "bandwidth": f32(self.bandwidth),
+            "frequency": frequency,
+            "magnitude": magnitude,
+            "quality": quality,
+            "bandwidth": bandwidth,
             "timestamp": self.timestamp,
         }
         if self.pitch_note is not None:
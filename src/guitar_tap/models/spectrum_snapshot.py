@@ -24,10 +24,79 @@ sizes.
 
 from __future__ import annotations
 
+import base64
 from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+import numpy.typing as npt
 
 from guitar_tap.utilities.json_float import f32
 
+_SPECTRUM_FIELDS = ("frequencies", "magnitudes")
+
+# MARK: - Snapshot format versions (Python-only)
+#
+# 1 — the frequency axis is a ``frequenciesData`` float32 blob.  What Swift and
+#     the web app read; the default for everything written.
+# 2 — a uniform axis (every FFT snapshot) is written as
+#     ``"frequencyAxis": {"start": Hz, "spacing": Hz, "count": n}`` and the
+#     snapshot carries ``"formatVersion": 2``; non-uniform axes still use the blob.
+#     Halves each snapshot.  Opt-in (AppSettings.snapshot_format_version) until
+#     the other readers understand it.  Both forms are always read.
+SNAPSHOT_FORMAT_V1 = 1
+SNAPSHOT_FORMAT_PARAMETRIC_AXIS = 2
+
+
+def _decode_floats(data: str) -> npt.NDArray[np.float32]:
+    """Base64 little-endian float32 blob → read-only float32 view of the decoded bytes."""
+    raw = base64.b64decode(data)
+    return np.frombuffer(raw, dtype="<f4", count=len(raw) // 4)
+
+
+def _expand_axis(axis: dict) -> npt.NDArray[np.float32]:
+    """``frequencyAxis`` → the float32 bins it stands for."""
+    n = int(axis["count"])
+    return (float(axis["start"]) + np.arange(n, dtype=np.float64) * float(axis["spacing"])).astype(np.float32)
+
+
+def _parametric_axis(frequencies: npt.NDArray) -> dict | None:
+    """The ``frequencyAxis`` for *frequencies* if it expands back to exactly the same
+    float32 values (so version 2 is lossless), else None."""
+    target = np.asarray(frequencies, dtype=np.float32)
+    n = target.size
+    if n < 2:
+        return None
+    f64 = target.astype(np.float64)
+    start = float(f64[0])
+    for spacing in (float(f64[1] - f64[0]), float((f64[-1] - f64[0]) / (n - 1))):
+        axis = {"start": start, "spacing": spacing, "count": n}
+        if spacing > 0 and np.array_equal(_expand_axis(axis), target):
+            return axis
+    return None
+
+
+def _decode_frequencies(data: "str | dict") -> npt.NDArray[np.float32]:
+    return _expand_axis(data) if isinstance(data, dict) else _decode_floats(data)
+
+
+class _EncodedSpectrum:
+    """Deferred-spectrum loader holding a snapshot's encoded spectrum exactly as read (Python-only).
+
+    The frequency part is a ``frequenciesData`` blob or a ``frequencyAxis`` dict.
+    Decoding happens on the first read of the spectrum (SpectrumSnapshot.__getattr__
+    memoises the result); until then ``to_dict`` writes the data back verbatim.
+    """
+
+    __slots__ = ("frequencies_data", "magnitudes_data")
+
+    def __init__(self, frequencies_data: "str | dict", magnitudes_data: str) -> None:
+        self.frequencies_data = frequencies_data
+        self.magnitudes_data = magnitudes_data
+
+    def __call__(self) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.float32]]:
+        return _decode_frequencies(self.frequencies_data), _decode_floats(self.magnitudes_data)
+
 
 @dataclass
 class SpectrumSnapshot:
@@ -47,12 +116,17 @@ class SpectrumSnapshot:
       - ``to_dict()`` writes Base64 binary blobs (``frequenciesData`` / ``magnitudesData``),
         matching Swift's compact binary format exactly.  ``from_dict()`` decodes both
         the compact Base64 binary format and the legacy plain float-array format.
+      - Python-only format version 2 (opt-in) replaces a uniform ``frequenciesData``
+        with a parametric ``frequencyAxis``; see SNAPSHOT_FORMAT_PARAMETRIC_AXIS.
+      - Decoded spectra are stored as float32 ndarrays (``frequencies_array`` /
+        ``magnitudes_array``); the ``frequencies`` / ``magnitudes`` lists are built on demand.
     """
 
     # MARK: - Spectrum Data
 
     # FFT frequency bins, in Hz, from low to high.
     # Parallel array with magnitudes; index i gives the frequency of bin i.
+    # Decoded snapshots hold a float32 ndarray until first read (see frequencies_array).
     # Mirrors Swift SpectrumSnapshot.frequencies.
     frequencies: list[float]
 
@@ -177,41 +251,136 @@ class SpectrumSnapshot:
     # Mirrors Swift SpectrumSnapshot.braceMass.
     brace_mass: float | None = None
 
+    # MARK: - Spectrum array storage (Python-only)
+    #
+    # Decoded spectra are kept as the float32 ndarrays ``np.frombuffer`` returns
+    # (no per-bin Python floats); ``frequencies`` / ``magnitudes`` stay plain lists
+    # for existing consumers, built on first read.  Once built, the list is the
+    # source of truth (it may be mutated or reassigned) and the array is dropped.
+    # Numeric consumers read ``frequencies_array`` / ``magnitudes_array`` instead,
+    # which never build the list.
+
+    def __post_init__(self) -> None:
+        for name in _SPECTRUM_FIELDS:
+            value = self.__dict__[name]
+            if isinstance(value, np.ndarray):
+                self.__dict__[f"_{name}_array"] = value
+                del self.__dict__[name]
+
+    def defer_spectrum(self, load: "Callable[[], tuple[npt.ArrayLike, npt.ArrayLike]]") -> None:
+        """Drop ``frequencies`` / ``magnitudes`` until first read, then fill both from *load*.
+
+        Used by storage backends that keep spectra apart from the measurement
+        metadata (the SQLite library), so listing a library never decodes a
+        spectrum.  Every other attribute is unaffected; ``to_dict`` and anything
+        else that reads the spectrum triggers the load transparently.
+        """
+        for name in _SPECTRUM_FIELDS:
+            self.__dict__.pop(name, None)
+            self.__dict__.pop(f"_{name}_array", None)
+        self.__dict__["_load_spectrum"] = load
+
+    @property
+    def is_spectrum_deferred(self) -> bool:
+        return "_load_spectrum" in self.__dict__
+
+    @property
+    def frequencies_array(self) -> npt.NDArray:
+        """``frequencies`` as an ndarray — float32 for decoded snapshots, without building the list."""
+        return self._spectrum_array("frequencies")
+
+    @property
+    def magnitudes_array(self) -> npt.NDArray:
+        """``magnitudes`` as an ndarray — float32 for decoded snapshots, without building the list."""
+        return self._spectrum_array("magnitudes")
+
+    def _spectrum_array(self, name: str) -> npt.NDArray:
+        self._resolve_deferred_spectrum()
+        if name in self.__dict__:
+            return np.asarray(self.__dict__[name])
+        array = self.__dict__.get(f"_{name}_array")
+        # None only if another thread just built the list from it.
+        return array if array is not None else np.asarray(self.__dict__[name])
+
+    def _resolve_deferred_spectrum(self) -> None:
+        # Store first, drop the loader last: a concurrent reader either finds the
+        # loader (and decodes too — same result) or the stored spectrum, never neither.
+        load = self.__dict__.get("_load_spectrum")
+        if load is not None:
+            for name, value in zip(_SPECTRUM_FIELDS, load()):
+                key = f"_{name}_array" if isinstance(value, np.ndarray) else name
+                self.__dict__[key] = value
+            self.__dict__.pop("_load_spectrum", None)
+
+    def __getattr__(self, name: str):
+        # Only reached for attributes missing from the instance — i.e. the list
+        # view of an array-backed (or deferred) spectrum before its first read.
+        if name in _SPECTRUM_FIELDS:
+            self._resolve_deferred_spectrum()
+            array = self.__dict__.get(f"_{name}_array")
+            if array is not None:
+                self.__dict__[name] = array.tolist()
+                self.__dict__.pop(f"_{name}_array", None)
+            if name in self.__dict__:
+                return self.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
     # MARK: - Serialisation (Python-only)
 
     @staticmethod
-    def _floats_to_base64(floats: list[float]) -> str:
+    def _floats_to_base64(floats: npt.ArrayLike) -> str:
         """Pack floats as little-endian IEEE-754 float32 bytes and Base64-encode them.
 
+        A float32 array (a decoded snapshot) is written straight from its buffer.
         Mirrors Swift SpectrumSnapshot.floatsToBase64(_:).
         """
-        import base64
-        import struct
-        data = struct.pack(f"<{len(floats)}f", *floats)
+        data = np.asarray(floats, dtype="<f4").tobytes()
         return base64.b64encode(data).decode("ascii")
 
-    def to_dict(self) -> dict:
+    def to_dict(self, format_version: int = SNAPSHOT_FORMAT_V1) -> dict:
         """Encode this snapshot as a JSON-compatible dict using Swift field names.
 
         Writes ``frequenciesData`` and ``magnitudesData`` as Base64-encoded
         little-endian IEEE-754 float32 blobs, matching Swift's compact binary
         format exactly.  Swift decodes these via the new-format path; the legacy
         plain-array keys (``frequencies`` / ``magnitudes``) are not written.
+        With *format_version* ``SNAPSHOT_FORMAT_PARAMETRIC_AXIS`` a uniform
+        frequency axis is written as ``frequencyAxis`` instead (Python-only).
 
         Mirrors Swift SpectrumSnapshot.encode(to:).
         Python-only — Swift uses Codable with a custom encoder.
         """
         # minFreq/maxFreq/minDB/maxDB and all plate/brace/guitar-body dimensions
         # are Swift `Float` -> quantise to float32 so the JSON matches Swift.
-        d: dict = {
-            "frequenciesData": self._floats_to_base64(self.frequencies),
-            "magnitudesData":  self._floats_to_base64(self.magnitudes),
+        parametric = format_version >= SNAPSHOT_FORMAT_PARAMETRIC_AXIS
+        encoded = self.__dict__.get("_load_spectrum")
+        if isinstance(encoded, _EncodedSpectrum) and (
+                parametric or not isinstance(encoded.frequencies_data, dict)):
+            # Never decoded since loading — write the data back unchanged (a blob
+            # read from a version 1 file is re-checked for a uniform axis first).
+            frequencies_data, magnitudes_data = encoded.frequencies_data, encoded.magnitudes_data
+            if parametric and isinstance(frequencies_data, str):
+                frequencies_data = (_parametric_axis(_decode_floats(frequencies_data))
+                                    or frequencies_data)
+        else:
+            frequencies = self.frequencies_array
+            frequencies_data = (parametric and _parametric_axis(frequencies)
+                                or self._floats_to_base64(frequencies))
+            magnitudes_data = self._floats_to_base64(self.magnitudes_array)
+        d: dict = {}
+        if isinstance(frequencies_data, dict):
+            d["formatVersion"] = SNAPSHOT_FORMAT_PARAMETRIC_AXIS
+            d["frequencyAxis"] = frequencies_data
+        else:
+            d["frequenciesData"] = frequencies_data
+        d.update({
+            "magnitudesData":  magnitudes_data,
             "minFreq": f32(self.min_freq),
             "maxFreq": f32(self.max_freq),
             "minDB": f32(self.min_db),
             "maxDB": f32(self.max_db),
             "isLogarithmic": self.is_logarithmic,
-        }
+        })
         if self.show_unknown_modes is not None:
             d["showUnknownModes"] = self.show_unknown_modes
         if self.guitar_type is not None:
@@ -239,30 +408,27 @@ class SpectrumSnapshot:
 
         Accepts both the compact Base64 binary format (``frequenciesData`` /
         ``magnitudesData``) written by Swift, and the legacy plain float-array
-        format (``frequencies`` / ``magnitudes``) written by Python.
+        format (``frequencies`` / ``magnitudes``) written by Python, and a
+        version 2 ``frequencyAxis`` in place of ``frequenciesData``.
 
         Mirrors Swift SpectrumSnapshot custom Decodable.
 
         Python-only — Swift uses Codable.
         """
-        import base64
-        import struct
-
-        if "frequenciesData" in d:
-            raw = base64.b64decode(d["frequenciesData"])
-            n = len(raw) // 4
-            frequencies: list[float] = list(struct.unpack(f"<{n}f", raw))
-        else:
-            frequencies = d.get("frequencies", [])
-
-        if "magnitudesData" in d:
-            raw = base64.b64decode(d["magnitudesData"])
-            n = len(raw) // 4
-            magnitudes: list[float] = list(struct.unpack(f"<{n}f", raw))
+        # Binary blobs (and a version 2 frequencyAxis) are kept encoded until the
+        # spectrum is first read (library loads mostly need metadata only); legacy
+        # plain arrays are used as-is.
+        freq_key = "frequencyAxis" if "frequencyAxis" in d else "frequenciesData"
+        encoded = freq_key in d and "magnitudesData" in d
+        if encoded:
+            frequencies = magnitudes = []
         else:
-            magnitudes = d.get("magnitudes", [])
+            frequencies = (_decode_frequencies(d[freq_key]) if freq_key in d
+                           else d.get("frequencies", []))
+            magnitudes = (_decode_floats(d["magnitudesData"]) if "magnitudesData" in d
+                          else d.get("magnitudes", []))
 
-        return SpectrumSnapshot(
+        snap = SpectrumSnapshot(
             frequencies=frequencies,
             magnitudes=magnitudes,
             min_freq=d.get("minFreq", 75.0),
@@ -287,3 +453,6 @@ class SpectrumSnapshot:
             brace_thickness=d.get("braceThickness"),
             brace_mass=d.get("braceMass"),
         )
+        if encoded:
+            snap.defer_spectrum(_EncodedSpectrum(d[freq_key], d["magnitudesData"]))
+        return snap
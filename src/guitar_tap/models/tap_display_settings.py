@@ -20,6 +20,10 @@ Settings are grouped by function:
 
 Python-only: storage is delegated to AppSettings (tap_settings_view.py).
 Swift uses UserDefaults directly; Python uses QSettings via AppSettings.
+AppSettings serves reads from a write-through in-memory cache; the values
+read on every FFT frame (measurement_type, guitar_type, show_unknown_modes)
+are additionally memoised here and dropped whenever AppSettings announces a
+write on its change signal.
 
 SeeAlso: TapSettingsView, TapToneAnalyzer, SpectrumView
 """
@@ -28,6 +32,8 @@ SeeAlso: TapSettingsView, TapToneAnalyzer, SpectrumView
 
 from __future__ import annotations
 
+import threading
+
 from guitar_tap.models.annotation_visibility_mode import AnnotationVisibilityMode
 
 
@@ -145,6 +151,44 @@ class TapDisplaySettings:
     # Default brace mass in grams
     DEFAULT_BRACE_MASS: float = 8.0
 
+    # MARK: - Per-frame value cache (Python-only)
+
+    # Derived values of the settings read on every FFT frame, keyed by getter
+    # name.  Cleared by an AppSettings change listener, called synchronously on
+    # every write — including writes made through AppSettings directly by the
+    # views — whichever thread writes.
+    # A load() on the audio thread can straddle a write on the main thread, so
+    # every clear bumps _memo_generation and a value is only cached if no clear
+    # happened since its load() began.
+    _memo: "dict[str, object]" = {}
+    _memo_generation: int = 0
+    _memo_lock = threading.Lock()
+    _memo_connected: bool = False
+
+    @classmethod
+    def _memoized(cls, name: str, load):
+        try:
+            return cls._memo[name]
+        except KeyError:
+            pass
+        if not cls._memo_connected:
+            with cls._memo_lock:
+                if not cls._memo_connected:
+                    _app_settings().add_change_listener(cls._on_settings_changed)
+                    cls._memo_connected = True
+        generation = cls._memo_generation
+        value = load()
+        with cls._memo_lock:
+            if cls._memo_generation == generation:
+                cls._memo[name] = value
+        return value
+
+    @classmethod
+    def _on_settings_changed(cls, _key: str) -> None:
+        with cls._memo_lock:
+            cls._memo_generation += 1
+            cls._memo.clear()
+
     # MARK: - Measurement Type
 
     @classmethod
@@ -153,7 +197,7 @@ class TapDisplaySettings:
 
         Mirrors Swift TapDisplaySettings.measurementType.
         """
-        return _app_settings().measurement_type()
+        return cls._memoized("measurement_type", lambda: _app_settings().measurement_type())
 
     @classmethod
     def set_measurement_type(cls, mt: "MeasurementType") -> None:
@@ -171,6 +215,10 @@ class TapDisplaySettings:
         otherwise falls back to the stored guitarTypeKey for backward
         compatibility.  Always returns a GuitarType enum value.
         """
+        return cls._memoized("guitar_type", cls._load_guitar_type)
+
+    @classmethod
+    def _load_guitar_type(cls) -> "GuitarType":
         from .guitar_type import GuitarType
         # Check measurementType first — mirrors Swift's getter which reads
         # measurementType.guitarType before falling back to the stored key.
@@ -407,7 +455,7 @@ class TapDisplaySettings:
 
         Mirrors Swift TapDisplaySettings.showUnknownModes.
         """
-        return _app_settings().show_unknown_modes()
+        return cls._memoized("show_unknown_modes", lambda: _app_settings().show_unknown_modes())
 
     @classmethod
     def set_show_unknown_modes(cls, v: bool) -> None:
@@ -54,6 +54,7 @@ from guitar_tap.models.annotation_visibility_mode import AnnotationVisibilityMod
 # Lives in analysis_display_mode.py so the mixin files can import it without
 # creating a circular dependency (they are imported by this file).
 from .analysis_display_mode import AnalysisDisplayMode
+from .captured_tap_store import CapturedTapStore
 from .tap_tone_analyzer_analysis_helpers import TapToneAnalyzerAnalysisHelpersMixin
 from .tap_tone_analyzer_annotation_management import TapToneAnalyzerAnnotationManagementMixin
 
@@ -66,6 +67,7 @@ from .tap_tone_analyzer_peak_analysis import TapToneAnalyzerPeakAnalysisMixin
 from .tap_tone_analyzer_spectrum_capture import TapToneAnalyzerSpectrumCaptureMixin
 from .tap_tone_analyzer_tap_detection import TapToneAnalyzerTapDetectionHandlerMixin
 from guitar_tap.utilities.logging import gt_log
+from guitar_tap.utilities.session_recorder import SessionRecorder
 
 # ── TapToneAnalyzer ───────────────────────────────────────────────────────────
 # Mirrors the top-level Swift TapToneAnalyzer class declaration and its stored
@@ -388,7 +390,10 @@ class TapToneAnalyzer(
         #   materialCapturedTaps — plate/brace phases (magnitudes, frequencies, captureTime) tuples
         # Python clears this list at the start of each phase / tap sequence,
         # so the same list safely serves both roles.
-        self.captured_taps: list = []
+        # Python-only storage: a CapturedTapStore (one float32 n_taps × n_bins matrix,
+        # a shared frequency axis and the running power sum) that still reads like
+        # the list of (magnitudes, frequencies, captureTime) tuples.
+        self._captured_taps = CapturedTapStore()
 
         # ── Auto-scale ────────────────────────────────────────────────────
         self._auto_scale_db: bool = False
@@ -550,14 +555,19 @@ class TapToneAnalyzer(
         # _accumulate_gated_samples (called via mic.raw_sample_handler) owns
         # this state directly — matching Swift where
         # TapToneAnalyzer.accumulateGatedSamples(_:sampleRate:) owns the buffers.
+        #
+        # Python-only: the sample buffers are preallocated float32
+        # SampleRingBuffers rather than lists, so the audio thread appends and
+        # trims them in O(1) under _gated_lock without creating Python floats.
         import threading as _threading
+        from guitar_tap.utilities.sample_ring_buffer import SampleRingBuffer as _SRB
         self._pre_roll_seconds: float = 0.2         # 200 ms pre-roll (mirrors Swift preRollDuration)
-        self._pre_roll_buf: list = []               # raw PCM samples (float32)
+        self._pre_roll_buf = _SRB(1 << 14)          # raw PCM samples (float32), last _pre_roll_samples
         self._gated_lock = _threading.Lock()
         self._gated_capture_active: bool = False
         self._gated_capture_samples: int = 0        # target window size in samples (snapshot at capture-open)
         self._gated_capture_phase: object = None    # MaterialTapPhase at capture start
-        self._gated_accum: list = []                # accumulated raw PCM samples
+        self._gated_accum = _SRB(1 << 17)           # accumulated raw PCM samples (pre-roll + window)
         self._mpm_sample_rate: float = 48000.0      # mirrors Swift mpmSampleRate (updated per audio buffer)
 
         # ── Session recording ─────────────────────────────────────────────
@@ -568,7 +578,11 @@ class TapToneAnalyzer(
         # sessionRecordingSampleRate.
         #
         # Access is protected by _gated_lock (shared with the gated-capture state).
-        self._session_recording_buffer: list = []
+        # Python-only storage: the buffer is a SessionRecorder (bounded in-memory head, then
+        # streamed to a temporary float32 WAV in the dump folder after the first tap), created per
+        # tap sequence by start_tap_sequence — only when Dump Capture Audio is on; None otherwise —
+        # and finalized by rename in finish_session_recording.
+        self._session_recorder: SessionRecorder | None = None
         self._is_session_recording: bool = False
         self._session_checkpoints: list = []
         self._session_recording_sample_rate: float = 48000.0
@@ -603,7 +617,25 @@ class TapToneAnalyzer(
         # thread start_gated_capture can seed from the correct audio position.
         # Cleared by start_gated_capture after consumption.
         # Mirrors Swift pendingLevelCrossingPreRoll.
-        self._pending_level_crossing_pre_roll: list | None = None
+        # None when no snapshot is pending, else _pending_pre_roll_store (reused).
+        self._pending_level_crossing_pre_roll: "_SRB | None" = None
+        self._pending_pre_roll_store = _SRB(1 << 15)
+
+        # ── Offline playback virtual clock (Python-only) ──────────────────
+        # While the FFT analyzer runs a file with realtime=False,
+        # _main_async_after does not start wall-clock QTimers; it pushes
+        # (due_audio_time, seq, callback) onto this heap instead, and
+        # _advance_virtual_clock fires the entries as the audio clock passes
+        # them.  seq keeps equal-due callbacks in scheduling order (FIFO, as
+        # QTimer.singleShot does).  _virtual_now is the due time of the timer
+        # currently firing (None otherwise), so a callback that reschedules is
+        # timed from when it would have fired in real time.
+        self._virtual_timers: list = []
+        self._virtual_timer_seq: int = 0
+        self._virtual_now: float | None = None
+        # Generation token for the offline decay-tracking window — bumped on
+        # every arm/disarm so a superseded 3-s stop callback is a no-op.
+        self._decay_timer_generation: int = 0
 
         # ── Pipeline signal wiring ────────────────────────────────────────
         # Wire all signal/callback connections when the FFT analyzer is
@@ -631,10 +663,23 @@ class TapToneAnalyzer(
         UI file playback, test file playback) eliminates the divergent code
         paths that previously existed between live and test modes.
 
+        During offline file playback (``mic.is_offline_playback``) the
+        callback is queued on the virtual audio clock instead — see
+        ``_advance_virtual_clock``.
+
         Args:
             delay_ms: Delay in milliseconds before the callback fires.
             callback: Zero-argument callable to invoke on the main thread.
         """
+        if self._uses_virtual_clock():
+            import heapq
+            now = self._virtual_now if self._virtual_now is not None else self.mic.audio_elapsed
+            self._virtual_timer_seq += 1
+            heapq.heappush(
+                self._virtual_timers,
+                (now + delay_ms / 1000.0, self._virtual_timer_seq, callback),
+            )
+            return
         self._mainAsyncAfterRequest.emit(delay_ms, callback)
 
     @QtCore.Slot(int, object)
@@ -646,6 +691,56 @@ class TapToneAnalyzer(
         """
         QtCore.QTimer.singleShot(delay_ms, callback)
 
+    # ------------------------------------------------------------------ #
+    # Virtual audio clock — Python-only (offline file playback)
+    # ------------------------------------------------------------------ #
+
+    # Audio time past end-of-stream for which pending virtual timers are still
+    # drained — matches the 5-s completion deadline of play_file_for_testing.
+    _VIRTUAL_DRAIN_HORIZON_S: float = 5.0
+
+    def _uses_virtual_clock(self) -> bool:
+        """True while the FFT analyzer is running an offline (non-paced) file."""
+        return self.mic is not None and getattr(self.mic, "is_offline_playback", False)
+
+    def _advance_virtual_clock(self, audio_time: float, end_of_stream: bool = False) -> None:
+        """Fire every virtual timer due at or before *audio_time*, in due order.
+
+        Installed as ``mic.virtual_clock_handler`` and called by
+        ``process_file_data(realtime=False)`` after every chunk, on the thread
+        that runs the playback.  Timers scheduled from chunk processing are
+        timed from the chunk's audio time; timers scheduled from inside a
+        firing callback are timed from that callback's due time.
+
+        At end of stream the queue is drained up to
+        ``_VIRTUAL_DRAIN_HORIZON_S`` past the last sample, mirroring the
+        completion wait real-time playback performs after the last chunk;
+        anything scheduled later than that is discarded.
+
+        Args:
+            audio_time:    ``mic.audio_elapsed`` after the chunk just processed.
+            end_of_stream: True for the final call after the pre-mic-restart flush.
+        """
+        import heapq
+        from guitar_tap.utilities.logging import TAP_DEBUG
+
+        limit = audio_time + (self._VIRTUAL_DRAIN_HORIZON_S if end_of_stream else 0.0)
+        timers = self._virtual_timers
+        while timers and timers[0][0] <= limit:
+            due, _seq, callback = heapq.heappop(timers)
+            self._virtual_now = due
+            try:
+                callback()
+            finally:
+                self._virtual_now = None
+        if end_of_stream:
+            if timers:
+                TAP_DEBUG("file_playback",
+                    f"VIRTUAL_CLOCK_DISCARD | pending={len(timers)} "
+                    f"nextDue={timers[0][0]:.3f}s limit={limit:.3f}s"
+                )
+            timers.clear()
+
     # ------------------------------------------------------------------ #
     # for_testing — mirrors Swift TapToneAnalyzer.forTesting()
     # ------------------------------------------------------------------ #
@@ -687,6 +782,7 @@ class TapToneAnalyzer(
         number_of_taps: int = 1,
         calibration_path: str | None = None,
         plate_tap_phase=None,
+        realtime: bool = True,
     ) -> None:
         """Feed a WAV file through the full analysis pipeline for testing.
 
@@ -714,6 +810,9 @@ class TapToneAnalyzer(
                                CAPTURING_CROSS or CAPTURING_FLC) for
                                phase-targeted plate testing.  Passed through
                                to start_tap_sequence as initial_phase.
+            realtime:          Python-only.  False plays the file offline —
+                               no pacing, timers on the audio clock — see
+                               ``RealtimeFFTAnalyzer.process_file_data``.
         """
         import os as _os
 
@@ -777,15 +876,22 @@ class TapToneAnalyzer(
             app = QtWidgets.QApplication([])
             owns_app = True
 
-        self.mic.process_file_data(mono, int(file_rate), file_name)
+        self.mic.process_file_data(mono, int(file_rate), file_name, realtime=realtime)
 
         # Continue pumping the Qt event loop until the measurement completes.
         # _finish_capture (and thus process_multiple_taps) is scheduled via
         # QTimer.singleShot with a delay of capture_window (200 ms), so we
         # must keep processing events until it fires and sets
         # is_measurement_complete = True.
+        #
+        # Offline, those timers ran on the virtual clock, which
+        # process_file_data has already drained past the same 5-s horizon:
+        # deliver anything still queued and return without waiting, so a file
+        # whose measurement never completes costs no wall-clock time.
         import time as _time
-        _deadline = _time.monotonic() + 5.0
+        if not realtime:
+            app.processEvents()
+        _deadline = _time.monotonic() + (5.0 if realtime else 0.0)
         while not self.is_measurement_complete and _time.monotonic() < _deadline:
             app.processEvents()
             _time.sleep(0.01)
@@ -811,6 +917,7 @@ class TapToneAnalyzer(
         # Mirrors Swift's direct handler closures on RealtimeFFTAnalyzer.
         self.mic.rms_level_handler = self._on_rms_level_changed_direct
         self.mic.fft_frame_handler = self.on_fft_frame
+        self.mic.virtual_clock_handler = self._advance_virtual_clock
 
         # ── Gated-FFT capture signal (Qt — for cross-thread delivery) ────
         self.mic.proc_thread.gatedCaptureComplete.connect(self.finish_gated_fft_capture)
@@ -825,7 +932,7 @@ class TapToneAnalyzer(
         def _level_crossing_handler() -> None:
             from models.measurement_type import MeasurementType as _MT
             from models.tap_display_settings import TapDisplaySettings as _tds
-            from guitar_tap.utilities.logging import TAP_DEBUG
+            from guitar_tap.utilities.logging import TAP_DEBUG, tap_debug_enabled
             import math
             mt = _tds.measurement_type()
             with self._gated_lock:
@@ -855,19 +962,21 @@ class TapToneAnalyzer(
                             and self._pending_level_crossing_pre_roll is None
                             and not self._gated_capture_active
                             and self._last_level_crossing_capture_id == self._gated_capture_id):
-                        self._pending_level_crossing_pre_roll = list(self._pre_roll_buf)
-                        pre_roll_count = len(self._pre_roll_buf)
-                        deferred_profile = self.capture_window_profile(
-                            self._pre_roll_buf, label="DEFERRED_PREROLL"
-                        )
-                        TAP_DEBUG("levelCrossing",
-                            f"DEFERRED — snapshot pre-roll ({pre_roll_count} samples) "
-                            f"for main-thread start_gated_capture\n{deferred_profile}")
+                        store = self._pending_pre_roll_store
+                        store.replace(self._pre_roll_buf.view())
+                        self._pending_level_crossing_pre_roll = store
+                        if tap_debug_enabled():
+                            deferred_profile = self.capture_window_profile(
+                                store.view(), label="DEFERRED_PREROLL"
+                            )
+                            TAP_DEBUG("levelCrossing",
+                                f"DEFERRED — snapshot pre-roll ({len(store)} samples) "
+                                f"for main-thread start_gated_capture\n{deferred_profile}")
                         return
 
                 self._gated_capture_id += 1
                 self._last_level_crossing_capture_id = self._gated_capture_id
-                self._gated_accum = list(self._pre_roll_buf)
+                self._gated_accum.replace(self._pre_roll_buf.view())
                 if mt == _MT.PLATE or mt == _MT.BRACE:
                     # Plate/brace: use the current phase and 500 ms capture
                     # window (with a 400 ms FFT input extracted from it after
@@ -890,10 +999,12 @@ class TapToneAnalyzer(
                     self._gated_capture_samples = self.mic.fft_size
                 self._gated_capture_active = True
                 self._pending_level_crossing_pre_roll = None  # consumed by direct start
+                if not tap_debug_enabled():
+                    return
                 pre_roll_count = len(self._gated_accum)
                 target = self._gated_capture_samples
                 faststart_profile = self.capture_window_profile(
-                    self._gated_accum, label="FASTSTART_PREROLL"
+                    self._gated_accum.view(), label="FASTSTART_PREROLL"
                 )
             TAP_DEBUG("levelCrossing",
                 f"Gated capture started on audio queue | "
@@ -915,8 +1026,8 @@ class TapToneAnalyzer(
         # window then mixes mic noise into the FFT input.
         def _clear_pre_roll():
             with self._gated_lock:
-                self._pre_roll_buf = []
-                self._gated_accum = []
+                self._pre_roll_buf.clear()
+                self._gated_accum.clear()
                 self._gated_capture_active = False
                 self._gated_capture_phase = None
                 # Reset capture IDs so the deferred level-crossing guard
@@ -982,6 +1093,23 @@ class TapToneAnalyzer(
         if self.mic is not None:
             self.mic._level_crossing_threshold = self._tap_detection_threshold
 
+    # ── Multi-tap capture buffer ─────────────────────────────────────────────
+    @property
+    def captured_taps(self) -> CapturedTapStore:
+        """Captured tap spectra of the current phase / tap sequence.
+
+        Mirrors Swift `capturedTaps` / `materialCapturedTaps`.  Python-only storage:
+        see CapturedTapStore.  Assigning a list of (magnitudes, frequencies,
+        captureTime) tuples replaces the contents.
+        """
+        return self._captured_taps
+
+    @captured_taps.setter
+    def captured_taps(self, value) -> None:
+        self._captured_taps = (
+            value if isinstance(value, CapturedTapStore) else CapturedTapStore.from_taps(value)
+        )
+
     # ── Durable peak set + display projection (Phase 1) ──────────────────────
     @property
     def all_peaks(self) -> list:
@@ -1198,7 +1326,7 @@ class TapToneAnalyzer(
             gt_log(
                 f"🩹 Healed duplicate peaks in {healed_count} saved measurement(s) — forcing a save"
             )
-            self._persist_measurements()
+            self._persist_measurements(rewrite=True)
 
         # ── Auto-start tap sequence on first launch ────────────────────────
         # Mirrors Swift start() auto-start guard + requestStartTapSequence (§4b decision 1b): if Dump
@@ -10,6 +10,7 @@ from __future__ import annotations
 import time as _time
 
 from guitar_tap.utilities.logging import gt_log
+from guitar_tap.utilities.session_recorder import SessionRecorder
 
 
 class TapToneAnalyzerControlMixin:
@@ -618,10 +619,15 @@ class TapToneAnalyzerControlMixin:
         # first phase has a truncation anchor — without it, redoing the first
         # phase (or the same phase repeatedly) would leave the rejected tap's
         # audio in the saved WAV.  See accept_current_phase / redo_current_phase.
+        # The session WAV is only ever kept when Dump Capture Audio is on, so only then
+        # is there a recorder (otherwise nothing is streamed to disk).  Its temp file
+        # lives in the dump folder — reachable, as checked when the sequence was armed —
+        # so finish_session_recording moves it into place by rename.
+        session_dir = self._session_recording_folder()
         with self._gated_lock:
             self._gated_capture_active = False
-            self._gated_accum = []
-            self._pre_roll_buf = []
+            self._gated_accum.clear()
+            self._pre_roll_buf.clear()
             # Clear the audio-queue fast-start markers so the first tap of this
             # sequence cannot mistake a stale "already handled" equality
             # (_gated_capture_id == _last_level_crossing_capture_id) for a real
@@ -634,13 +640,19 @@ class TapToneAnalyzerControlMixin:
             # re_enable_detection_for_next_plate_tap.
             self._gated_capture_id = 0
             self._last_level_crossing_capture_id = -1
-            self._session_recording_buffer = []
             self._session_checkpoints = [0]
             self._is_session_recording = True
             self._session_pre_roll_active = True  # bound the pre-first-tap audio to ~2 s (§6)
             self._session_recording_sample_rate = (
                 self._mpm_sample_rate if self._mpm_sample_rate > 0 else 48000.0
             )
+            stale_recorder = self._session_recorder  # a cancelled sequence's unfinished session
+            self._session_recorder = (
+                SessionRecorder(self._session_recording_sample_rate, directory=session_dir)
+                if session_dir is not None else None
+            )
+        if stale_recorder is not None:
+            stale_recorder.discard()
 
         # Seed the noise-floor estimate so the first relative-threshold
         # calculation has a reasonable baseline.  Seed from the current input level; the warm-up's EMA
@@ -843,7 +855,7 @@ class TapToneAnalyzerControlMixin:
         # if a subsequent phase is redone, we can truncate back to here.
         # Mirrors Swift acceptCurrentPhase checkpoint append.
         with self._gated_lock:
-            self._session_checkpoints.append(len(self._session_recording_buffer))
+            self._session_checkpoints.append(len(self._session_recorder or ()))
 
         phase = self.material_tap_phase
 
@@ -901,8 +913,9 @@ class TapToneAnalyzerControlMixin:
         with self._gated_lock:
             if self._session_checkpoints:
                 phase_start = self._session_checkpoints[-1]
-                if len(self._session_recording_buffer) > phase_start:
-                    del self._session_recording_buffer[phase_start:]
+                recorder = self._session_recorder
+                if recorder is not None and len(recorder) > phase_start:
+                    recorder.truncate(phase_start)
                     # Redoing the FIRST phase empties the buffer back to the pre-first-tap state,
                     # so re-arm the bounded pre-roll (§6). Later phases keep the latch frozen.
                     if phase_start == 0:
@@ -1191,7 +1204,7 @@ class TapToneAnalyzerControlMixin:
         # Gated state now lives on self (TapToneAnalyzer), not on proc_thread.
         with self._gated_lock:
             self._gated_capture_active = False
-            self._gated_accum = []
+            self._gated_accum.clear()
 
     # ------------------------------------------------------------------ #
     # Plate / brace tap sequence entry points
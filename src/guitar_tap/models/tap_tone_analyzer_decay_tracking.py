@@ -99,7 +99,20 @@ class TapToneAnalyzerDecayTrackingMixin:
         Called via QMetaObject.invokeMethod from start_decay_tracking so the
         QTimer is always created on the main thread regardless of which
         thread detected the tap.
+
+        Python-only: during offline file playback the 3-s window runs on the
+        virtual audio clock (via ``_main_async_after``) instead of a QTimer.
         """
+        if self._uses_virtual_clock():
+            self._disarm_decay_tracking_timer()
+            generation = self._decay_timer_generation
+
+            def _window_elapsed() -> None:
+                if self._decay_timer_generation == generation:
+                    self.stop_decay_tracking()
+
+            self._main_async_after(3000, _window_elapsed)
+            return
         if self._decay_tracking_timer is not None:
             self._decay_tracking_timer.stop()
         self._decay_tracking_timer = QtCore.QTimer()
@@ -136,6 +149,7 @@ class TapToneAnalyzerDecayTrackingMixin:
     @Slot()
     def _disarm_decay_tracking_timer(self) -> None:
         """Main-thread slot: stop the timer and clear the reference."""
+        self._decay_timer_generation += 1
         if self._decay_tracking_timer is not None:
             self._decay_tracking_timer.stop()
             self._decay_tracking_timer = None
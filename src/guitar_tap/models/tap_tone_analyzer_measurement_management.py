@@ -8,6 +8,7 @@ Mirrors Swift TapToneAnalyzer+MeasurementManagement.swift.
 from __future__ import annotations
 
 import numpy as np
+from PySide6 import QtCore
 
 from guitar_tap.utilities.logging import gt_log
 
@@ -22,16 +23,40 @@ class TapToneAnalyzerMeasurementManagementMixin:
 
     # ── Persistence helper ────────────────────────────────────────────────────
 
-    def _persist_measurements(self) -> None:
-        """Write savedMeasurements to disk and emit savedMeasurementsChanged.
+    def _persist_measurements(self, rewrite: bool = False) -> None:
+        """Queue savedMeasurements for writing and emit savedMeasurementsChanged.
+
+        The write happens on the persistence thread
+        (views/measurement_persistence_worker.py), which coalesces bursts of
+        changes; only the change since the last write reaches disk (one
+        journaled measurement for an append, edit or delete).  ``rewrite=True``
+        forces the whole library out, e.g. after records were repaired in
+        memory on load.  A failed write is reported in the status bar.
 
         Python-only helper — Swift achieves the same effect via the
         @Published property observer + explicit save(context:) call.
         """
-        from views import tap_analysis_results_view as M
-        M.save_all_measurements(self.savedMeasurements)
+        from views.measurement_persistence_worker import persistence_worker
+        worker = persistence_worker()
+        if not getattr(self, "_persistence_connected", False) and isinstance(self, QtCore.QObject):
+            worker.persisted.connect(self._on_measurements_persisted)
+            self._persistence_connected = True
+        worker.submit(self.savedMeasurements, rewrite=rewrite)
         self.savedMeasurementsChanged.emit()
 
+    def _on_measurements_persisted(self, ok: bool, message: str) -> None:
+        """Persistence-thread result, delivered on the analyzer's thread (Python-only)."""
+        if not ok:
+            self._set_status_message(f"⚠ Saving measurements failed: {message}")
+
+    def flush_saved_measurements(self, timeout: float | None = None) -> bool:
+        """Block until every queued library write is on disk.  False on timeout.
+
+        Python-only — Swift's save(context:) is synchronous.
+        """
+        from views.measurement_persistence_worker import flush_pending_saves
+        return flush_pending_saves(timeout)
+
     # ── Mutation methods (mirror Swift TapToneAnalyzer+MeasurementManagement) ─
 
     def import_measurements(self, json_str: str) -> bool:
@@ -86,6 +111,19 @@ class TapToneAnalyzerMeasurementManagementMixin:
                 f"import_measurements_from_data: decode failed: {exc}"
             ) from exc
 
+        return self.add_imported_measurements(measurements)
+
+    def add_imported_measurements(self, measurements: list) -> list:
+        """Append already-decoded imported measurements, persist once, and check
+        their microphones against the connected devices.
+
+        The tail of ``import_measurements_from_data``, split out so the
+        background import pipeline (views/measurement_import.py) can decode a
+        large file off the GUI thread and merge the result with one library
+        write.  Returns *measurements*.
+
+        Python-only.
+        """
         self.savedMeasurements.extend(measurements)
         self._persist_measurements()
 
@@ -201,7 +239,7 @@ class TapToneAnalyzerMeasurementManagementMixin:
         """
         return list(self.all_peaks)
 
-    def save_measurement(
+    def build_measurement(
         self,
         measurement_name: "str | None" = None,
         notes: "str | None" = None,
@@ -219,10 +257,13 @@ class TapToneAnalyzerMeasurementManagementMixin:
         max_freq: "float | None" = None,
         min_db: "float | None" = None,
         max_db: "float | None" = None,
-    ) -> None:
-        """Assemble a new measurement from live analyzer state, then persist.
+    ) -> "TapToneMeasurement":
+        """Assemble a new measurement from live analyzer state without persisting it.
 
-        Mirrors Swift ``TapToneAnalyzer+MeasurementManagement.saveMeasurement(...)``:
+        Mirrors the assembly half of Swift
+        ``TapToneAnalyzer+MeasurementManagement.saveMeasurement(...)``.  Python-only
+        split so the headless ``analyze`` command can build measurements without
+        touching the saved library:
 
         - Reads ``currentPeaks``, ``currentDecayTime``, ``selectedPeakIDs``,
           ``peakAnnotationOffsets``, ``annotationVisibilityMode``, and
@@ -332,7 +373,7 @@ class TapToneAnalyzerMeasurementManagementMixin:
             else None
         )
 
-        measurement = TapToneMeasurement.create(
+        return TapToneMeasurement.create(
             peaks=peaks,
             decay_time=decay_time,
             measurement_name=measurement_name,
@@ -367,6 +408,50 @@ class TapToneAnalyzerMeasurementManagementMixin:
             sample_rate=sample_rate,
             tap_entries=tap_entries_to_save,
         )
+
+    def save_measurement(
+        self,
+        measurement_name: "str | None" = None,
+        notes: "str | None" = None,
+        include_spectrum: bool = True,
+        spectrum_snapshot=None,
+        annotation_offsets: "dict | None" = None,
+        selected_longitudinal_peak_id: "str | None" = None,
+        selected_cross_peak_id: "str | None" = None,
+        selected_flc_peak_id: "str | None" = None,
+        microphone_name: "str | None" = None,
+        microphone_uid: "str | None" = None,
+        calibration_name: "str | None" = None,
+        sample_rate: "float | None" = None,
+        min_freq: "float | None" = None,
+        max_freq: "float | None" = None,
+        min_db: "float | None" = None,
+        max_db: "float | None" = None,
+    ) -> None:
+        """Assemble a new measurement from live analyzer state, then persist.
+
+        Mirrors Swift ``TapToneAnalyzer+MeasurementManagement.saveMeasurement(...)``.
+        The assembly lives in ``build_measurement``; this appends the result to
+        ``savedMeasurements`` and writes the library.
+        """
+        measurement = self.build_measurement(
+            measurement_name=measurement_name,
+            notes=notes,
+            include_spectrum=include_spectrum,
+            spectrum_snapshot=spectrum_snapshot,
+            annotation_offsets=annotation_offsets,
+            selected_longitudinal_peak_id=selected_longitudinal_peak_id,
+            selected_cross_peak_id=selected_cross_peak_id,
+            selected_flc_peak_id=selected_flc_peak_id,
+            microphone_name=microphone_name,
+            microphone_uid=microphone_uid,
+            calibration_name=calibration_name,
+            sample_rate=sample_rate,
+            min_freq=min_freq,
+            max_freq=max_freq,
+            min_db=min_db,
+            max_db=max_db,
+        )
         self.savedMeasurements.append(measurement)
         self._persist_measurements()
 
@@ -421,8 +506,8 @@ class TapToneAnalyzerMeasurementManagementMixin:
                 r, g, b, _a = comps
                 color = (int(r * 255), int(g * 255), int(b * 255))
                 snap = entry.snapshot
-                freq_arr = np.array(snap.frequencies, dtype=np.float64)
-                mag_arr  = np.array(snap.magnitudes,  dtype=np.float64)
+                freq_arr = np.array(snap.frequencies_array, dtype=np.float64)
+                mag_arr  = np.array(snap.magnitudes_array,  dtype=np.float64)
                 self._comparison_data.append({
                     "label": entry.label,
                     "color": color,
@@ -499,8 +584,8 @@ class TapToneAnalyzerMeasurementManagementMixin:
         if measurement.longitudinal_snapshot is not None:
             ls = measurement.longitudinal_snapshot
             self.longitudinal_spectrum = (
-                np.array(ls.magnitudes, dtype=np.float64),
-                np.array(ls.frequencies, dtype=np.float64),
+                np.array(ls.magnitudes_array, dtype=np.float64),
+                np.array(ls.frequencies_array, dtype=np.float64),
             )
         else:
             self.longitudinal_spectrum = None
@@ -508,8 +593,8 @@ class TapToneAnalyzerMeasurementManagementMixin:
         if measurement.cross_snapshot is not None:
             cs = measurement.cross_snapshot
             self.cross_spectrum = (
-                np.array(cs.magnitudes, dtype=np.float64),
-                np.array(cs.frequencies, dtype=np.float64),
+                np.array(cs.magnitudes_array, dtype=np.float64),
+                np.array(cs.frequencies_array, dtype=np.float64),
             )
         else:
             self.cross_spectrum = None
@@ -517,8 +602,8 @@ class TapToneAnalyzerMeasurementManagementMixin:
         if measurement.flc_snapshot is not None:
             fs = measurement.flc_snapshot
             self.flc_spectrum = (
-                np.array(fs.magnitudes, dtype=np.float64),
-                np.array(fs.frequencies, dtype=np.float64),
+                np.array(fs.magnitudes_array, dtype=np.float64),
+                np.array(fs.frequencies_array, dtype=np.float64),
             )
         else:
             self.flc_spectrum = None
@@ -562,8 +647,8 @@ class TapToneAnalyzerMeasurementManagementMixin:
             if measurement.spectrum_snapshot is not None:
                 snap = measurement.spectrum_snapshot
                 self.set_frozen_spectrum(
-                    np.array(snap.frequencies, dtype=np.float64),
-                    np.array(snap.magnitudes, dtype=np.float64),
+                    np.array(snap.frequencies_array, dtype=np.float64),
+                    np.array(snap.magnitudes_array, dtype=np.float64),
                 )
             else:
                 self.set_frozen_spectrum(np.array([]), np.array([]))
@@ -911,8 +996,8 @@ class TapToneAnalyzerMeasurementManagementMixin:
             color = palette[idx % len(palette)]
             label = f"Tap {tap_entry.tap_index}"
             snap = tap_entry.snapshot
-            freqs = _np.array(snap.frequencies, dtype=_np.float64)
-            mags  = _np.array(snap.magnitudes,  dtype=_np.float64)
+            freqs = _np.array(snap.frequencies_array, dtype=_np.float64)
+            mags  = _np.array(snap.magnitudes_array,  dtype=_np.float64)
             entries.append({
                 "label":      label,
                 "color":      color,
@@ -1109,8 +1194,8 @@ class TapToneAnalyzerMeasurementManagementMixin:
         for idx, m in enumerate(with_snapshots):
             snap = m.spectrum_snapshot
             color = _PALETTE[idx % len(_PALETTE)]
-            freq_arr = np.array(snap.frequencies, dtype=np.float64)
-            mag_arr  = np.array(snap.magnitudes,  dtype=np.float64)
+            freq_arr = np.array(snap.frequencies_array, dtype=np.float64)
+            mag_arr  = np.array(snap.magnitudes_array,  dtype=np.float64)
             label = unique_labels[idx]
             # Filter to selected peaks only (mirrors Swift loadComparison selectedPeakIDs logic).
             selected_ids: set = m.effective_selected_peak_ids
@@ -9,6 +9,11 @@ Mirrors Swift TapToneAnalyzer+PeakAnalysis.swift.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
 
 class TapToneAnalyzerPeakAnalysisMixin:
     """Peak detection and classification for TapToneAnalyzer.
@@ -34,8 +39,8 @@ class TapToneAnalyzerPeakAnalysisMixin:
 
     def analyze_magnitudes(
         self,
-        magnitudes: "list[float]",
-        frequencies: "list[float]",
+        magnitudes: "npt.ArrayLike",
+        frequencies: "npt.ArrayLike",
         peak_magnitude: float,
     ) -> None:
         """Update live peaks from a new FFT frame.
@@ -45,13 +50,19 @@ class TapToneAnalyzerPeakAnalysisMixin:
 
         Mirrors Swift ``analyzeMagnitudes(_:frequencies:peakMagnitude:)``.
 
+        The spectrum stays an ndarray all the way through find_peaks — the live
+        path hands over the FFT frame as-is (no per-frame list conversion).
+
         Args:
-            magnitudes:     Magnitude spectrum in dBFS, one value per FFT bin.
-            frequencies:    Frequency axis in Hz matching *magnitudes*.
+            magnitudes:     Magnitude spectrum in dBFS, one value per FFT bin
+                            (ndarray or list).
+            frequencies:    Ascending frequency axis in Hz matching *magnitudes*.
             peak_magnitude: Maximum bin magnitude in dBFS (used by tap detection
                             and decay tracking; not used in Python peak finding
                             since tap detection is handled separately).
         """
+        import numpy as np
+
         from .guitar_mode import GuitarMode
         from .measurement_type import MeasurementType
         from .tap_display_settings import TapDisplaySettings
@@ -73,15 +84,15 @@ class TapToneAnalyzerPeakAnalysisMixin:
         # For plate/brace, use an adaptive noise-floor threshold (median of the
         # analysis range) instead of the guitar-mode peak_min_threshold so the live peak list
         # self-calibrates to each tap's actual signal level.
+        magnitudes  = np.asarray(magnitudes)
+        frequencies = np.asarray(frequencies)
         live_threshold = None
         if uses_fast_tap_detection:
-            lo_freq = self.min_frequency
-            hi_freq = self.max_frequency
-            s_idx = next((i for i, f in enumerate(frequencies) if f >= lo_freq), 0)
-            e_idx = next((i for i, f in enumerate(frequencies) if f > hi_freq), len(frequencies) - 1)
+            s_idx, e_idx = self._band_edges(
+                frequencies, self.min_frequency, self.max_frequency, len(frequencies) - 1
+            )
             if s_idx < e_idx:
-                search_mags = sorted(magnitudes[s_idx:e_idx])
-                live_threshold = search_mags[len(search_mags) // 2]
+                live_threshold = self._upper_median(magnitudes[s_idx:e_idx])
 
         peaks = self.find_peaks(magnitudes, frequencies, peak_min_override=live_threshold)
         # Mirrors Swift allPeaks = peaks — store the durable set; peaks_above_peak_min is its
@@ -229,7 +240,7 @@ class TapToneAnalyzerPeakAnalysisMixin:
         # Mirrors Swift: allPeaks = findPeaks(frozen…, peakMinOverride: peakDetectionFloor)
         # — detect the FULL set at the -100 floor; peaks_above_peak_min is its Peak-Min projection.
         self.all_peaks = self.find_peaks(
-            list(frozen_mag), list(frozen_freq),
+            frozen_mag, frozen_freq,
             peak_min_override=self.PEAK_DETECTION_FLOOR,
         )
         peaks = self.all_peaks
@@ -397,8 +408,8 @@ class TapToneAnalyzerPeakAnalysisMixin:
     # ------------------------------------------------------------------ #
     def find_peaks(
         self,
-        magnitudes: "list[float]",
-        frequencies: "list[float]",
+        magnitudes: "npt.ArrayLike",
+        frequencies: "npt.ArrayLike",
         min_hz: "float | None" = None,
         max_hz: "float | None" = None,
         peak_min_override: "float | None" = None,
@@ -414,7 +425,7 @@ class TapToneAnalyzerPeakAnalysisMixin:
         This is deliberate and load-bearing. The previous implementation iterated the
         mode ranges as its outer loop and the bins as its inner loop; because Top and
         Back overlap on every guitar type, a bin inside the overlap was scanned by two
-        mode passes and _make_peak was called on it twice, minting two peaks with two
+        mode passes and a peak was built from it twice, minting two peaks with two
         ids and otherwise identical values. The assembly step then reconciled two
         independently deduplicated lists **by id** and let the twin survive, so every
         guitar capture on every platform saved one duplicated peak.
@@ -438,18 +449,24 @@ class TapToneAnalyzerPeakAnalysisMixin:
         Returns:
             list[ResonantPeak] sorted by magnitude descending.
         """
+        import numpy as np
+
         if len(magnitudes) != len(frequencies):
             return []
 
-        n = len(magnitudes)
+        # Python-only: the sweep runs as NumPy array operations.  Inputs keep
+        # their dtype (no float64 up-cast), so every comparison and the
+        # interpolation arithmetic are evaluated exactly as the per-bin scalar
+        # loop evaluated them and produce the same peaks.
+        mags  = np.asarray(magnitudes)
+        freqs = np.asarray(frequencies)
         window_size = 5  # ±5 bins local-max window — mirrors Swift windowSize
 
         lo_freq = min_hz if min_hz is not None else self.min_frequency
         hi_freq = max_hz if max_hz is not None else self.max_frequency
 
         # Find start/end indices — mirrors Swift firstIndex(where:)
-        start_idx = next((i for i, f in enumerate(frequencies) if f >= lo_freq), 0)
-        end_idx   = next((i for i, f in enumerate(frequencies) if f > hi_freq), n - 1)
+        start_idx, end_idx = self._band_edges(freqs, lo_freq, hi_freq, len(mags) - 1)
 
         # For plate/brace the caller may supply an adaptive noise-floor threshold
         # (median of the search range) instead of the guitar-mode peak_min_threshold.
@@ -462,25 +479,16 @@ class TapToneAnalyzerPeakAnalysisMixin:
         if scan_start >= scan_end:
             return []
 
-        peaks: "list" = []
+        # Threshold gate, then the strict local-maximum test: any neighbour
+        # within ±window_size that is >= the bin disqualifies it.  Written as
+        # "not (x <= t)" / "not (n >= x)" so NaNs behave as in the scalar loop.
+        core = mags[scan_start:scan_end]
+        keep = ~(core <= effective_threshold)
+        for offset in range(1, window_size + 1):
+            keep &= ~(mags[scan_start - offset:scan_end - offset] >= core)
+            keep &= ~(mags[scan_start + offset:scan_end + offset] >= core)
 
-        for i in range(scan_start, scan_end):
-            magnitude = magnitudes[i]
-            if magnitude <= effective_threshold:
-                continue
-
-            # Local maximum check
-            is_local_max = True
-            for offset in range(-window_size, window_size + 1):
-                if offset == 0:
-                    continue
-                if magnitudes[i + offset] >= magnitude:
-                    is_local_max = False
-                    break
-            if not is_local_max:
-                continue
-
-            peaks.append(self._make_peak(i, magnitudes, frequencies))
+        peaks = self._make_peaks(np.flatnonzero(keep) + scan_start, mags, freqs)
 
         # Two adjacent bins can still resolve to interpolated vertices within
         # peak_proximity_hz of one another; collapse those, keeping the louder.
@@ -490,6 +498,159 @@ class TapToneAnalyzerPeakAnalysisMixin:
             reverse=True,
         )
 
+    # ------------------------------------------------------------------ #
+    # Vectorised find_peaks helpers (Python-only)
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _band_edges(frequencies, min_hz: float, max_hz: float, end_default: int) -> "tuple[int, int]":
+        """Return ``(start_idx, end_idx)`` of a search band on an ascending axis.
+
+        ``start_idx`` is the first bin with f >= min_hz (0 if none) and
+        ``end_idx`` the first bin with f > max_hz (``end_default`` if none) —
+        the Swift ``firstIndex(where:) ?? default`` pair, located by binary
+        search instead of a linear scan.
+
+        Python-only helper.
+        """
+        import numpy as np
+
+        freqs = np.asarray(frequencies)
+        n = len(freqs)
+        start_idx = int(np.searchsorted(freqs, min_hz, side="left"))
+        if start_idx >= n:
+            start_idx = 0
+        end_idx = int(np.searchsorted(freqs, max_hz, side="right"))
+        if end_idx >= n:
+            end_idx = end_default
+        return start_idx, end_idx
+
+    @staticmethod
+    def _upper_median(values):
+        """Element ``count // 2`` of the sorted values — Swift ``sortedMags[count / 2]``.
+
+        The adaptive plate/brace noise floor.  ``np.partition`` selects it in
+        O(n) without sorting; the value (and dtype) is the element the sort
+        would have put there.  Shared by analyze_magnitudes,
+        find_dominant_peak and _build_all_peaks.
+
+        Python-only helper.
+        """
+        import numpy as np
+
+        arr = np.asarray(values)
+        k = len(arr) // 2
+        return np.partition(arr, k)[k]
+
+    @staticmethod
+    def _half_power_edges(magnitudes, indices, thresholds) -> "tuple":
+        """Vectorised form of the −3 dB walk in ``_calculate_q_factor``.
+
+        For each peak bin, walks outward until the magnitude is no longer
+        above its threshold (or the spectrum edge is reached) and returns the
+        ``(lower_idx, upper_idx)`` arrays the scalar walk would stop at.  All
+        peaks advance together in blocks that widen ×4 per round, so a narrow
+        peak costs one small block and a broad one a few.
+
+        Python-only helper.
+        """
+        import numpy as np
+
+        n = len(magnitudes)
+        edges = []
+        for direction, stop in ((-1, 0), (1, n - 1)):
+            out = np.array(indices, dtype=np.intp)
+            pending = np.arange(out.size)
+            span = 16
+            while pending.size:
+                begin = out[pending]
+                pos = np.clip(begin[:, None] + direction * np.arange(span), 0, n - 1)
+                hit = (pos == stop) | ~(magnitudes[pos] > thresholds[pending, None])
+                found = hit.any(axis=1)
+                first = hit.argmax(axis=1)
+                out[pending[found]] = pos[found, first[found]]
+                pending = pending[~found]
+                out[pending] = begin[~found] + direction * span
+                span *= 4
+            edges.append(out)
+        return edges[0], edges[1]
+
+    def _make_peaks(self, indices, magnitudes, frequencies) -> "list":
+        """Build ResonantPeaks for many bins at once.
+
+        Array form of Swift makePeak(at:magnitudes:frequencies:): the parabolic
+        interpolation and Q factor are evaluated for every index in one pass
+        with the same arithmetic as ``_parabolic_interpolate`` /
+        ``_calculate_q_factor``; only the per-peak pitch lookup and object
+        construction remain a Python loop.
+
+        Python-only helper (Swift calls makePeak(at:) per bin).
+
+        Args:
+            indices:     Ascending bin indices of the local maxima (ndarray).
+            magnitudes:  dBFS magnitude spectrum (ndarray).
+            frequencies: Frequency axis in Hz matching magnitudes (ndarray).
+
+        Returns:
+            list[ResonantPeak] in ascending bin order.
+        """
+        import numpy as np
+        from models.resonant_peak import ResonantPeak
+
+        if len(indices) == 0:
+            return []
+
+        i = np.asarray(indices, dtype=np.intp)
+        n = len(magnitudes)
+        interior = (i > 0) & (i < n - 1)
+        im1 = np.where(interior, i - 1, i)
+        ip1 = np.where(interior, i + 1, i)
+
+        # Parabolic interpolation — see _parabolic_interpolate.
+        val  = magnitudes[i]
+        lval = magnitudes[im1]
+        rval = magnitudes[ip1]
+        denom = lval - 2.0 * val + rval
+        refine = interior & ~(np.abs(denom) <= 1e-6)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta = 0.5 * (lval - rval) / denom
+        bin_width = frequencies[i] - frequencies[im1]
+        interp_freq = np.where(refine, frequencies[i] + delta * bin_width, frequencies[i])
+        interp_mag  = np.where(refine, val - 0.25 * (lval - rval) * delta, val)
+
+        # Q factor — see _calculate_q_factor.
+        lower_idx, upper_idx = self._half_power_edges(magnitudes, i, interp_mag - 3.0)
+        bandwidth = frequencies[upper_idx] - frequencies[lower_idx]
+        quality = np.zeros(len(i), dtype=np.result_type(frequencies, bandwidth))
+        np.divide(frequencies[i], bandwidth, out=quality, where=bandwidth > 0.0)
+
+        has_pitch = getattr(self, "pitch_calculator", None) is not None
+        peaks: "list" = []
+        for freq, mag, q, bw in zip(
+            interp_freq.tolist(), interp_mag.tolist(), quality.tolist(), bandwidth.tolist()
+        ):
+            # Pitch information — mirrors Swift makePeak pitchCalculator calls.
+            pitch_note = None
+            pitch_cents = None
+            pitch_frequency = None
+            if has_pitch:
+                try:
+                    pitch_note      = self.pitch_calculator.note(freq)
+                    pitch_cents     = self.pitch_calculator.cents(freq)
+                    pitch_frequency = self.pitch_calculator.freq0(freq)
+                except Exception:
+                    pass
+            peaks.append(ResonantPeak(
+                frequency=freq,
+                magnitude=mag,
+                quality=q,
+                bandwidth=bw,
+                pitch_note=pitch_note,
+                pitch_cents=pitch_cents,
+                pitch_frequency=pitch_frequency,
+            ))
+        return peaks
+
     # ------------------------------------------------------------------ #
     # _apply_frozen_peak_state  (private helper)
     # Mirrors Swift applyFrozenPeakState(peaks:modesByFrequency:...)
@@ -579,61 +740,6 @@ class TapToneAnalyzerPeakAnalysisMixin:
                 p.frequency for p in peaks if p.id in auto_ids
             ]
 
-    # ------------------------------------------------------------------ #
-    # _make_peak  (private helper)
-    # Mirrors Swift makePeak(at:magnitudes:frequencies:)
-    # ------------------------------------------------------------------ #
-
-    def _make_peak(
-        self,
-        index: int,
-        magnitudes: "list[float]",
-        frequencies: "list[float]",
-    ) -> "object":
-        """Build a ResonantPeak from a single FFT bin with parabolic interpolation.
-
-        Mirrors Swift TapToneAnalyzer+PeakAnalysis.swift private func
-        makePeak(at:magnitudes:frequencies:).
-
-        Args:
-            index:      Bin index of the local maximum.
-            magnitudes: dBFS magnitude spectrum.
-            frequencies: Frequency axis in Hz matching magnitudes.
-
-        Returns:
-            A fully-populated ResonantPeak.
-        """
-        from models.resonant_peak import ResonantPeak
-
-        interp_freq, interp_mag = self._parabolic_interpolate(
-            magnitudes, frequencies, index
-        )
-        quality, bandwidth = self._calculate_q_factor(
-            magnitudes, frequencies, index, interp_mag
-        )
-
-        # Pitch information — mirrors Swift makePeak pitchCalculator calls.
-        pitch_note = None
-        pitch_cents = None
-        pitch_frequency = None
-        if hasattr(self, "pitch_calculator") and self.pitch_calculator is not None:
-            try:
-                pitch_note      = self.pitch_calculator.note(float(interp_freq))
-                pitch_cents     = self.pitch_calculator.cents(float(interp_freq))
-                pitch_frequency = self.pitch_calculator.freq0(float(interp_freq))
-            except Exception:
-                pass
-
-        return ResonantPeak(
-            frequency=interp_freq,
-            magnitude=interp_mag,
-            quality=quality,
-            bandwidth=bandwidth,
-            pitch_note=pitch_note,
-            pitch_cents=pitch_cents,
-            pitch_frequency=pitch_frequency,
-        )
-
     # ------------------------------------------------------------------ #
     # guitar_mode_selected_peak_ids
     # Mirrors Swift guitarModeSelectedPeakIDs(from:)
@@ -51,7 +51,10 @@ import numpy.typing as npt
 from PySide6 import QtCore
 from PySide6.QtCore import Slot
 
-from guitar_tap.utilities.logging import gt_log
+from guitar_tap.utilities.logging import TAP_DEBUG, gt_log, tap_debug_enabled
+from guitar_tap.utilities.power_spectrum_accumulator import PowerSpectrumAccumulator
+
+from .captured_tap_store import CapturedTapStore
 
 
 class TapToneAnalyzerSpectrumCaptureMixin:
@@ -73,7 +76,7 @@ class TapToneAnalyzerSpectrumCaptureMixin:
         self.selected_longitudinal_peak: ResonantPeak | None
         self.selected_cross_peak: ResonantPeak | None
         self.selected_flc_peak: ResonantPeak | None
-        self.captured_taps: list[tuple]
+        self.captured_taps: CapturedTapStore (reads as list[tuple])
     """
 
     # Target duration of the gated capture *buffer*, in seconds.
@@ -166,9 +169,27 @@ class TapToneAnalyzerSpectrumCaptureMixin:
 
         Mirrors Swift dumpCaptureWAV(samples:sampleRate:label:).
         """
+        from guitar_tap.utilities.session_recorder import float32_wav_header
+
+        def write(path) -> int:
+            pcm = np.asarray(samples, dtype=np.float32).reshape(-1)
+            with open(path, "wb") as f:
+                f.write(float32_wav_header(len(pcm), sample_rate))
+                f.write(pcm.tobytes())
+            return len(pcm)
+
+        self._write_dump_wav(label, sample_rate, write)
+
+    def _write_dump_wav(self, label: str, sample_rate: float, write) -> bool:
+        """Resolve the dump path for *label* and call ``write(path) -> n_samples``.
+
+        Python-only split of _dump_capture_wav so the streamed session WAV
+        (finish_session_recording) shares the setting check, folder, naming
+        and logging with the in-memory capture dumps.  Returns True if written.
+        """
         from models.tap_display_settings import TapDisplaySettings as _tds
         if not _tds.dump_capture_audio():
-            return
+            return False
         from models.wav_dump_folder import WavDumpFolder
         # The user-settable dump folder (§4b): the custom folder or the default. Reachability was
         # checked at arm time; if the custom folder vanished mid-measurement, skip rather than
@@ -176,10 +197,9 @@ class TapToneAnalyzerSpectrumCaptureMixin:
         acquired = WavDumpFolder.acquire_dump_folder()
         if acquired is None:
             gt_log("⚠️ WAV dump skipped — the chosen folder is no longer reachable")
-            return
+            return False
         dump_dir, release_folder = acquired
         try:
-            import struct
             from datetime import datetime, timezone
 
             dump_dir.mkdir(parents=True, exist_ok=True)
@@ -188,30 +208,38 @@ class TapToneAnalyzerSpectrumCaptureMixin:
             name = f"python_{label}_{ts}.wav"
             path = dump_dir / name
 
-            pcm = samples.astype(np.float32).tobytes()
-            sr = int(sample_rate)
-            n_samples = len(samples)
-            bytes_per_sample = 4
-            data_size = n_samples * bytes_per_sample
-
-            with open(path, "wb") as f:
-                f.write(b"RIFF")
-                f.write(struct.pack("<I", 36 + data_size))
-                f.write(b"WAVE")
-                f.write(b"fmt ")
-                f.write(struct.pack("<I", 16))
-                f.write(struct.pack("<H", 3))             # IEEE float
-                f.write(struct.pack("<H", 1))             # mono
-                f.write(struct.pack("<I", sr))
-                f.write(struct.pack("<I", sr * bytes_per_sample))
-                f.write(struct.pack("<H", bytes_per_sample))
-                f.write(struct.pack("<H", 32))
-                f.write(b"data")
-                f.write(struct.pack("<I", data_size))
-                f.write(pcm)
-            gt_log(f"📦 WAV dump: {path} ({n_samples} samples, {sr} Hz)")
+            n_samples = write(path)
+            gt_log(f"📦 WAV dump: {path} ({n_samples} samples, {int(sample_rate)} Hz)")
+            return True
         except Exception as e:
             gt_log(f"⚠️ WAV dump failed: {e}")
+            return False
+        finally:
+            release_folder()
+
+    def _session_recording_folder(self) -> "str | None":
+        """The folder a new session recorder streams its temp WAV into, or None
+        when there is to be no session recording (Dump Capture Audio off, or the
+        folder unreachable).
+
+        Python-only: finish_session_recording keeps the session WAV only through
+        _write_dump_wav, so with dumping off nothing is recorded at all; and the
+        temp file sits beside its final name, so finalizing is a rename.
+        """
+        from models.tap_display_settings import TapDisplaySettings as _tds
+        if not _tds.dump_capture_audio():
+            return None
+        from models.wav_dump_folder import WavDumpFolder
+        acquired = WavDumpFolder.acquire_dump_folder()
+        if acquired is None:
+            return None
+        dump_dir, release_folder = acquired
+        try:
+            dump_dir.mkdir(parents=True, exist_ok=True)
+            return str(dump_dir)
+        except OSError as e:
+            gt_log(f"⚠️ Session recording disabled — cannot create {dump_dir}: {e}")
+            return None
         finally:
             release_folder()
 
@@ -229,7 +257,7 @@ class TapToneAnalyzerSpectrumCaptureMixin:
         return int(self._session_recording_sample_rate * self.SESSION_PRE_ROLL_DURATION)
 
     def _maintain_session_recording(self, samples) -> None:
-        """Append one audio chunk to the session WAV buffer and maintain the bounded pre-roll (§6).
+        """Append one audio chunk to the session recorder and maintain the bounded pre-roll (§6).
         Caller holds _gated_lock.
 
         Extracted so the rule is unit-testable independently of the gated-capture pipeline:
@@ -242,17 +270,17 @@ class TapToneAnalyzerSpectrumCaptureMixin:
           live — the trim is skipped, so every tap, phase and redo checkpoint is preserved. Only
           redo of the *first* phase re-arms the latch. Mirrors Swift maintainSessionRecording.
         """
-        if not self._is_session_recording:
+        if not self._is_session_recording or self._session_recorder is None:
             return
-        self._session_recording_buffer.extend(samples)
+        recorder = self._session_recorder
+        recorder.append(samples)
         if not self._session_pre_roll_active:
-            return  # frozen after the first tap -> fully live
+            return  # frozen after the first tap -> fully live (streamed to disk)
         if self._gated_capture_active:
             self._session_pre_roll_active = False  # first tap started -> freeze the pre-roll
+            recorder.freeze()
         else:
-            excess = len(self._session_recording_buffer) - self.session_pre_roll_samples
-            if excess > 0:
-                del self._session_recording_buffer[:excess]
+            recorder.keep_latest(self.session_pre_roll_samples)
 
     # ------------------------------------------------------------------ #
     # finish_session_recording
@@ -274,22 +302,27 @@ class TapToneAnalyzerSpectrumCaptureMixin:
             label: Short string identifying the measurement type (e.g.
                    "Plate_LC", "Guitar_8tap", "Brace").
         """
-        import numpy as np
-
         with self._gated_lock:
             self._is_session_recording = False
-            samples = self._session_recording_buffer
-            sample_rate = self._session_recording_sample_rate
-            self._session_recording_buffer = []
+            recorder = self._session_recorder
+            self._session_recorder = None
             self._session_checkpoints = []
 
-        if not samples:
+        if recorder is None:
             return
-        self._dump_capture_wav(
-            np.asarray(samples, dtype=np.float32),
-            sample_rate,
-            f"session_{label}",
-        )
+        try:
+            if len(recorder) == 0:
+                return
+
+            def write(path) -> int:
+                n_samples = len(recorder)
+                if not recorder.finalize(str(path)):
+                    raise recorder.error or OSError("session recording could not be finalized")
+                return n_samples
+
+            self._write_dump_wav(f"session_{label}", recorder.sample_rate, write)
+        finally:
+            recorder.discard()  # removes the temp file if it was not moved into place
 
     # ------------------------------------------------------------------ #
     # capture_window_profile
@@ -305,36 +338,36 @@ class TapToneAnalyzerSpectrumCaptureMixin:
         distribution within the capture window is visible.
 
         Mirrors Swift TapToneAnalyzer.captureWindowProfile(_:label:segmentSize:).
-        """
-        import math
 
-        count = len(samples)
+        Python-only: the per-segment sums are one reshape-based NumPy pass
+        (float64, like the Swift Double accumulators) instead of a per-sample
+        loop.  Callers only build the profile when tap_debug_enabled().
+        """
+        x = np.asarray(samples, dtype=np.float64).reshape(-1)
+        count = int(x.size)
         if count == 0:
             return f"{label}: (empty)"
 
+        # Zero-pad to whole segments: padding adds nothing to sum(x²) or max|x|,
+        # and the true per-segment length is used for the mean.
+        n_seg = -(-count // segment_size)
+        padded = np.zeros(n_seg * segment_size, dtype=np.float64)
+        padded[:count] = x
+        segs = padded.reshape(n_seg, segment_size)
+        starts = np.arange(n_seg) * segment_size
+        ends = np.minimum(starts + segment_size, count)
+        rms = np.sqrt(np.einsum("ij,ij->i", segs, segs) / (ends - starts))
+        rms_db = 20.0 * np.log10(np.maximum(rms, 1e-10))
+        peaks = np.abs(segs).max(axis=1)
+
         lines = [f"{label}: {count} samples ({count}/{segment_size} segments)"]
-        seg = 0
-        offset = 0
-        while offset < count:
-            end = min(offset + segment_size, count)
-            slice_ = samples[offset:end]
-            sum_sq = 0.0
-            peak_abs = 0.0
-            for s in slice_:
-                f = float(s)
-                sum_sq += f * f
-                a = abs(f)
-                if a > peak_abs:
-                    peak_abs = a
-            n = end - offset
-            rms = math.sqrt(sum_sq / n) if n else 0.0
-            rms_db = 20.0 * math.log10(max(rms, 1e-10))
-            lines.append(
-                f"  seg[{seg:2d}] samples[{offset:5d}:{end:5d}] "
-                f"RMS={rms_db:7.1f} dB  peak={peak_abs:.6f}"
+        lines.extend(
+            f"  seg[{seg:2d}] samples[{offset:5d}:{end:5d}] "
+            f"RMS={db:7.1f} dB  peak={peak:.6f}"
+            for seg, (offset, end, db, peak) in enumerate(
+                zip(starts.tolist(), ends.tolist(), rms_db.tolist(), peaks.tolist())
             )
-            seg += 1
-            offset = end
+        )
         return "\n".join(lines)
 
     # ------------------------------------------------------------------ #
@@ -380,16 +413,21 @@ class TapToneAnalyzerSpectrumCaptureMixin:
         # Mirrors Swift: mpmSampleRate = sampleRate (stored property updated each call).
         self._mpm_sample_rate = sample_rate
 
-        samples = chunk.tolist()
+        # The buffers are float32 SampleRingBuffers: appends copy the chunk
+        # straight into preallocated storage and trims are O(1) index moves, so
+        # the lock is held only for a few memcpy-sized operations.
+        samples = np.asarray(chunk, dtype=np.float32).reshape(-1)
 
         # Step 1 — hold lock, update pre-roll and accumulator, read count, release.
         # Mirrors Swift: mpmLock.lock() → append → let count = … → mpmLock.unlock()
         with self._gated_lock:
             # Maintain the pre-roll ring buffer — always, even when not capturing.
             # Mirrors Swift: preRollBuffer.append(contentsOf: samples)
-            self._pre_roll_buf.extend(samples)
-            if len(self._pre_roll_buf) > self._pre_roll_samples:
-                self._pre_roll_buf = self._pre_roll_buf[-self._pre_roll_samples:]
+            pre_roll = self._pre_roll_buf
+            pre_roll.append(samples)
+            excess = len(pre_roll) - self._pre_roll_samples
+            if excess > 0:
+                pre_roll.discard(excess)
 
             # Session recording: append every chunk while recording, maintaining the bounded
             # pre-roll (§6). Mirrors Swift accumulateGatedSamples -> maintainSessionRecording.
@@ -406,24 +444,23 @@ class TapToneAnalyzerSpectrumCaptureMixin:
                     target = int(self._mpm_sample_rate * self.GATED_CAPTURE_DURATION)
                     before_count = len(self._pending_level_crossing_pre_roll)
                     if before_count < target:
-                        self._pending_level_crossing_pre_roll.extend(samples)
-                        from guitar_tap.utilities.logging import TAP_DEBUG as _td_def
-                        _td_def("gatedAccum",
-                                f"DEFERRED_ACCUM | +{len(samples)} "
-                                f"running={len(self._pending_level_crossing_pre_roll)} "
-                                f"cap={target}")
+                        self._pending_level_crossing_pre_roll.append(samples)
+                        if tap_debug_enabled():
+                            TAP_DEBUG("gatedAccum",
+                                      f"DEFERRED_ACCUM | +{len(samples)} "
+                                      f"running={len(self._pending_level_crossing_pre_roll)} "
+                                      f"cap={target}")
                 return
 
-            self._gated_accum.extend(samples)
+            self._gated_accum.append(samples)
             count = len(self._gated_accum)
         # Lock released — mirrors Swift mpmLock.unlock() before count check.
 
-        if self.mic is not None and self.mic.is_playing_file:
-            from guitar_tap.utilities.logging import TAP_DEBUG as _td_ga
-            _td_ga("gatedAccum",
-                   f"CHUNK | +{len(samples)} running={count} "
-                   f"target={self._gated_capture_samples} "
-                   f"phase={self._gated_capture_phase}")
+        if self.mic is not None and self.mic.is_playing_file and tap_debug_enabled():
+            TAP_DEBUG("gatedAccum",
+                      f"CHUNK | +{len(samples)} running={count} "
+                      f"target={self._gated_capture_samples} "
+                      f"phase={self._gated_capture_phase}")
 
         if count < self._gated_capture_samples:
             return
@@ -432,9 +469,11 @@ class TapToneAnalyzerSpectrumCaptureMixin:
         # Mirrors Swift: gatedCaptureActive = false; mpmLock.lock() → slice → mpmLock.unlock()
         with self._gated_lock:
             self._gated_capture_active = False
-            captured = self._gated_accum[:self._gated_capture_samples]
+            # Copy: the array is handed to the main thread, and the accumulator
+            # storage is reused by the next capture.
+            captured = self._gated_accum.oldest(self._gated_capture_samples).copy()
             phase = self._gated_capture_phase
-            self._gated_accum = []
+            self._gated_accum.clear()
 
         # File-playback plate/brace: re-arm the level crossing so the
         # next tap's rising edge is caught on the audio thread.  The
@@ -457,22 +496,21 @@ class TapToneAnalyzerSpectrumCaptureMixin:
             self.mic._level_crossing_consecutive_above = 0
             self.mic._level_crossing_armed = True
 
-        # DIAG: log capture completion details
-        _diag_consumed = 0
-        if self.mic is not None:
-            _diag_consumed = getattr(self.mic, '_diag_total_samples', 0)
-        _cap_arr = np.array(captured, dtype=np.float32)
-        _diag_rms = float(np.sqrt(np.mean(_cap_arr ** 2))) if len(captured) > 0 else 0.0
-        _diag_hash = float(np.sum(_cap_arr[:16])) if len(captured) >= 16 else 0.0
-        _complete_profile = self.capture_window_profile(
-            captured, label=f"ACCUM_COMPLETE({phase})"
-        )
-        from guitar_tap.utilities.logging import TAP_DEBUG as _td2
-        _td2("gatedAccum",
-             f"CAPTURE COMPLETE | samples={len(captured)} "
-             f"fileSamplePos={_diag_consumed} "
-             f"captureRMS={20*np.log10(max(_diag_rms,1e-10)):.2f}dB "
-             f"first16hash={_diag_hash:.6f}\n{_complete_profile}")
+        # DIAG: log capture completion details (only computed when tap debugging is on)
+        if tap_debug_enabled():
+            _diag_consumed = 0
+            if self.mic is not None:
+                _diag_consumed = getattr(self.mic, '_diag_total_samples', 0)
+            _diag_rms = float(np.sqrt(np.mean(captured ** 2))) if len(captured) > 0 else 0.0
+            _diag_hash = float(np.sum(captured[:16])) if len(captured) >= 16 else 0.0
+            _complete_profile = self.capture_window_profile(
+                captured, label=f"ACCUM_COMPLETE({phase})"
+            )
+            TAP_DEBUG("gatedAccum",
+                      f"CAPTURE COMPLETE | samples={len(captured)} "
+                      f"fileSamplePos={_diag_consumed} "
+                      f"captureRMS={20*np.log10(max(_diag_rms,1e-10)):.2f}dB "
+                      f"first16hash={_diag_hash:.6f}\n{_complete_profile}")
 
         # PLATFORM PLUMBING — deliberately different from Swift; do NOT "unify".
         # A Qt signal is our thread-hop and it delivers data to a SINGLE slot
@@ -490,7 +528,7 @@ class TapToneAnalyzerSpectrumCaptureMixin:
         emit_phase = "_deferred_" if is_file_plate_brace else phase
         if self.mic is not None and self.mic.proc_thread is not None:
             self.mic.proc_thread.gatedCaptureComplete.emit(
-                _cap_arr,
+                captured,
                 sample_rate,
                 emit_phase,
             )
@@ -525,25 +563,23 @@ class TapToneAnalyzerSpectrumCaptureMixin:
                 _td_flush("file_playback", "FLUSH_GATED_SKIP | not active")
                 return
             self._gated_capture_active = False
-            partial = list(self._gated_accum)
             target = self._gated_capture_samples
             phase = self._gated_capture_phase
-            self._gated_accum = []
-
-        if not partial:
+            # Zero-pad to target window size so the FFT receives an exactly-sized
+            # window.  The padded zeros lower the average level but don't distort
+            # the ring-out peaks — the file signal is in the leading portion.
+            accumulated = self._gated_accum.oldest(target)
+            partial = np.zeros(target, dtype=np.float32)
+            partial[:len(accumulated)] = accumulated
+            has_samples = len(accumulated) > 0
+            self._gated_accum.clear()
+
+        if not has_samples:
             _td_flush("file_playback", "FLUSH_GATED_SKIP | empty partial")
             return
 
         sample_rate = self._mpm_sample_rate
 
-        # Zero-pad to target window size so the FFT receives an exactly-sized
-        # window.  The padded zeros lower the average level but don't distort
-        # the ring-out peaks — the file signal is in the leading portion.
-        if len(partial) < target:
-            partial.extend([0.0] * (target - len(partial)))
-        else:
-            partial = partial[:target]
-
         gt_log(f"🎯 Gated capture flushed on file end — "
                f"{len(partial)} samples (zero-padded to {target})")
 
@@ -551,7 +587,7 @@ class TapToneAnalyzerSpectrumCaptureMixin:
         # on the main thread.
         if self.mic is not None and self.mic.proc_thread is not None:
             self.mic.proc_thread.gatedCaptureComplete.emit(
-                np.array(partial, dtype=np.float32),
+                partial,
                 sample_rate,
                 phase,
             )
@@ -597,16 +633,20 @@ class TapToneAnalyzerSpectrumCaptureMixin:
                 # silence audio).  Mirrors Swift startGatedCapture deferred path.
                 deferred_pre_roll = self._pending_level_crossing_pre_roll
                 self._pending_level_crossing_pre_roll = None
-                seed_buffer = deferred_pre_roll if deferred_pre_roll is not None else list(self._pre_roll_buf)
+                seed_source = deferred_pre_roll if deferred_pre_roll is not None else self._pre_roll_buf
 
                 still_active = False
                 self._gated_capture_id += 1
                 my_capture_id = self._gated_capture_id
-                self._gated_accum = seed_buffer
+                self._gated_accum.replace(seed_source.view())
                 self._gated_capture_samples = target_samples
                 self._gated_capture_phase = phase
                 self._gated_capture_active = True
                 current_count = len(self._gated_accum)
+                # Diagnostic copy — the accumulator keeps filling on the audio thread.
+                seed_buffer = (
+                    self._gated_accum.oldest(current_count).copy() if tap_debug_enabled() else None
+                )
 
         if fast_start_handled:
             state = "running" if still_active else "completed"
@@ -622,15 +662,15 @@ class TapToneAnalyzerSpectrumCaptureMixin:
                 f"🎯 Gated FFT capture started for phase {phase} — "
                 f"{target_samples}-sample window ({window_ms} ms at {int(rate)} Hz)"
             )
-            from guitar_tap.utilities.logging import TAP_DEBUG as _td_seed
-            seed_label = "deferred" if deferred_pre_roll is not None else "preroll"
-            seed_profile = self.capture_window_profile(
-                seed_buffer, label=f"SEED_BUFFER({seed_label})"
-            )
-            _td_seed("gatedCapture",
-                     f"SEED | preRollSamples={current_count} "
-                     f"target={target_samples} rate={int(rate)} "
-                     f"deferred={deferred_pre_roll is not None}\n{seed_profile}")
+            if seed_buffer is not None:
+                seed_label = "deferred" if deferred_pre_roll is not None else "preroll"
+                seed_profile = self.capture_window_profile(
+                    seed_buffer, label=f"SEED_BUFFER({seed_label})"
+                )
+                TAP_DEBUG("gatedCapture",
+                          f"SEED | preRollSamples={current_count} "
+                          f"target={target_samples} rate={int(rate)} "
+                          f"deferred={deferred_pre_roll is not None}\n{seed_profile}")
 
         # Safety timeout: if the buffer still has audio after 2 s, flush it;
         # if empty, ask the user to tap again.
@@ -643,12 +683,12 @@ class TapToneAnalyzerSpectrumCaptureMixin:
                 if not self._gated_capture_active:
                     return  # already completed normally
                 self._gated_capture_active = False
-                partial = list(self._gated_accum)
-                self._gated_accum = []
-            if partial:
+                partial = self._gated_accum.view().copy()
+                self._gated_accum.clear()
+            if len(partial) > 0:
                 if self.mic is not None and self.mic.proc_thread is not None:
                     self.mic.proc_thread.gatedCaptureComplete.emit(
-                        np.array(partial, dtype=np.float32),
+                        partial,
                         self._gated_sample_rate,
                         phase,
                     )
@@ -711,7 +751,7 @@ class TapToneAnalyzerSpectrumCaptureMixin:
                 still_active = False
                 self._gated_capture_id += 1
                 my_capture_id = self._gated_capture_id
-                self._gated_accum = list(self._pre_roll_buf)
+                self._gated_accum.replace(self._pre_roll_buf.view())
                 self._gated_capture_samples = target_samples
                 self._gated_capture_phase = None  # None = guitar mode marker
                 self._gated_capture_active = True
@@ -753,15 +793,15 @@ class TapToneAnalyzerSpectrumCaptureMixin:
                 if not self._gated_capture_active:
                     return
                 self._gated_capture_active = False
-                partial = list(self._gated_accum)
-                self._gated_accum = []
-            if not partial:
+                partial = self._gated_accum.view().copy()
+                self._gated_accum.clear()
+            if len(partial) == 0:
                 gt_log("⚠️ Guitar gated capture timeout with no samples")
                 self._guitar_gated_capture_failed()
                 return
             if self.mic is not None and self.mic.proc_thread is not None:
                 self.mic.proc_thread.gatedCaptureComplete.emit(
-                    np.array(partial, dtype=np.float32),
+                    partial,
                     self._gated_sample_rate,
                     None,
                 )
@@ -839,8 +879,13 @@ class TapToneAnalyzerSpectrumCaptureMixin:
                  np.zeros(fft_size - len(samples), dtype=np.float32)]
             )
 
-        window_fcn = self.mic.window_fcn  # rectangular (np.ones(fft_size))
-        magnitudes_db, _ = _dft_anal(chunk, window_fcn, fft_size)
+        # Rectangular window at fft_size — reuse the live path's cached plan.
+        plan = self.mic.fft_plan
+        if plan.n_freq_samples == fft_size:
+            magnitudes_db, _ = plan.execute(chunk)
+        else:
+            window_fcn = self.mic.window_fcn  # rectangular (np.ones(fft_size))
+            magnitudes_db, _ = _dft_anal(chunk, window_fcn, fft_size)
 
         # Apply per-bin calibration if present — mirrors what
         # process_raw_samples does on every live FFT frame.
@@ -852,12 +897,11 @@ class TapToneAnalyzerSpectrumCaptureMixin:
 
         # Build the matching frequency axis.  Use the same self.freq array
         # the live path uses so downstream peak detection sees identical bins.
-        freqs = list(self.freq) if self.freq is not None else (
-            [i * float(sample_rate) / fft_size for i in range(fft_size // 2 + 1)]
+        freqs = self.freq if self.freq is not None else (
+            np.arange(fft_size // 2 + 1) * (float(sample_rate) / fft_size)
         )
 
-        import datetime as _dt
-        self.captured_taps.append((list(magnitudes_db), freqs, _dt.datetime.now()))
+        self._append_captured_tap(magnitudes_db, freqs)
 
         peak_db = float(np.max(magnitudes_db))
         # DIAG: spectrum fingerprint — sum of first 100 magnitude bins
@@ -1090,27 +1134,28 @@ class TapToneAnalyzerSpectrumCaptureMixin:
 
         # CAPTURED_WINDOW diagnostic: log per-segment RMS of the raw window
         # before onset alignment, so the energy distribution is visible.
+        # Only computed when tap debugging is on.
         import numpy as np
-        _samples_arr = np.asarray(samples, dtype=np.float32)
-        _non_zero = int(np.count_nonzero(_samples_arr))
-        _peak_sample = float(np.max(np.abs(_samples_arr))) if _samples_arr.size else 0.0
-        _rms_all = (
-            20.0 * float(np.log10(max(
-                float(np.sqrt(np.mean(_samples_arr.astype(np.float64) ** 2))) if _samples_arr.size else 0.0,
-                1e-10,
-            )))
-            if _samples_arr.size else 0.0
-        )
-        _captured_profile = self.capture_window_profile(
-            list(_samples_arr), label=f"CAPTURED_WINDOW({phase})"
-        )
-        from guitar_tap.utilities.logging import TAP_DEBUG as _td_finish
-        _td_finish(
-            "gatedFFT",
-            f"FINISH | total={int(_samples_arr.shape[0])} nonZero={_non_zero} "
-            f"peak={_peak_sample:.6f} rms={_rms_all:.2f}dB "
-            f"rate={int(sample_rate)} phase={phase}\n{_captured_profile}",
-        )
+        if tap_debug_enabled():
+            _samples_arr = np.asarray(samples, dtype=np.float32)
+            _non_zero = int(np.count_nonzero(_samples_arr))
+            _peak_sample = float(np.max(np.abs(_samples_arr))) if _samples_arr.size else 0.0
+            _rms_all = (
+                20.0 * float(np.log10(max(
+                    float(np.sqrt(np.mean(_samples_arr.astype(np.float64) ** 2))) if _samples_arr.size else 0.0,
+                    1e-10,
+                )))
+                if _samples_arr.size else 0.0
+            )
+            _captured_profile = self.capture_window_profile(
+                _samples_arr, label=f"CAPTURED_WINDOW({phase})"
+            )
+            TAP_DEBUG(
+                "gatedFFT",
+                f"FINISH | total={int(_samples_arr.shape[0])} nonZero={_non_zero} "
+                f"peak={_peak_sample:.6f} rms={_rms_all:.2f}dB "
+                f"rate={int(sample_rate)} phase={phase}\n{_captured_profile}",
+            )
 
         # Align the capture window to the sample-level tap onset so the
         # Hann-windowed FFT produces identical results regardless of the
@@ -1232,8 +1277,12 @@ class TapToneAnalyzerSpectrumCaptureMixin:
         # every phase change: the status-bar progress bar reset each phase, and the plate label's
         # `max(0, captured - (step - 1) * number_of_taps)` went negative → clamped → "Tap 0/N".
         # Redo rebases this counter explicitly (control.py: l_count / lc_count), so += stays correct.
-        import datetime as _dt
-        self.captured_taps.append((magnitudes, frequencies, _dt.datetime.now()))
+        # A dropped tap (bin count mismatch) is not counted: re-arm and wait for another, as the
+        # guitar path does by deriving its count from len(captured_taps).
+        if not self._append_captured_tap(magnitudes, frequencies):
+            self._set_status_message("Tap not captured — tap again")
+            self.re_enable_detection_for_next_plate_tap()
+            return
         self.current_tap_count += 1
         self.tap_progress = min(1.0, float(self.current_tap_count) / float(self.total_plate_taps))
 
@@ -1303,22 +1352,20 @@ class TapToneAnalyzerSpectrumCaptureMixin:
         Returns:
             ResonantPeak or None if no candidates are found.
         """
-        from typing import NamedTuple
-
         from models.resonant_peak import ResonantPeak
 
-        class _Candidate(NamedTuple):
-            index: int
-            magnitude: float
-            hps_score: float
-            q_factor: float
-
         n = len(magnitudes)
         if n != len(frequencies) or n <= 10:
             return None
 
-        start_idx = next((i for i, f in enumerate(frequencies) if f >= min_hz), 0)
-        end_idx   = next((i for i, f in enumerate(frequencies) if f > max_hz), n)
+        # Python-only: band edges, noise floor, local maxima, Q and HPS are
+        # array operations over all candidates.  Inputs keep their dtype, so
+        # every comparison is evaluated as the per-bin Swift loop evaluates it.
+        mags  = np.asarray(magnitudes)
+        freqs = np.asarray(frequencies)
+
+        # Mirrors Swift firstIndex(where: >= minHz) ?? 0 / firstIndex(where: > maxHz) ?? n.
+        start_idx, end_idx = self._band_edges(freqs, min_hz, max_hz, n)
         if start_idx >= end_idx:
             return None
 
@@ -1326,89 +1373,82 @@ class TapToneAnalyzerSpectrumCaptureMixin:
 
         # Adaptive noise floor — median of the search range.
         # Mirrors Swift: sortedMags[sortedMags.count / 2]
-        search_mags = magnitudes[start_idx:end_idx]
-        sorted_mags = sorted(search_mags)
-        noise_floor = sorted_mags[len(sorted_mags) // 2]
-
-        # Pre-compute linear amplitudes for HPS scoring.
-        # Mirrors Swift: let linear = magnitudes.map { pow(10.0, max($0, -160) / 20.0) }
-        linear = [10.0 ** (max(m, -160.0) / 20.0) for m in magnitudes]
-
-        candidates = []  # (index, magnitude, hps_score, q_factor)
+        noise_floor = self._upper_median(mags[start_idx:end_idx])
 
+        # Step 1 — candidates: local maxima (strictly above every bin within
+        # ±window_size) above the noise floor.  Same mask as find_peaks.
         scan_start = start_idx + window_size
         scan_end   = end_idx   - window_size
-
-        for i in range(scan_start, scan_end):
-            mag = magnitudes[i]
-            if mag <= noise_floor:
-                continue
-
-            # Local maximum check — mirrors Swift ±windowSize loop.
-            # scan_start/scan_end guarantee i ± window_size stays within [0, n).
-            is_local = True
-            for offset in range(-window_size, window_size + 1):
-                if offset == 0:
-                    continue
-                if magnitudes[i + offset] >= mag:
-                    is_local = False
-                    break
-            if not is_local:
-                continue
-
-            # HPS score: linear[i] × linear[2i] × linear[3i] (order 3).
-            # Mirrors Swift: for k in 2...3 { harmIdx = i*k; hpsScore *= linear[harmIdx] }
-            hps_score = linear[i]
-            for k in (2, 3):
-                harm_idx = i * k
-                if harm_idx < n:
-                    hps_score *= linear[harm_idx]
-
-            # Q factor — key discriminant between resonances (high-Q) and impact thuds (low-Q).
-            q, _ = self._calculate_q_factor(magnitudes, frequencies, i, mag)
-
-            candidates.append(_Candidate(index=i, magnitude=mag, hps_score=hps_score, q_factor=q))
-
-        if not candidates:
+        if scan_start >= scan_end:
             return None
+        core = mags[scan_start:scan_end]
+        keep = ~(core <= noise_floor)
+        for offset in range(1, window_size + 1):
+            keep &= ~(mags[scan_start - offset:scan_end - offset] >= core)
+            keep &= ~(mags[scan_start + offset:scan_end + offset] >= core)
+        cand_idx = np.flatnonzero(keep) + scan_start
+        if cand_idx.size == 0:
+            return None
+        cand_mag = mags[cand_idx]
+
+        # HPS score: linear[i] × linear[2i] × linear[3i] (order 3), harmonics
+        # past the end skipped.  Mirrors Swift:
+        #   let linear = magnitudes.map { pow(10.0, max($0, -160) / 20.0) }
+        #   for k in 2...3 { harmIdx = i*k; hpsScore *= linear[harmIdx] }
+        def linear(idx):
+            return 10.0 ** (np.maximum(mags[idx], -160.0) / 20.0)
+
+        cand_hps = linear(cand_idx)
+        for k in (2, 3):
+            harm_idx = cand_idx * k
+            in_range = harm_idx < n
+            cand_hps = cand_hps * np.where(in_range, linear(np.where(in_range, harm_idx, 0)), 1.0)
+
+        # Q factor — key discriminant between resonances (high-Q) and impact
+        # thuds (low-Q).  Same −3 dB walk as _calculate_q_factor, from the raw bin.
+        lower_idx, upper_idx = self._half_power_edges(mags, cand_idx, cand_mag - 3.0)
+        bandwidth = freqs[upper_idx] - freqs[lower_idx]
+        cand_q = np.zeros(cand_idx.size, dtype=np.result_type(freqs, bandwidth))
+        np.divide(freqs[cand_idx], bandwidth, out=cand_q, where=bandwidth > 0.0)
 
         # Q filtering — mirrors Swift: let highQCandidates = candidates.filter { $0.qFactor >= minQ }
         min_q = 3.0
-        high_q = [c for c in candidates if c.q_factor >= min_q]
-        if len(high_q) < len(candidates):
-            rejected = [c for c in candidates if c.q_factor < min_q]
+        high_q = cand_q >= min_q
+        if not high_q.all():
             rej_str = ", ".join(
-                f"{frequencies[c.index]:.0f} Hz (Q={c.q_factor:.1f})" for c in rejected
+                f"{freqs[i]:.0f} Hz (Q={q:.1f})"
+                for i, q in zip(cand_idx[~high_q], cand_q[~high_q])
             )
             gt_log(f"🔇 Q-filtered out low-Q peaks: {rej_str}")
-        pool = high_q if high_q else candidates
+        pool = np.flatnonzero(high_q) if high_q.any() else np.arange(cand_idx.size)
 
-        by_magnitude = sorted(pool, key=lambda c: c.magnitude, reverse=True)
+        # Pool ordered by magnitude, strongest first; ties keep ascending
+        # frequency (Python's stable sort, as before).
+        by_magnitude = pool[np.argsort(-cand_mag[pool], kind="stable")]
         strongest = by_magnitude[0]
 
         if prefer_lowest_significant:
             # Mirrors Swift: pick lowest-frequency candidate within 6 dB of strongest.
             # 6 dB (not 15) rejects spurious low-frequency peaks (impact artifacts,
             # environmental noise) that can pass the Q >= 3 filter.
-            threshold_db = strongest.magnitude - 6.0
-            significant = [c for c in pool if c.magnitude >= threshold_db]
-            best = min(significant, key=lambda c: c.index)
+            threshold_db = cand_mag[strongest] - 6.0
+            best = pool[np.flatnonzero(cand_mag[pool] >= threshold_db)[0]]
         else:
             # Default: strongest wins unless a lower-frequency candidate is within 6 dB
             # and has a comparable HPS score (within one order of magnitude).
             # Mirrors Swift: for candidate in byMagnitude.dropFirst() { … }
             current = strongest
             for candidate in by_magnitude[1:]:
-                if candidate.index >= current.index:
+                if cand_idx[candidate] >= cand_idx[current]:
                     continue  # not lower frequency
-                mag_diff = current.magnitude - candidate.magnitude
-                if mag_diff < 6.0 and candidate.hps_score >= current.hps_score * 0.1:
+                mag_diff = cand_mag[current] - cand_mag[candidate]
+                if mag_diff < 6.0 and cand_hps[candidate] >= cand_hps[current] * 0.1:
                     current = candidate
             best = current
 
-        best_idx = best.index
-        best_hps = best.hps_score
-        best_q   = best.q_factor
+        best_idx = int(cand_idx[best])
+        best_hps = cand_hps[best]
+        best_q   = cand_q[best]
 
         # Refine with parabolic interpolation — mirrors Swift parabolicInterpolate call.
         freq, mag = self._parabolic_interpolate(magnitudes, frequencies, best_idx)
@@ -1837,8 +1877,7 @@ class TapToneAnalyzerSpectrumCaptureMixin:
         noise-floor threshold instead of the guitar-mode peak_min_threshold.
         Mirrors Swift TapToneAnalyzer.buildAllPeaks(magnitudes:frequencies:dominantPeak:).
         """
-        sorted_mags = sorted(magnitudes)
-        median_threshold = sorted_mags[len(sorted_mags) // 2]
+        median_threshold = self._upper_median(magnitudes)
         peaks = self.find_peaks(magnitudes, frequencies, peak_min_override=median_threshold)
         prox = self.PEAK_PROXIMITY_HZ
 
@@ -1883,28 +1922,68 @@ class TapToneAnalyzerSpectrumCaptureMixin:
             the single tap's data unchanged if len == 1; the first tap's data if
             lengths differ.
         """
-        import math
+        def as_list(values) -> list[float]:
+            return values.tolist() if isinstance(values, np.ndarray) else list(values)
 
         if not from_taps:
             return [], []
         if len(from_taps) == 1:
-            return list(from_taps[0][0]), list(from_taps[0][1])
+            return as_list(from_taps[0][0]), as_list(from_taps[0][1])
 
         mags0, freqs0, _ = from_taps[0]
         n_bins = len(mags0)
         if not all(len(t[0]) == n_bins for t in from_taps):
             gt_log("⚠️ Warning: Spectrum lengths don't match, using first tap only")
-            return list(mags0), list(freqs0)
+            return as_list(mags0), as_list(freqs0)
 
-        power_sum = [0.0] * n_bins
-        for mags, _, _ in from_taps:
-            for b in range(n_bins):
-                power_sum[b] += 10.0 ** (mags[b] / 10.0)
+        # Python-only: a CapturedTapStore already holds the power sum, folded
+        # tap by tap, leaving one vectorised log here.  Any other list of taps
+        # is folded now, in one pass per tap.
+        if isinstance(from_taps, CapturedTapStore) and from_taps.power.is_consistent:
+            acc = from_taps.power
+        else:
+            acc = PowerSpectrumAccumulator()
+            for mags, _, _ in from_taps:
+                acc.add(mags)
 
         n_taps = len(from_taps)
-        avg = [10.0 * math.log10(power_sum[b] / n_taps) for b in range(n_bins)]
+        avg = acc.mean_db().tolist()
         gt_log(f"📊 Averaged {n_taps} spectra: {n_bins} bins each")
-        return avg, list(freqs0)
+        return avg, as_list(freqs0)
+
+    def running_tap_average(self) -> "tuple[np.ndarray, np.ndarray | None] | None":
+        """Power-averaged dB spectrum of the taps captured so far, and the per-bin
+        variance of their linear power.
+
+        Python-only; available after every tap without re-averaging.  None if
+        no taps are captured.
+        """
+        acc = self.captured_taps.power
+        if acc.count == 0 or not acc.is_consistent:
+            return None
+        return acc.mean_db(), acc.variance()
+
+    # ------------------------------------------------------------------ #
+    # _append_captured_tap — helper (no Swift equivalent)
+    # ------------------------------------------------------------------ #
+
+    def _append_captured_tap(self, magnitudes, frequencies) -> bool:
+        """Append one tap spectrum to captured_taps (which folds it into the
+        running power average).
+
+        Python-only.  Swift appends a (magnitudes, frequencies, captureTime)
+        tuple to capturedTaps / materialCapturedTaps and averages everything in
+        averageSpectra(from:) once the last tap is in.  A spectrum whose bin
+        count differs from the taps already captured is dropped (Swift's
+        averageSpectra would fall back to the first tap in that case).
+
+        Returns False if the tap was dropped; the caller must then re-arm
+        detection without counting it.
+        """
+        if self.captured_taps.add(magnitudes, frequencies):
+            return True
+        gt_log("⚠️ Warning: Spectrum lengths don't match, tap not captured")
+        return False
 
     # ------------------------------------------------------------------ #
     # finish_capture
@@ -1943,9 +2022,9 @@ class TapToneAnalyzerSpectrumCaptureMixin:
 
         gt_log(f"🔬 Processing {len(self.captured_taps)} taps for averaging...")
 
-        # captured_taps stores (magnitudes, frequencies, captureTime) tuples —
-        # mirrors Swift capturedTaps which uses the same named-tuple structure.
-        # Pass directly to average_spectra; no wrapping needed.
+        # captured_taps reads as (magnitudes, frequencies, captureTime) tuples —
+        # mirrors Swift capturedTaps which uses the same named-tuple structure —
+        # and carries the running power sum (CapturedTapStore).
         tap_tuples = self.captured_taps
         avg_mags, avg_freqs = self.average_spectra(from_taps=tap_tuples)
         avg_db = _np.array(avg_mags)
@@ -2019,9 +2098,10 @@ class TapToneAnalyzerSpectrumCaptureMixin:
             _max_f2 = _tds2.max_frequency()
             _min_db2 = _tds2.min_magnitude()
 
+            # Row views of the capture store share one frequency axis.
+            t_freqs = tap_tuples.frequencies
             tap_entries_built = []
-            for idx, tap_mags in enumerate(tap_tuples):
-                t_mags, t_freqs, _ = tap_mags
+            for idx, t_mags in enumerate(tap_tuples.magnitudes):
                 # Each TapEntry stores the FULL set found at the -100 dB floor, so the per-tap table
                 # is durable and independent of Peak Min. Mirrors Swift processMultipleTaps
                 # (+SpectrumCapture.swift:1664, peakMinOverride: peakDetectionFloor).
@@ -2030,8 +2110,10 @@ class TapToneAnalyzerSpectrumCaptureMixin:
                 )
                 t_sel_ids = self.guitar_mode_selected_peak_ids(t_peaks)
                 snap = SpectrumSnapshot(
-                    frequencies=list(t_freqs),
-                    magnitudes=list(t_mags),
+                    # Array-backed snapshot: the shared axis and a copy of the
+                    # float32 row (the store reuses its buffer for the next sequence).
+                    frequencies=t_freqs,
+                    magnitudes=t_mags.copy(),
                     min_freq=_min_f2,
                     max_freq=_max_f2,
                     min_db=_min_db2,
@@ -28,7 +28,7 @@ import time as _time
 
 from PySide6 import QtCore
 from PySide6.QtCore import Slot
-from utilities.logging import TAP_DEBUG
+from utilities.logging import TAP_DEBUG, tap_debug_enabled
 
 from guitar_tap.utilities.logging import gt_log
 
@@ -46,7 +46,7 @@ class TapToneAnalyzerTapDetectionHandlerMixin:
         self.is_above_threshold: bool
         self.just_exited_warmup: bool
         self.warmup_start_audio_time: float | None   (AUDIO clock, not wall clock)
-        self.last_tap_time: float | None          (monotonic clock)
+        self.last_tap_time: float | None          (monotonic clock; audio clock during offline playback)
         self.noise_floor_estimate: float          (dBFS)
         self.noise_floor_alpha: float             (EMA coefficient = 0.05)
         self.warmup_period: float                 (seconds = 0.5)
@@ -106,7 +106,9 @@ class TapToneAnalyzerTapDetectionHandlerMixin:
         from models.measurement_type import MeasurementType as _MT
         from models.tap_display_settings import TapDisplaySettings as _tds
 
-        now = _time.monotonic()
+        # Offline file playback has no meaningful wall clock — gate the cooldown
+        # on audio time instead (Python-only; see _advance_virtual_clock).
+        now = audio_time if self._uses_virtual_clock() else _time.monotonic()
 
         meas_type = _tds.measurement_type()
         use_relative = (meas_type == _MT.PLATE or meas_type == _MT.BRACE)
@@ -122,8 +124,10 @@ class TapToneAnalyzerTapDetectionHandlerMixin:
 
         # Compute effective thresholds.
         # NOTE: Per-chunk log lines restored for file playback only to diagnose
-        # intermittent gated-capture failures.
-        _is_file = self.mic and getattr(self.mic, 'is_playing_file', False)
+        # intermittent gated-capture failures; formatted only when tap debugging is on.
+        _is_file = (
+            tap_debug_enabled() and self.mic and getattr(self.mic, 'is_playing_file', False)
+        )
         if use_relative:
             headroom = max(self.tap_detection_threshold - self.noise_floor_estimate, 10.0)
             effective_rising  = self.noise_floor_estimate + headroom
@@ -634,8 +638,9 @@ class TapToneAnalyzerTapDetectionHandlerMixin:
                 # self?.analyzeMagnitudes(magnitudes, frequencies:, peakMagnitude:).
                 # analyze_magnitudes updates peaks_above_peak_min, selected_peak_ids,
                 # identified_modes, and emits peaksChanged via its internal logic.
+                # The frame and axis are passed as ndarrays — no per-frame list boxing.
                 peak_mag = float(fft_peak_amp) - 100.0
-                self.analyze_magnitudes(list(mag_y_db), list(self.freq), peak_mag)
+                self.analyze_magnitudes(mag_y_db, self.freq, peak_mag)
                 self.spectrumUpdated.emit(self.freq, mag_y_db)
         elif self._display_mode == AnalysisDisplayMode.FROZEN:
             self.spectrumUpdated.emit(self.frozen_frequencies, self.frozen_magnitudes)
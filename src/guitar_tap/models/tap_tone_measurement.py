@@ -29,14 +29,16 @@ Measurement Types:
 
 from __future__ import annotations
 
+import copy
+import json
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
 from guitar_tap.utilities.json_float import f32, f32_list
 from .resonant_peak import ResonantPeak
-from .spectrum_snapshot import SpectrumSnapshot
+from .spectrum_snapshot import SNAPSHOT_FORMAT_V1, SpectrumSnapshot
 
 
 def _now_iso() -> str:
@@ -76,18 +78,19 @@ class TapEntry:
     # Mirrors Swift TapEntry.selectedPeakIDs ([UUID]).
     selected_peak_ids: list[str]
 
-    def to_dict(self) -> dict:
+    def to_dict(self, format_version: int = SNAPSHOT_FORMAT_V1) -> dict:
         """Encode as a JSON-compatible dict using Swift camelCase field names.
 
+        *format_version* is passed to SpectrumSnapshot.to_dict.
         Mirrors Swift TapEntry's synthesized Codable encode(to:).
         Python-only — Swift uses synthesized Codable.
         """
         return {
             "id": self.id,
             "tapIndex": self.tap_index,
-            "snapshot": self.snapshot.to_dict(),
+            "snapshot": self.snapshot.to_dict(format_version),
             # Swift encodes TapEntry.peaks with plain ResonantPeak Codable — no modeLabel.
-            "peaks": [p.to_dict(include_mode_label=False) for p in self.peaks],
+            "peaks": ResonantPeak.to_dicts(self.peaks, include_mode_label=False),
             "selectedPeakIDs": self.selected_peak_ids,
         }
 
@@ -215,9 +218,10 @@ class ComparisonEntry:
         p = resolved.get(mode)
         return p.frequency if p is not None else None
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, format_version: int = SNAPSHOT_FORMAT_V1) -> dict[str, Any]:
         """Encode as a JSON-compatible dict using Swift camelCase field names.
 
+        *format_version* is passed to SpectrumSnapshot.to_dict.
         Mirrors Swift ComparisonEntry's synthesized Codable encode(to:).
         Python-only — Swift uses synthesized Codable.
         """
@@ -225,9 +229,9 @@ class ComparisonEntry:
             "id": self.id,
             "label": self.label,
             "colorComponents": self.color_components,
-            "snapshot": self.snapshot.to_dict(),
+            "snapshot": self.snapshot.to_dict(format_version),
             # Swift encodes ComparisonEntry.peaks with plain ResonantPeak Codable — no modeLabel.
-            "peaks": [p.to_dict(include_mode_label=False) for p in self.peaks],
+            "peaks": ResonantPeak.to_dicts(self.peaks, include_mode_label=False),
         }
         if self.guitar_type is not None:
             d["guitarType"] = self.guitar_type
@@ -722,7 +726,7 @@ class TapToneMeasurement:
                 role_labels.append("Peak")
         return role_labels
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, format_version: int = SNAPSHOT_FORMAT_V1) -> dict[str, Any]:
         """Encode this measurement as a JSON-compatible dict using Swift field names.
 
         Keys are written in the same order as Swift's custom encode(to:) so that
@@ -732,6 +736,8 @@ class TapToneMeasurement:
         serializer: persistence (saved_measurements.json), single-measurement
         export, and whole-library Export All all go through it, so every written
         `.guitartap` file is byte-identical regardless of which path produced it.
+        *format_version* selects the snapshot encoding (SpectrumSnapshot.to_dict);
+        the default is the Swift-compatible version 1.
         Python-only — Swift uses Codable with a custom encoder.
         """
         d: dict[str, Any] = {}
@@ -746,7 +752,7 @@ class TapToneMeasurement:
         if self.notes:
             d["notes"] = self.notes
         if self.spectrum_snapshot is not None:
-            d["spectrumSnapshot"] = self.spectrum_snapshot.to_dict()
+            d["spectrumSnapshot"] = self.spectrum_snapshot.to_dict(format_version)
         # Mirrors Swift encodeIfPresent(namedOffsets, forKey: .peakAnnotationOffsets):
         # nil -> key omitted; non-nil -> flat array of alternating UUID-string /
         # offset-object pairs (because UUID is not a JSON string key), which is the
@@ -774,11 +780,11 @@ class TapToneMeasurement:
         if self.selected_flc_peak_id:
             d["selectedFlcPeakID"] = self.selected_flc_peak_id
         if self.longitudinal_snapshot is not None:
-            d["longitudinalSnapshot"] = self.longitudinal_snapshot.to_dict()
+            d["longitudinalSnapshot"] = self.longitudinal_snapshot.to_dict(format_version)
         if self.cross_snapshot is not None:
-            d["crossSnapshot"] = self.cross_snapshot.to_dict()
+            d["crossSnapshot"] = self.cross_snapshot.to_dict(format_version)
         if self.flc_snapshot is not None:
-            d["flcSnapshot"] = self.flc_snapshot.to_dict()
+            d["flcSnapshot"] = self.flc_snapshot.to_dict(format_version)
         if self.selected_peak_ids:
             d["selectedPeakIDs"] = self.selected_peak_ids
         if self.selected_peak_frequencies:
@@ -832,7 +838,7 @@ class TapToneMeasurement:
         # rather than emitting a stored label.  Resolving here (not in a separate
         # export-only function) is what makes persistence and every export path
         # byte-identical, matching Swift's one-encoder design.
-        peak_dicts = [p.to_dict() for p in self.peaks]
+        peak_dicts = ResonantPeak.to_dicts(self.peaks)
         for peak_d, label in zip(
             peak_dicts, self._resolve_peak_mode_labels(_resolved_mt, _resolved_gt)
         ):
@@ -842,15 +848,53 @@ class TapToneMeasurement:
         # Comparison entries — omitted (encodeIfPresent) when None.
         # Mirrors Swift TapToneMeasurement.encode(to:) comparisonEntries.
         if self.comparison_entries is not None:
-            d["comparisonEntries"] = [e.to_dict() for e in self.comparison_entries]
+            d["comparisonEntries"] = [e.to_dict(format_version) for e in self.comparison_entries]
 
         # Multi-tap entries — omitted (encodeIfPresent) when None.
         # Mirrors Swift TapToneMeasurement.encode(to:) tapEntries.
         if self.tap_entries is not None:
-            d["tapEntries"] = [e.to_dict() for e in self.tap_entries]
+            d["tapEntries"] = [e.to_dict(format_version) for e in self.tap_entries]
 
         return d
 
+    def to_json(self, format_version: int = SNAPSHOT_FORMAT_V1) -> str:
+        """``to_dict()`` as the library file writes it, memoised per *format_version*.
+
+        The text is ``json.dumps(indent=2, sort_keys=True, ensure_ascii=False)`` of
+        the record; measurements_to_json nests it in the library array, so saving
+        or exporting a measurement that has not changed costs no ``to_dict()``.
+        Assigning a field drops the memo (see ``__setattr__``); ``with_`` returns
+        a new object, which starts without one.
+        Python-only.
+        """
+        memo = self.__dict__.setdefault("_encoded", {})
+        text = memo.get(format_version)
+        if text is None:
+            text = json.dumps(self.to_dict(format_version),
+                              indent=2, ensure_ascii=False, sort_keys=True)
+            memo[format_version] = text
+        return text
+
+    # MARK: - Derived-State Invalidation (Python-only)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        d = self.__dict__
+        if ("_encoded" in d or "_summary" in d) and name in _FIELD_NAMES:
+            self.mark_modified()
+
+    def mark_modified(self) -> None:
+        """Drop everything memoised from this measurement's fields.
+
+        That is the encoded text (``to_json``) and the list summary
+        (views/measurement_summary_index.summary_of).  Assigning a field calls
+        this; code that edits a container field in place — an entry of
+        ``annotation_offsets`` or ``peak_mode_overrides``, a selected peak ID —
+        must call it itself.
+        """
+        self.__dict__.pop("_encoded", None)
+        self.__dict__.pop("_summary", None)
+
     # MARK: - Duplicate-Peak Heal
 
     PEAK_PROXIMITY_HZ: float = 2.0
@@ -1227,3 +1271,80 @@ class TapToneMeasurement:
             comparison_entries=comparison_entries,
             tap_entries=tap_entries,
         )
+
+    # MARK: - Deferred loading (Python-only)
+
+    @staticmethod
+    def deferred(known: dict[str, Any], load: "Callable[[], TapToneMeasurement]") -> "TapToneMeasurement":
+        """A measurement holding only the *known* fields until any other is read.
+
+        The first read of a missing field calls *load* for the full record, fills
+        the remaining fields from it and turns the object into a plain
+        ``TapToneMeasurement`` — same identity, so lists holding it are unaffected.
+        Used by the measurement library's summary index
+        (views/measurement_summary_index.py) to open a library without decoding
+        records nobody has looked at yet.
+
+        Python-only.
+        """
+        m = object.__new__(_DeferredTapToneMeasurement)
+        m.__dict__.update(known)
+        m.__dict__["_load_record"] = load
+        return m
+
+    @property
+    def is_record_deferred(self) -> bool:
+        return "_load_record" in self.__dict__
+
+
+class _DeferredField:
+    """Data descriptor standing in for one dataclass field of a deferred measurement."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        if self.name not in obj.__dict__:
+            _resolve_deferred_record(obj)
+        return obj.__dict__[self.name]
+
+    def __set__(self, obj, value) -> None:
+        obj.__dict__[self.name] = value
+
+
+def _resolve_deferred_record(m: TapToneMeasurement) -> None:
+    # Fill first, switch class, drop the loader last: a concurrent reader either
+    # finds the loader (and loads too — same record) or the filled fields.
+    load = m.__dict__.get("_load_record")
+    if load is None:
+        return
+    full = load()
+    for f in fields(TapToneMeasurement):
+        m.__dict__.setdefault(f.name, full.__dict__[f.name])
+    m.__class__ = TapToneMeasurement
+    m.__dict__.pop("_load_record", None)
+
+
+class _DeferredTapToneMeasurement(TapToneMeasurement):
+    """A TapToneMeasurement whose record has not been loaded yet (see ``deferred``)."""
+
+    def __eq__(self, other: object) -> bool:
+        _resolve_deferred_record(self)
+        return self == other
+
+    def __deepcopy__(self, memo: dict) -> TapToneMeasurement:
+        _resolve_deferred_record(self)
+        return copy.deepcopy(self, memo)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(TapToneMeasurement))
+
+for _f in fields(TapToneMeasurement):
+    setattr(_DeferredTapToneMeasurement, _f.name, _DeferredField(_f.name))
+del _f
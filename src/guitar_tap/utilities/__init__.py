@@ -1,6 +1,6 @@
 """
 Utilities package — mirrors Swift GuitarTap/Utilities/.
 """
-from .logging import TAP_DEBUG
+from .logging import TAP_DEBUG, tap_debug_enabled
 
-__all__ = ["TAP_DEBUG"]
+__all__ = ["TAP_DEBUG", "tap_debug_enabled"]
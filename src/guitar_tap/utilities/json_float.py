@@ -17,6 +17,12 @@ Python and Swift builds carry byte-identical scalar fields:
     shortest-round-trip algorithm Swift's ``Float`` description also uses, then
     parsed back to ``float`` so ``json.dumps`` re-emits that same shortest text.
 
+``f32_list()`` produces the same values for a whole list at once: NumPy
+quantises the array, integral values take a fast path, and the shortest
+round-trip decimal of every other element is found arithmetically, one
+precision at a time across the array (``_shortest_f32``), instead of
+formatting and re-parsing each element.
+
 Only fields that Swift declares as ``Float`` should pass through ``f32()``.
 Fields Swift declares as ``Double`` (e.g. ``pitchCents``, ``pitchFrequency``,
 ``colorComponents``, annotation ``absFreqHz``/``absDB``) already match, because
@@ -36,19 +42,122 @@ def f32(value: float | int | None) -> float | int | None:
     if value is None:
         return None
     f = np.float32(value)
-    if not math.isfinite(float(f)):
-        return float(f)
+    v = float(f)
     # Integral -> int so json emits "-100", not "-100.0" (matches Swift).
-    if float(f).is_integer():
-        return int(f)
+    # (Checked first: it is the common case, and is False for inf and NaN.)
+    if v.is_integer():
+        return int(v)
+    if not math.isfinite(v):
+        return v
     # str(np.float32(x)) is the shortest decimal that round-trips to the float32
     # value — the same convention Swift uses. Re-parsing to float keeps json's
     # output identical to that shortest text.
     return float(str(f))
 
 
+# Below this many values f32_list quantises element by element (NumPy's
+# per-call overhead outweighs the per-element saving).
+_BULK_MIN = 128
+
+
 def f32_list(values: list | None) -> list | None:
-    """Apply :func:`f32` to each element of a list. ``None`` passes through."""
+    """:func:`f32` of each element of a list, quantised in one NumPy pass.
+
+    ``None`` passes through, as does each ``None`` element.
+    """
     if values is None:
         return None
-    return [f32(v) for v in values]
+    # Short lists are cheaper element by element; NumPy would turn None into NaN.
+    if len(values) < _BULK_MIN or None in values:
+        return [f32(v) for v in values]
+    x = np.asarray(values, dtype=np.float32)
+    if x.ndim != 1:
+        return [f32(v) for v in values]
+
+    out = x.astype(np.float64)
+    finite = np.isfinite(x)
+    integral = finite & (x == np.trunc(x))
+    fractional = finite & ~integral
+    if fractional.any():
+        out[fractional] = _shortest_f32(x[fractional])
+    if not integral.any():
+        return out.tolist()
+    # Integral -> int, as in f32.
+    return [int(v) if i else v for v, i in zip(out.tolist(), integral.tolist())]
+
+
+# Significant digits that always round-trip a float32.
+_F32_DIGITS = 9
+
+# Largest power of ten a float32 can be scaled by with the product still exact in
+# float64 (24-bit significand x 5**12 < 2**53), so that floor() of it is exact.
+_MAX_EXACT_SCALE = 12
+
+# Exact powers of ten (up to 1e22 every one is exactly representable).
+_POW10 = 10.0 ** np.arange(23)
+
+
+def _shortest_f32(x: np.ndarray) -> np.ndarray:
+    """The float64 value of the shortest decimal that round-trips to each float32.
+
+    *x* holds finite, non-integral float32 values.  At p significant digits
+    the two p-digit decimals bracketing a value are formed as ``n / 10**k`` —
+    one correctly rounded operation on exact operands, so the same float that
+    ``float()`` parses from that decimal — and the one that converts back to
+    the float32 is kept (the nearer if both do, the even ``n`` on a tie).  The
+    smallest such p is found by a bisection run on the whole array at once.
+    That is the rule ``str(np.float32(v))`` follows, and so Swift's ``Float``
+    encoding.  Values below 1e-4, which cannot be scaled exactly, go through
+    :func:`f32` one by one.
+    """
+    x64 = x.astype(np.float64)
+    mag = np.abs(x64)
+    e = np.floor(np.log10(mag)).astype(np.int64)
+    # log10 can land on the wrong side of a power of ten; settle the exponent.
+    e -= mag < 10.0 ** e
+    e += mag >= 10.0 ** (e + 1)
+
+    slow = e < _F32_DIGITS - 1 - _MAX_EXACT_SCALE
+    if slow.any():
+        out = np.empty_like(x64)
+        out[slow] = [f32(v) for v in x[slow].tolist()]
+        out[~slow] = _shortest_f32(x[~slow])
+        return out
+
+    def at(p: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        k = p - 1 - e
+        scale = _POW10[np.abs(k)]
+        up = k >= 0
+        lo = np.floor(np.where(up, x64 * scale, x64 / scale))
+        hi = lo + 1.0
+        lo_v = np.where(up, lo / scale, lo * scale)
+        hi_v = np.where(up, hi / scale, hi * scale)
+        lo_ok = lo_v.astype(np.float32) == x
+        hi_ok = hi_v.astype(np.float32) == x
+        d_lo, d_hi = x64 - lo_v, hi_v - x64
+        take_hi = hi_ok & (~lo_ok | (d_hi < d_lo))
+        tie = hi_ok & lo_ok & (d_hi == d_lo)
+        if tie.any():
+            half = lo[tie] * 0.5
+            take_hi[tie] = half != np.floor(half)      # odd lo: round to even
+        return np.where(take_hi, hi_v, lo_v), lo_ok | hi_ok
+
+    # Bisect p in [1, 9] for every value at once (round-tripping is monotonic
+    # in p), keeping the value found at the current upper bound.
+    lo_p = np.ones(x.shape, dtype=np.int64)
+    hi_p = np.full(x.shape, _F32_DIGITS, dtype=np.int64)
+    out = np.full_like(x64, np.nan)
+    while True:
+        open_ = lo_p < hi_p
+        if not open_.any():
+            break
+        mid = (lo_p + hi_p) // 2
+        v, ok = at(mid)
+        moved = open_ & ok
+        hi_p = np.where(moved, mid, hi_p)
+        lo_p = np.where(open_ & ~ok, mid + 1, lo_p)
+        out = np.where(moved, v, out)
+    rest = np.isnan(out)                  # only p = 9 round-trips
+    if rest.any():
+        out[rest] = at(hi_p)[0][rest]
+    return out
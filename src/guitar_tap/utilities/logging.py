@@ -5,6 +5,9 @@ gt_log  — general-purpose debug logging. Replace print() calls with this.
            To disable all gt_log output after beta, set _gt_log_enabled = False.
 
 TAP_DEBUG — tap-detection specific logging, controlled by _tap_debug_enabled.
+           Call sites whose message is expensive to build (sample-window
+           profiles, per-chunk file-playback lines) guard it with
+           tap_debug_enabled() so production capture does no debug work.
 
 Both write to the platform user-data directory alongside saved measurements:
   macOS/Windows: ~/Documents/GuitarTap/guitar_tap-debug.log
@@ -76,6 +79,12 @@ def gt_log(message: str) -> None:
         _file_logger._write(message)
 
 
+def tap_debug_enabled() -> bool:
+    """Cheap check for TAP_DEBUG call sites that would otherwise format (or
+    compute) their message only to have it dropped.  Python-only."""
+    return _tap_debug_enabled
+
+
 def TAP_DEBUG(category: str, message: str) -> None:
     if _tap_debug_enabled:
         msg = f"TAP_DEBUG {category}: {message}"
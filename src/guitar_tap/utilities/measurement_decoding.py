@@ -0,0 +1,164 @@
+"""
+Parallel decoding of large ``.guitartap`` files.
+
+Python-only.  Decoding a multi-hundred-measurement backup serially — one
+``json.loads`` of the whole file, then ``TapToneMeasurement.from_dict`` with its
+peak healing for every record — takes seconds.
+
+``decode_measurements`` splits the top-level array into its raw elements
+without parsing them (``split_measurement_array``), decodes batches of records
+across a process pool and reports progress as batches come back; results keep
+file order.  Small files (fewer than ``PARALLEL_MIN_RECORDS`` records) are
+decoded in-process, where a pool would cost more than it saves.
+
+Worker processes import only this module and the models — never the views
+package (which would load the whole main window) — so a spawned worker starts
+quickly.  views/measurement_import.py runs the pipeline off the GUI thread.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import re
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable
+
+# Below this many records the file is decoded in-process.
+PARALLEL_MIN_RECORDS = 64
+
+# A JSON string (escapes included) or one bracket — everything the splitter needs.
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+
+
+class ImportCancelled(Exception):
+    """Raised by ``decode_measurements`` when its *cancelled* event is set."""
+
+
+# MARK: - Splitting
+
+def split_measurement_array(data: bytes) -> "list[bytes] | None":
+    """The raw bytes of each element of a top-level JSON array, unparsed.
+
+    Returns None when *data* is not a well-formed array of objects (a single
+    measurement object, or malformed input) — the caller falls back to the
+    ordinary decoder, which reports the error.
+    """
+    text = data.lstrip(b"\xef\xbb\xbf \t\r\n")
+    if not text.startswith(b"["):
+        return None
+    offset = len(data) - len(text)
+    elements: list[bytes] = []
+    depth = 0
+    start = gap = offset + 1
+    for m in _TOKEN.finditer(data, offset):
+        c = data[m.start()]
+        if c == 0x22:                       # '"' — a string, skipped whole
+            if depth == 1:
+                return None                 # a bare string element
+            continue
+        if c in (0x5B, 0x7B):               # '[' '{'
+            depth += 1
+            if depth == 2:
+                between = data[gap:m.start()].strip()
+                if data[m.start()] != 0x7B or between != (b"," if elements else b""):
+                    return None
+                start = m.start()
+        else:                               # ']' '}'
+            depth -= 1
+            if depth == 1:
+                elements.append(data[start:m.end()])
+                gap = m.end()
+            elif depth == 0:
+                if data[gap:m.start()].strip() or data[m.end():].strip():
+                    return None
+                return elements
+    return None
+
+
+# MARK: - Worker process
+
+def _init_worker(paths: list[str]) -> None:
+    """Process-pool initializer: the parent's import roots, no display."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    for path in reversed(paths):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def _decode_batch(records: list[bytes]) -> list:
+    """Decode one batch of raw records (runs in a worker process)."""
+    return _decode_records(json.loads(b"[" + b",".join(records) + b"]"))
+
+
+def _decode_records(raw: list) -> list:
+    # The decoder measurements_from_json uses (TapToneMeasurement.from_dict).
+    from models.tap_tone_measurement import TapToneMeasurement
+
+    return [TapToneMeasurement.from_dict(d) for d in raw]
+
+
+# MARK: - Pipeline
+
+def decode_measurements(
+    data: bytes,
+    progress: "Callable[[int, int], None] | None" = None,
+    jobs: int | None = None,
+    cancelled: "threading.Event | None" = None,
+) -> list:
+    """Decode a ``.guitartap`` file (array or single object) into measurements.
+
+    Same result as ``measurements_from_json``; large arrays are decoded across
+    ``jobs`` worker processes (default: the CPUs available to this process).
+    *progress* is called with ``(records decoded, total)`` as batches complete,
+    from the calling thread.  Setting *cancelled* abandons the import
+    (``ImportCancelled``).  Decode errors raise ``ValueError``.
+    """
+    records = split_measurement_array(data)
+    # process_cpu_count (3.13+) honours CPU affinity; cpu_count does not.
+    jobs = jobs or getattr(os, "process_cpu_count", os.cpu_count)() or 1
+    if records is None or len(records) < PARALLEL_MIN_RECORDS or jobs < 2:
+        try:
+            raw = json.loads(data)
+            measurements = _decode_records(raw if isinstance(raw, list) else [raw])
+        except Exception as exc:
+            raise ValueError(f"decode failed: {exc}") from exc
+        if progress is not None:
+            progress(len(measurements), len(measurements))
+        return measurements
+
+    total = len(records)
+    size = max(1, total // (jobs * 4))      # a few batches per worker, for progress
+    batches = [records[i:i + size] for i in range(0, total, size)]
+    results: list[list | None] = [None] * len(batches)
+    done = 0
+    if progress is not None:
+        progress(0, total)
+    pool = ProcessPoolExecutor(
+        max_workers=min(jobs, len(batches)),
+        # Never fork the GUI process (Qt and the persistence thread are running).
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(list(sys.path),),
+    )
+    try:
+        pending = {pool.submit(_decode_batch, batch): i for i, batch in enumerate(batches)}
+        while pending:
+            finished, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            if cancelled is not None and cancelled.is_set():
+                raise ImportCancelled()
+            for future in finished:
+                i = pending.pop(future)
+                try:
+                    results[i] = future.result()
+                except Exception as exc:
+                    raise ValueError(f"decode failed: {exc}") from exc
+                done += len(batches[i])
+                if progress is not None:
+                    progress(done, total)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return [m for batch in results for m in batch]
@@ -0,0 +1,96 @@
+"""Running power-domain average of tap spectra.
+
+Python-only companion to Swift ``averageSpectra(from:)``.  The Swift port (and
+the original Python one) averages only after the last tap arrives, converting
+every tap's dB spectrum back to power bin by bin — a taps × bins Python loop
+that stalled the GUI at the end of a 10-tap guitar sequence.
+
+``PowerSpectrumAccumulator`` folds each tap into a float64 power sum as soon as
+it is captured, so the average (and, optionally, the per-bin variance of the
+linear power) is available after every tap, and finishing is one O(bins)
+vectorised ``10 * log10(sum / n)``::
+
+    p_i    = 10 ** (dB_i / 10)     # folded per tap by add()
+    avg_p  = (1/N) Σ p_i
+    dB_avg = 10 * log10(avg_p)     # mean_db()
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+
+class PowerSpectrumAccumulator:
+    """Incremental per-bin power sum over N equal-length dB spectra."""
+
+    def __init__(self, track_variance: bool = False) -> None:
+        """Create an empty accumulator.
+
+        Args:
+            track_variance: Also keep Σ p² so variance() is available.
+        """
+        self.track_variance: bool = track_variance
+        self._power_sum: npt.NDArray[np.float64] | None = None
+        self._power_sq_sum: npt.NDArray[np.float64] | None = None
+        self._count: int = 0
+        self._mismatched: bool = False
+
+    # MARK: - State
+
+    @property
+    def count(self) -> int:
+        """Number of spectra folded in since the last reset()."""
+        return self._count
+
+    @property
+    def n_bins(self) -> int:
+        return 0 if self._power_sum is None else int(self._power_sum.size)
+
+    @property
+    def is_consistent(self) -> bool:
+        """False once a spectrum of a different length was offered (the sum is then unusable)."""
+        return not self._mismatched
+
+    # MARK: - Mutation
+
+    def reset(self) -> None:
+        self._power_sum = None
+        self._power_sq_sum = None
+        self._count = 0
+        self._mismatched = False
+
+    def add(self, magnitudes_db: npt.ArrayLike) -> None:
+        """Fold one dB spectrum into the running power sum."""
+        power = np.power(10.0, np.asarray(magnitudes_db, dtype=np.float64).reshape(-1) / 10.0)
+        self._count += 1
+        if self._power_sum is None:
+            self._power_sum = power
+            if self.track_variance:
+                self._power_sq_sum = power * power
+            return
+        if power.size != self._power_sum.size:
+            self._mismatched = True
+            return
+        self._power_sum += power
+        if self._power_sq_sum is not None:
+            self._power_sq_sum += power * power
+
+    # MARK: - Results
+
+    def mean_power(self) -> npt.NDArray[np.float64]:
+        """Per-bin mean linear power.  Empty if nothing was added."""
+        if self._power_sum is None:
+            return np.zeros(0, dtype=np.float64)
+        return self._power_sum / self._count
+
+    def mean_db(self) -> npt.NDArray[np.float64]:
+        """Per-bin power-averaged spectrum in dB."""
+        return 10.0 * np.log10(self.mean_power())
+
+    def variance(self) -> npt.NDArray[np.float64] | None:
+        """Per-bin population variance of the linear power, or None if not tracked."""
+        if self._power_sq_sum is None or self._power_sum is None:
+            return None
+        mean = self._power_sum / self._count
+        return np.maximum(self._power_sq_sum / self._count - mean * mean, 0.0)
@@ -0,0 +1,134 @@
+"""Fixed-capacity float32 sample FIFO with contiguous, zero-copy window views.
+
+Python-only: Swift's ``RealtimeFFTAnalyzer.inputBuffer`` is a ``[Float]`` that is
+appended to and ``removeFirst(n)``-trimmed in place.  The Python port originally
+kept a list of chunks and ``np.concatenate``-d the whole list every time an FFT
+fired, which allocated and copied a full ``fft_size`` frame per frame.
+
+``SampleRingBuffer`` keeps the samples in a single preallocated array that is
+*double-mapped*: every sample is written at index ``p`` and again at
+``p + capacity``.  Any run of up to ``capacity`` consecutive samples is then a
+contiguous slice of the backing array, so ``oldest(n)`` / ``latest(n)`` return
+plain NumPy views — no copy, no allocation — and ``discard(n)`` is O(1).
+
+The views alias the backing store: they are valid until the next ``append``
+(which may overwrite the slots they cover).  Callers that need the samples
+beyond that point must ``.copy()`` them.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+
+class SampleRingBuffer:
+    """Float32 FIFO of audio samples with O(1) trim and contiguous views.
+
+    ``capacity`` is the steady-state bound.  An ``append`` that would exceed
+    it grows the backing store (to the next power of two that fits) instead
+    of dropping samples, so an unusually large audio block can never silently
+    lose audio; in normal operation the store is allocated exactly once.
+    """
+
+    __slots__ = ("_data", "_capacity", "_start", "_length")
+
+    def __init__(self, capacity: int) -> None:
+        """Create an empty buffer.
+
+        Args:
+            capacity: Maximum number of samples held without reallocating.
+        """
+        capacity = int(capacity)
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self._capacity: int = capacity
+        # Double-mapped backing store: slot p and slot p + capacity hold the same sample.
+        self._data: npt.NDArray[np.float32] = np.zeros(2 * capacity, dtype=np.float32)
+        self._start: int = 0   # index (mod capacity) of the oldest sample
+        self._length: int = 0  # number of samples currently held
+
+    # MARK: - Size
+
+    @property
+    def capacity(self) -> int:
+        """Number of samples the buffer can hold without reallocating."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    # MARK: - Mutation
+
+    def append(self, samples: npt.ArrayLike) -> None:
+        """Append *samples* (cast to float32) after the newest sample."""
+        arr = np.asarray(samples, dtype=np.float32).reshape(-1)
+        n = int(arr.shape[0])
+        if n == 0:
+            return
+        if self._length + n > self._capacity:
+            self._grow(self._length + n)
+
+        cap = self._capacity
+        write = (self._start + self._length) % cap
+        first = min(n, cap - write)
+        data = self._data
+        data[write:write + first] = arr[:first]
+        data[write + cap:write + cap + first] = arr[:first]
+        if first < n:
+            rest = n - first
+            data[:rest] = arr[first:]
+            data[cap:cap + rest] = arr[first:]
+        self._length += n
+
+    def replace(self, samples: npt.ArrayLike) -> None:
+        """Drop every sample, then append *samples* (reuses the backing store).
+
+        *samples* must not be a view of this buffer.
+        """
+        self.clear()
+        self.append(samples)
+
+    def discard(self, n: int) -> None:
+        """Drop the *n* oldest samples (all of them if *n* ≥ ``len``)."""
+        n = min(max(int(n), 0), self._length)
+        self._start = (self._start + n) % self._capacity
+        self._length -= n
+
+    def clear(self) -> None:
+        """Drop every sample.  The backing store is kept for reuse."""
+        self._start = 0
+        self._length = 0
+
+    # MARK: - Views
+
+    def oldest(self, n: int) -> npt.NDArray[np.float32]:
+        """Contiguous view of the *n* oldest samples (clamped to ``len``)."""
+        n = min(max(int(n), 0), self._length)
+        return self._data[self._start:self._start + n]
+
+    def latest(self, n: int) -> npt.NDArray[np.float32]:
+        """Contiguous view of the *n* newest samples (clamped to ``len``)."""
+        n = min(max(int(n), 0), self._length)
+        begin = self._start + self._length - n
+        return self._data[begin:begin + n]
+
+    def view(self) -> npt.NDArray[np.float32]:
+        """Contiguous view of every held sample, oldest first."""
+        return self._data[self._start:self._start + self._length]
+
+    # MARK: - Private
+
+    def _grow(self, needed: int) -> None:
+        new_cap = self._capacity
+        while new_cap < needed:
+            new_cap *= 2
+        held = self.view().copy()
+        self._capacity = new_cap
+        self._data = np.zeros(2 * new_cap, dtype=np.float32)
+        self._start = 0
+        self._length = 0
+        self.append(held)
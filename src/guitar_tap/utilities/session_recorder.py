@@ -0,0 +1,296 @@
+"""Disk-streaming session recorder for the per-measurement session WAV.
+
+Python-only storage for what Swift keeps as ``sessionRecordingBuffer: [Float]``.
+The port originally held the whole session in a Python ``list`` of floats
+(~28 bytes per sample), so a long multi-phase plate session could hold millions
+of samples in RAM until ``finish_session_recording`` wrote them in one go.
+
+``SessionRecorder`` keeps memory flat regardless of session length:
+
+* Before the first tap the session head is bounded (FILE-PATHS-AND-NAMES-SPEC §6),
+  so it lives in an in-memory float32 ``SampleRingBuffer`` that
+  ``keep_latest`` trims in O(1).
+* ``freeze()`` (the first tap) hands the head to a background writer thread,
+  and every later ``append`` is queued to it.  The writer streams the samples
+  to a temporary mono 32-bit float WAV.
+* ``truncate(n)`` (redo back to a phase checkpoint) is queued on the same
+  FIFO, so it is applied after every earlier write and before every later one.
+  Truncating to 0 returns the recorder to the in-memory head mode.
+* ``finalize(path)`` patches the WAV header and moves the temp file into place.
+  The analyzer creates the temp file in the dump folder itself (*directory*),
+  so that move is a rename; elsewhere it falls back to a copy.
+
+Lengths are tracked on the producer side, so ``len(recorder)`` (used for the
+redo checkpoints) is exact immediately, without waiting for the writer.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import shutil
+import struct
+import tempfile
+import threading
+
+import numpy as np
+import numpy.typing as npt
+
+from .sample_ring_buffer import SampleRingBuffer
+
+WAV_HEADER_SIZE: int = 44
+_BYTES_PER_SAMPLE: int = 4
+
+# Temp files of recorders that were never finalized or discarded (e.g. a tap
+# sequence still running at exit).  Removed by _remove_orphaned_temp_files.
+_live_temp_paths: set[str] = set()
+
+
+@atexit.register
+def _remove_orphaned_temp_files() -> None:
+    for path in list(_live_temp_paths):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    _live_temp_paths.clear()
+
+
+def float32_wav_header(n_samples: int, sample_rate: float) -> bytes:
+    """Canonical 44-byte RIFF header for a mono IEEE-float32 WAV of *n_samples*."""
+    sr = int(sample_rate)
+    data_size = int(n_samples) * _BYTES_PER_SAMPLE
+    return b"".join((
+        b"RIFF", struct.pack("<I", 36 + data_size), b"WAVE",
+        b"fmt ", struct.pack("<I", 16),
+        struct.pack("<H", 3),                       # IEEE float
+        struct.pack("<H", 1),                       # mono
+        struct.pack("<I", sr),
+        struct.pack("<I", sr * _BYTES_PER_SAMPLE),
+        struct.pack("<H", _BYTES_PER_SAMPLE),
+        struct.pack("<H", 32),
+        b"data", struct.pack("<I", data_size),
+    ))
+
+
+class SessionRecorder:
+    """Append-only session audio with a bounded in-memory head and a streamed tail.
+
+    Not thread-safe on the producer side: the analyzer calls every method under
+    its ``_gated_lock``.  The writer thread is internal.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float,
+        head_capacity: int = 1 << 17,
+        directory: str | None = None,
+    ) -> None:
+        """Create an empty recorder in head (in-memory, unfrozen) mode.
+
+        Args:
+            sample_rate:   Sample rate written into the WAV header.
+            head_capacity: Initial capacity of the in-memory head, in samples.
+            directory:     Where the temp WAV is created — the folder ``finalize``
+                           will write into, so the final move is a rename.  None
+                           uses the system temp directory.
+        """
+        self.sample_rate: float = float(sample_rate)
+        self.directory: str | None = directory
+        self._head = SampleRingBuffer(head_capacity)
+        self._frozen: bool = False
+        self._disk_length: int = 0      # samples queued to the writer (after truncations)
+        self._queue: "queue.Queue[tuple] | None" = None
+        self._thread: threading.Thread | None = None
+        self._path: str | None = None
+        self._error: BaseException | None = None
+
+    # MARK: - Size / state
+
+    def __len__(self) -> int:
+        return self._disk_length if self._frozen else len(self._head)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    @property
+    def frozen(self) -> bool:
+        """True once the head has been handed to the disk writer."""
+        return self._frozen
+
+    # MARK: - Mutation (producer side)
+
+    def append(self, samples: npt.ArrayLike) -> None:
+        """Append one chunk — to the head, or to the disk stream once frozen."""
+        if not self._frozen:
+            self._head.append(samples)
+            return
+        chunk = np.array(samples, dtype=np.float32).reshape(-1)  # own copy for the writer
+        if chunk.size:
+            self._disk_length += int(chunk.size)
+            self._submit(("write", chunk))
+
+    def keep_latest(self, n: int) -> None:
+        """Trim the in-memory head to its newest *n* samples (no-op once frozen)."""
+        if self._frozen:
+            return
+        excess = len(self._head) - max(int(n), 0)
+        if excess > 0:
+            self._head.discard(excess)
+
+    def freeze(self) -> None:
+        """Start streaming: queue the head to disk; later appends go straight to disk.
+
+        Idempotent.
+        """
+        if self._frozen:
+            return
+        head = self._head.view().copy()
+        self._head.clear()
+        self._frozen = True
+        self._disk_length = int(head.size)
+        self._ensure_writer()
+        if head.size:
+            self._submit(("write", head))
+
+    def truncate(self, n: int) -> None:
+        """Drop every sample after the first *n* (redo back to a checkpoint).
+
+        Truncating a frozen recorder to 0 returns it to head mode.
+        """
+        n = max(int(n), 0)
+        if n >= len(self):
+            return
+        if not self._frozen:
+            kept = self._head.oldest(n).copy()
+            self._head.replace(kept)
+            return
+        self._disk_length = n
+        self._submit(("truncate", n))
+        if n == 0:
+            self._frozen = False
+
+    # MARK: - Completion
+
+    def finalize(self, path: str) -> bool:
+        """Write the recording to *path* as a float32 WAV and release resources.
+
+        Blocks until the writer has drained.  Returns False (and writes nothing)
+        if the recording is empty or the writer failed.
+        """
+        if not self._frozen:
+            self.freeze()
+        if self._disk_length == 0:
+            self.discard()
+            return False
+        done = threading.Event()
+        self._submit(("finalize", path, done))
+        self._wait(done)
+        self._thread = None
+        self._queue = None
+        return self._error is None and os.path.exists(path)
+
+    def discard(self) -> None:
+        """Stop the writer (if any) and delete the temporary file."""
+        self._head.clear()
+        self._disk_length = 0
+        self._frozen = False
+        if self._queue is not None:
+            done = threading.Event()
+            self._queue.put(("discard", done))
+            self._wait(done)
+        self._thread = None
+        self._queue = None
+
+    @property
+    def error(self) -> BaseException | None:
+        """The first exception raised by the writer thread, if any."""
+        return self._error
+
+    # MARK: - Writer thread
+
+    def _submit(self, op: tuple) -> None:
+        self._ensure_writer()
+        assert self._queue is not None
+        self._queue.put(op)
+
+    def _wait(self, done: threading.Event) -> None:
+        """Wait for the writer to answer *done*, or to have died without answering."""
+        while not done.wait(0.1):
+            if self._thread is None or not self._thread.is_alive():
+                return
+
+    def _ensure_writer(self) -> None:
+        if self._queue is not None:
+            return
+        # Hidden, and not *.wav, so nothing scanning the dump folder picks it up.
+        fd, self._path = tempfile.mkstemp(
+            prefix=".guitar_tap_session_", suffix=".wav.part", dir=self.directory,
+        )
+        os.close(fd)
+        _live_temp_paths.add(self._path)
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, args=(self._queue, self._path),
+            name="SessionRecorderWriter", daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self, ops: "queue.Queue[tuple]", path: str) -> None:
+        f = None
+        written = 0
+        op: tuple = ("",)
+        try:
+            try:
+                f = open(path, "w+b")
+                f.write(float32_wav_header(0, self.sample_rate))
+            except BaseException as exc:  # e.g. the dump folder vanished after mkstemp
+                if self._error is None:
+                    self._error = exc
+                # Keep draining so finalize()/discard() are answered, not left waiting.
+                while op[0] not in ("finalize", "discard"):
+                    op = ops.get()
+                return
+            while True:
+                op = ops.get()
+                kind = op[0]
+                try:
+                    if kind == "write":
+                        if self._error is None:
+                            f.write(op[1].tobytes())
+                            written += op[1].size
+                    elif kind == "truncate":
+                        written = min(written, op[1])
+                        f.truncate(WAV_HEADER_SIZE + written * _BYTES_PER_SAMPLE)
+                        f.seek(0, os.SEEK_END)
+                    elif kind == "finalize":
+                        f.seek(0)
+                        f.write(float32_wav_header(written, self.sample_rate))
+                        f.close()
+                        if self._error is None:
+                            _move(path, op[1])
+                        return
+                    elif kind == "discard":
+                        return
+                except BaseException as exc:  # keep draining; surfaced via .error
+                    if self._error is None:
+                        self._error = exc
+                    if kind == "finalize":
+                        return
+        finally:
+            if f is not None and not f.closed:
+                f.close()
+            if os.path.exists(path):
+                os.remove(path)
+            _live_temp_paths.discard(path)
+            if op[0] in ("finalize", "discard"):
+                op[-1].set()
+
+
+def _move(src: str, dst: str) -> None:
+    """Rename *src* to *dst*; copy + delete when they are on different filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(src, dst)
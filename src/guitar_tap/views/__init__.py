@@ -5,7 +5,17 @@ Sub-packages:
   shared/       → Views/Shared/   — reusable widgets
   measurements/ → Views/Measurements/ — measurement list / detail / export
   utilities/    → Views/Utilities/    — settings, file I/O, display constants
+
+``MainWindow`` is imported on first access (PEP 562), so importing a view-layer
+helper module (AppSettings, the measurement library) does not build the main
+window's module graph — batch-analysis workers and tests stay light.
 """
-from .tap_tone_analysis_view import MainWindow
 
 __all__ = ["MainWindow"]
+
+
+def __getattr__(name: str):
+    if name == "MainWindow":
+        from .tap_tone_analysis_view import MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -15,6 +15,7 @@ from models.analysis_display_mode import AnalysisDisplayMode
 from models.tap_display_settings import TapDisplaySettings as _tds
 from PySide6 import QtCore, QtGui, QtWidgets
 from views import peak_annotations as fft_a
+from views.spectrum_line_decimation import decimate_for_view
 
 
 class _SceneMouseReleaseFilter(QtCore.QObject):
@@ -484,6 +485,10 @@ class FftCanvas(pg.PlotWidget):
         self.fft_line: pg.PlotDataItem = self.plot(
             [], [], pen=pg.mkPen("r", width=1)
         )
+        # Full-resolution arrays behind fft_line; the line itself shows only their
+        # viewport decimation (see _redraw_fft_line).  None while the line is clear.
+        self._line_freqs: "npt.NDArray | None" = None
+        self._line_mags: "npt.NDArray | None" = None
 
         # Peak scatter points
         self.points: pg.ScatterPlotItem = pg.ScatterPlotItem(
@@ -568,6 +573,9 @@ class FftCanvas(pg.PlotWidget):
         self.scene().sigMouseMoved.connect(self._on_mouse_moved)
 
         self.getPlotItem().vb.sigXRangeChanged.connect(self._refresh_peaks_for_viewport)
+        # The spectrum line is decimated to the viewport: redo it when that changes.
+        self.getPlotItem().vb.sigXRangeChanged.connect(self._redraw_fft_line)
+        self.getPlotItem().vb.sigResized.connect(self._redraw_fft_line)
 
         # Initialise mode bands for the saved guitar type
         self.set_guitar_type_bands(guitar_type_str)
@@ -1519,7 +1527,7 @@ class FftCanvas(pg.PlotWidget):
             self._reposition_comparison_legend()
 
         # Clear the main spectrum line — only comparison curves should be visible.
-        self.fft_line.setData([], [])
+        self._set_fft_line(None, None)
         self.points.setData(x=[], y=[])
 
         self._locked_series_index = 0
@@ -1658,7 +1666,7 @@ class FftCanvas(pg.PlotWidget):
         # Mirrors Swift SpectrumView: spectrumLineContent is excluded from the
         # chart entirely when isReviewingMaterialPhase is true.
         if self.analyzer.material_tap_phase.is_reviewing:
-            self.fft_line.setData([], [])
+            self._set_fft_line(None, None)
 
         for label, (r, g, b), freq_list, mag_list in spectra:
             freq_arr = np.array(freq_list, dtype=np.float64)
@@ -1829,10 +1837,10 @@ class FftCanvas(pg.PlotWidget):
         )
         if not is_user_comparison and not is_reviewing:
             if np.any(mag_db):
-                self.fft_line.setData(freq_axis, mag_db)
+                self._set_fft_line(freq_axis, mag_db)
             elif mag_db is not None and len(mag_db) == 0:
                 # Blank spectrum during device-change settle — clear the line.
-                self.fft_line.setData([], [])
+                self._set_fft_line(None, None)
         if self.analyzer._auto_scale_db and np.any(mag_db):
             valid = mag_db[(mag_db > -100) & (mag_db < 20)]
             if valid.size:
@@ -1847,6 +1855,35 @@ class FftCanvas(pg.PlotWidget):
                     new_min, new_max = center - 10.0, center + 10.0
                 self.setYRange(new_min, new_max, padding=0)
 
+    def _set_fft_line(self, freqs, mag_db) -> None:
+        """Show (*freqs*, *mag_db*) on the spectrum line; None clears it.
+
+        Python-only.  The arrays are kept at full resolution and the line is
+        given only their decimation to the current viewport (_redraw_fft_line),
+        so per-frame drawing cost follows the plot width, not the FFT size.
+        """
+        if freqs is None or mag_db is None:
+            self._line_freqs = self._line_mags = None
+            self.fft_line.setData([], [])
+            return
+        self._line_freqs = np.asarray(freqs)
+        self._line_mags = np.asarray(mag_db)
+        self._redraw_fft_line()
+
+    def _redraw_fft_line(self, *_args) -> None:
+        """Re-decimate the spectrum line for the current x-range and plot width.
+
+        Connected to ViewBox.sigXRangeChanged and sigResized; see
+        views/spectrum_line_decimation.py.
+        """
+        if self._line_freqs is None:
+            return
+        vb = self.getPlotItem().vb
+        x0, x1 = vb.viewRange()[0]
+        pixels = vb.width() * self.devicePixelRatioF()
+        freqs, mags = decimate_for_view(self._line_freqs, self._line_mags, x0, x1, pixels)
+        self.fft_line.setData(freqs, mags)
+
     # ── find_peaks: thin wrapper that delegates to analyzer ───────────────────
 
     def find_peaks(self, mag_y_db):
@@ -1855,7 +1892,7 @@ class FftCanvas(pg.PlotWidget):
         Returns (triggered, peaks) for call sites that need the return value.
         The analyzer emits peaksChanged, which is forwarded to FftCanvas.peaksChanged.
         """
-        return self.analyzer.find_peaks(mag_y_db, list(self.analyzer.freq))
+        return self.analyzer.find_peaks(mag_y_db, self.analyzer.freq)
 
     # ------------------------------------------------------------------ #
     # FFT frame handler (called from proc_thread signal)
@@ -0,0 +1,66 @@
+"""
+Background import of ``.guitartap`` files.
+
+Python-only.  ``import_measurements_from_data`` (mirrors Swift
+importMeasurements(from:)) parses the whole file and decodes every record —
+``TapToneMeasurement.from_dict`` with its peak healing — serially on the GUI
+thread, which froze the app for a multi-hundred-measurement backup.
+
+``MeasurementImportWorker`` runs ``decode_measurements``
+(utilities/measurement_decoding.py — process-pool decode for large arrays) on a
+background thread and delivers ``progress(done, total)`` and
+``finished(measurements)`` / ``failed(message)`` on the receiver's thread; the
+caller then merges the result with ``add_imported_measurements`` — one append,
+one library write.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from PySide6 import QtCore
+
+from utilities.measurement_decoding import ImportCancelled, decode_measurements
+
+
+class MeasurementImportWorker(QtCore.QObject):
+    """Runs ``decode_measurements`` on a background thread."""
+
+    progress: QtCore.Signal = QtCore.Signal(int, int)
+    finished: QtCore.Signal = QtCore.Signal(object)   # list[TapToneMeasurement]
+    failed: QtCore.Signal = QtCore.Signal(str)
+
+    def __init__(self, data: bytes, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._data = data
+        self._cancelled = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="MeasurementImport", daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Abandon the import; neither ``finished`` nor ``failed`` is emitted."""
+        self._cancelled.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the worker thread has exited.  False on timeout."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        return True
+
+    def _run(self) -> None:
+        try:
+            measurements = decode_measurements(
+                self._data, progress=self.progress.emit, cancelled=self._cancelled,
+            )
+        except ImportCancelled:
+            return
+        except Exception as exc:  # surfaced via failed(); never kills the thread silently
+            if not self._cancelled.is_set():
+                self.failed.emit(str(exc))
+            return
+        if not self._cancelled.is_set():
+            self.finished.emit(measurements)
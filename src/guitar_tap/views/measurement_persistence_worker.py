@@ -0,0 +1,166 @@
+"""
+Background persistence of the measurement library.
+
+Python-only.  Swift saves ``savedMeasurements`` through SwiftData off the main
+actor; the Python port serialised and wrote the library synchronously on the
+Qt main thread from every mutation (TapToneAnalyzerMeasurementManagementMixin.
+_persist_measurements), so a large library stalled the UI on each save, rename
+or delete.
+
+``MeasurementPersistenceWorker`` owns one writer thread.  ``submit`` hands it a
+snapshot of the list (a tuple — the records themselves are never mutated in
+place: edits go through ``TapToneMeasurement.with_``) and returns at once.
+Submissions arriving within ``COALESCE_SECONDS`` of each other are coalesced:
+only the newest snapshot is written, once, and the store's identity diff turns
+it into a journal entry or a single rewrite.  Every write reports back through
+the ``persisted(ok, message)`` signal, delivered on the receiver's thread.
+
+``flush()`` blocks until everything submitted is on disk; ``close()`` flushes
+and stops the thread, after which submissions are written synchronously.  The
+main window closes the worker on exit, and an ``atexit`` hook covers every
+other way out of the process.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+
+from PySide6 import QtCore
+
+from guitar_tap.utilities.logging import gt_log
+
+
+class MeasurementPersistenceWorker(QtCore.QObject):
+    """Writes measurement-library snapshots on a background thread, newest wins."""
+
+    # (ok, message) after each write; message is the error text when ok is False.
+    persisted: QtCore.Signal = QtCore.Signal(bool, str)
+
+    # Quiet period that ends a burst of submissions (bulk delete, rapid renames).
+    COALESCE_SECONDS: float = 0.05
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._cond = threading.Condition()
+        self._pending: tuple | None = None
+        self._pending_rewrite: bool = False
+        self._last_submit: float = 0.0
+        self._writing: bool = False
+        self._flushing: int = 0
+        self._closed: bool = False
+        self._thread: threading.Thread | None = None
+
+    # MARK: - Producer side (main thread)
+
+    def submit(self, measurements: list, rewrite: bool = False) -> None:
+        """Queue *measurements* for writing; replaces any snapshot not yet written.
+
+        ``rewrite=True`` forces a full rewrite of the library (sticky until the
+        coalesced write happens).
+        """
+        snapshot = tuple(measurements)
+        with self._cond:
+            if not self._closed:
+                self._pending = snapshot
+                self._pending_rewrite = self._pending_rewrite or rewrite
+                self._last_submit = time.monotonic()
+                self._ensure_thread()
+                self._cond.notify_all()
+                return
+        # Closed (application exit): nothing left to hand off to — write inline.
+        self._write(snapshot, rewrite)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every submitted snapshot is written.  False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                while self._pending is not None or self._writing:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+            finally:
+                self._flushing -= 1
+        return True
+
+    def close(self) -> None:
+        """Flush, then stop the writer thread.  Idempotent."""
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    @property
+    def is_idle(self) -> bool:
+        with self._cond:
+            return self._pending is None and not self._writing
+
+    # MARK: - Writer thread
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="MeasurementPersistence", daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                # Coalesce: wait out the burst unless someone is waiting on us.
+                while not self._closed and not self._flushing:
+                    quiet = self._last_submit + self.COALESCE_SECONDS - time.monotonic()
+                    if quiet <= 0:
+                        break
+                    self._cond.wait(quiet)
+                snapshot, rewrite = self._pending, self._pending_rewrite
+                self._pending, self._pending_rewrite = None, False
+                self._writing = True
+            try:
+                self._write(snapshot, rewrite)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+    def _write(self, snapshot: tuple, rewrite: bool) -> None:
+        from views import tap_analysis_results_view as M
+        try:
+            save = M.save_all_measurements if rewrite else M.save_measurements
+            ok = save(list(snapshot))
+            message = "" if ok else "The measurement library could not be written (see log)."
+        except Exception as exc:  # surfaced via persisted(); never kills the thread
+            gt_log(f"Failed to save measurements: {exc}")
+            ok, message = False, str(exc)
+        self.persisted.emit(ok, message)
+
+
+# MARK: - Process-wide worker
+
+_worker: MeasurementPersistenceWorker | None = None
+
+
+def persistence_worker() -> MeasurementPersistenceWorker:
+    """The worker every library write goes through (created on first use)."""
+    global _worker
+    if _worker is None:
+        _worker = MeasurementPersistenceWorker()
+        atexit.register(_worker.close)
+    return _worker
+
+
+def flush_pending_saves(timeout: float | None = None) -> bool:
+    """Wait for queued library writes, if the worker exists.  False on timeout."""
+    return _worker.flush(timeout) if _worker is not None else True
@@ -0,0 +1,464 @@
+"""
+SQLite measurement library — optional alternative to the JSON library file.
+
+Python-only (Swift keeps its library in SwiftData).  Selected by the
+``storage/measurement_library`` setting (AppSettings.measurement_library_backend);
+the default remains saved_measurements.json (views/measurement_store.py).
+
+One row per saved measurement:
+
+* summary columns — one per ``MeasurementSummary`` field (name, date, type,
+  tap-tone ratio, the definitive Air/Top/Back frequencies, the plate/brace
+  moduli, …), the list-facing ones indexed.  ``summaries()`` reads them without
+  decoding anything else;
+* ``record`` — the canonical ``TapToneMeasurement.to_dict`` JSON with every
+  snapshot's ``frequenciesData`` / ``magnitudesData`` removed;
+* ``spectra`` — a BLOB holding those removed arrays (``frequencyAxis`` for
+  uniform axes), keyed by snapshot path.
+
+Loading decodes nothing: it returns deferred measurements
+(``TapToneMeasurement.deferred``) carrying their summary, exactly as the JSON
+library does with a current summary index, so the Saved Measurements list is
+built from the summary columns alone.  The first read of any other field fetches
+and decodes that row's ``record``; each snapshot's arrays stay deferred
+(SpectrumSnapshot.defer_spectrum) until one of its spectra is read — when it is
+opened, compared or exported.  Rows written before the summary columns existed
+are decoded once and backfilled.
+
+JSON library: the first load of an empty database imports
+saved_measurements.json (with its journal replayed); the JSON file is left in
+place.  ``meta`` records the JSON library's size and mtime at the last point the
+two were in sync (``jsonState``) and whether this table changed since
+(``sqliteChanged``).  A later load that finds the JSON library changed — it was
+the backend meanwhile — re-imports it when the table is unchanged, and warns
+that the libraries have diverged when both changed.  Switching backends
+(views/tap_analysis_results_view.switch_measurement_library_backend) writes the
+current list into the target in full, so neither side is left stale.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Iterator
+
+from guitar_tap.utilities.logging import gt_log
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS measurements (
+    key              INTEGER PRIMARY KEY,
+    position         INTEGER NOT NULL,
+    id               TEXT NOT NULL,
+    timestamp        TEXT NOT NULL,
+    name             TEXT,
+    measurement_type TEXT,
+    guitar_type      TEXT,
+    air_hz           REAL,
+    top_hz           REAL,
+    back_hz          REAL,
+    e_long_gpa       REAL,
+    e_cross_gpa      REAL,
+    g_lc_gpa         REAL,
+    record           TEXT NOT NULL,
+    spectra          BLOB
+);
+-- Summary columns added after the first release go in _ADDED_COLUMNS.
+CREATE INDEX IF NOT EXISTS measurements_position         ON measurements(position);
+CREATE INDEX IF NOT EXISTS measurements_timestamp        ON measurements(timestamp);
+CREATE INDEX IF NOT EXISTS measurements_name             ON measurements(name);
+CREATE INDEX IF NOT EXISTS measurements_measurement_type ON measurements(measurement_type);
+CREATE INDEX IF NOT EXISTS measurements_guitar_type      ON measurements(guitar_type);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Columns added to existing databases by ALTER TABLE.  summary_version is NULL
+# on rows written before them, which load() backfills.
+_ADDED_COLUMNS = (
+    ("notes", "TEXT"), ("is_comparison", "INTEGER"), ("comparison_count", "INTEGER"),
+    ("has_spectrum", "INTEGER"), ("peak_count", "INTEGER"), ("decay_time", "REAL"),
+    ("tap_tone_ratio", "REAL"), ("summary_version", "INTEGER"),
+)
+SUMMARY_COLUMNS_VERSION = 1
+
+# Summary column → MeasurementSummary field (content_hash has no column: rows
+# are addressed by key, not by digest).
+_SUMMARY_FIELDS = {
+    "id": "id", "timestamp": "timestamp", "name": "measurement_name", "notes": "notes",
+    "measurement_type": "measurement_type", "guitar_type": "guitar_type",
+    "is_comparison": "is_comparison", "comparison_count": "comparison_count",
+    "has_spectrum": "has_spectrum", "peak_count": "peak_count",
+    "decay_time": "decay_time", "tap_tone_ratio": "tap_tone_ratio",
+    "air_hz": "air_hz", "top_hz": "top_hz", "back_hz": "back_hz",
+    "e_long_gpa": "e_long_gpa", "e_cross_gpa": "e_cross_gpa", "g_lc_gpa": "g_lc_gpa",
+}
+_METADATA_COLUMNS = tuple(_SUMMARY_FIELDS) + ("summary_version",)
+
+_SPECTRUM_KEYS = ("frequenciesData", "frequencyAxis", "magnitudesData")
+_TOP_LEVEL_SNAPSHOTS = ("spectrumSnapshot", "longitudinalSnapshot", "crossSnapshot", "flcSnapshot")
+
+
+# MARK: - Snapshot paths
+
+def _snapshot_dicts(d: dict) -> Iterator[tuple[str, dict]]:
+    """(path, snapshot dict) for every snapshot in an encoded measurement."""
+    for key in _TOP_LEVEL_SNAPSHOTS:
+        if isinstance(d.get(key), dict):
+            yield key, d[key]
+    for list_key in ("tapEntries", "comparisonEntries"):
+        for i, entry in enumerate(d.get(list_key) or []):
+            if isinstance(entry.get("snapshot"), dict):
+                yield f"{list_key}/{i}", entry["snapshot"]
+
+
+def _snapshot_objects(m) -> Iterator[tuple[str, Any]]:
+    """(path, SpectrumSnapshot) for every snapshot of a decoded measurement —
+    the same paths ``_snapshot_dicts`` yields for its encoded form."""
+    for key, attr in zip(_TOP_LEVEL_SNAPSHOTS,
+                         ("spectrum_snapshot", "longitudinal_snapshot", "cross_snapshot", "flc_snapshot")):
+        snap = getattr(m, attr)
+        if snap is not None:
+            yield key, snap
+    for list_key, entries in (("tapEntries", m.tap_entries), ("comparisonEntries", m.comparison_entries)):
+        for i, entry in enumerate(entries or []):
+            yield f"{list_key}/{i}", entry.snapshot
+
+
+# MARK: - Summary columns
+
+def _metadata(m) -> tuple:
+    """The summary column values for one measurement (never touches its spectra)."""
+    from views.measurement_summary_index import summary_of
+
+    s = summary_of(m)
+    return tuple(getattr(s, f) for f in _SUMMARY_FIELDS.values()) + (SUMMARY_COLUMNS_VERSION,)
+
+
+def _summary_from_row(row: tuple):
+    """The MeasurementSummary stored in one row's summary columns (``_SUMMARY_FIELDS`` order)."""
+    from views.measurement_summary_index import MeasurementSummary
+
+    values = dict(zip(_SUMMARY_FIELDS.values(), row))
+    values["is_comparison"] = bool(values["is_comparison"])
+    values["has_spectrum"] = bool(values["has_spectrum"])
+    return MeasurementSummary(**values)
+
+
+def _json_library_state(json_path: str) -> "str | None":
+    """Size and mtime of the JSON library and its journal, or None without a library."""
+    state = []
+    for path in (json_path, os.path.splitext(json_path)[0] + ".journal"):
+        try:
+            st = os.stat(path)
+        except OSError:
+            state.append(None)
+        else:
+            state.append([st.st_size, st.st_mtime_ns])
+    return json.dumps(state) if state[0] is not None else None
+
+
+def _encode_row(m) -> tuple:
+    """Summary column values + (record JSON, spectra BLOB) for one measurement.
+
+    Spectra use snapshot format version 2 (parametric frequency axis): the BLOB is
+    private to this store, and exports re-encode through measurements_to_json.
+    """
+    from models.spectrum_snapshot import SNAPSHOT_FORMAT_PARAMETRIC_AXIS
+
+    d = m.to_dict(SNAPSHOT_FORMAT_PARAMETRIC_AXIS)
+    spectra = {
+        path: {k: snap.pop(k) for k in _SPECTRUM_KEYS if k in snap}
+        for path, snap in _snapshot_dicts(d)
+    }
+    record = json.dumps(d, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    blob = json.dumps(spectra, separators=(",", ":")).encode("ascii")
+    return _metadata(m) + (record, blob)
+
+
+class _SpectraLoader:
+    """Fetches one measurement's spectra BLOB on first use and hands out its arrays."""
+
+    def __init__(self, store: "SqliteMeasurementStore", key: int) -> None:
+        self._store = store
+        self._key = key
+        self._spectra: dict | None = None
+
+    def arrays(self, path: str) -> tuple:
+        from models.spectrum_snapshot import SpectrumSnapshot
+
+        if self._spectra is None:
+            self._spectra = self._store._fetch_spectra(self._key)
+        parts = self._spectra.get(path)
+        if parts is None:
+            gt_log(f"SQLite library: spectrum {path} of row {self._key} is missing")
+            return [], []
+        snap = SpectrumSnapshot.from_dict(parts)
+        return snap.frequencies_array, snap.magnitudes_array
+
+
+class SqliteMeasurementStore:
+    """Measurement library in one SQLite file; same interface as JournaledMeasurementStore."""
+
+    def __init__(self, path: str, legacy_json_path: str | None = None) -> None:
+        self.path = path
+        self.legacy_json_path = legacy_json_path
+        self._lock = threading.RLock()
+        self._db: sqlite3.Connection | None = None
+        # The list as last written (or loaded) and the row key of each element.
+        self._written: list = []
+        self._keys: list[int] = []
+
+    # MARK: - Connection
+
+    def _conn(self) -> sqlite3.Connection:
+        if self._db is None:
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.executescript(_SCHEMA)
+            present = {row[1] for row in db.execute("PRAGMA table_info(measurements)")}
+            with db:
+                for column, kind in _ADDED_COLUMNS:
+                    if column not in present:
+                        db.execute(f"ALTER TABLE measurements ADD COLUMN {column} {kind}")
+            self._db = db
+        return self._db
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _fetch_spectra(self, key: int) -> dict:
+        with self._lock:
+            row = self._conn().execute(
+                "SELECT spectra FROM measurements WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] else {}
+
+    def _meta(self, db: sqlite3.Connection, key: str) -> "str | None":
+        row = db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(db: sqlite3.Connection, key: str, value: str) -> None:
+        db.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    # MARK: - Load
+
+    def load(self, decode: Callable[[dict], Any]) -> list:
+        """Deferred measurements built from the summary columns, in library order.
+
+        Brings in the JSON library first if it changed since the two were last
+        in sync (see the module docstring).
+        """
+        from models.tap_tone_measurement import TapToneMeasurement
+
+        with self._lock:
+            self.reset()
+            db = self._conn()
+            self._sync_with_json_library(db, decode)
+            rows = db.execute(
+                f"SELECT key, {', '.join(_METADATA_COLUMNS)} FROM measurements ORDER BY position"
+            ).fetchall()
+            stale = [key for key, *values in rows if values[-1] != SUMMARY_COLUMNS_VERSION]
+            if stale:
+                self._backfill_summaries(db, stale, decode)
+                rows = db.execute(
+                    f"SELECT key, {', '.join(_METADATA_COLUMNS)} FROM measurements ORDER BY position"
+                ).fetchall()
+        measurements = []
+        for key, *values in rows:
+            summary = _summary_from_row(values[:-1])
+            measurements.append(TapToneMeasurement.deferred(
+                {"id": summary.id, "timestamp": summary.timestamp,
+                 "measurement_name": summary.measurement_name, "notes": summary.notes,
+                 "decay_time": summary.decay_time, "was_healed": False, "_summary": summary},
+                lambda key=key: self._decode_row(key, decode),
+            ))
+        self._written = list(measurements)
+        self._keys = [key for key, *_ in rows]
+        return measurements
+
+    def _decode_row(self, key: int, decode: Callable[[dict], Any]):
+        """Decode one row's record, its spectra deferred until read."""
+        with self._lock:
+            row = self._conn().execute(
+                "SELECT record FROM measurements WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            raise LookupError(f"row {key} is no longer in the SQLite library")
+        m = decode(json.loads(row[0]))
+        loader = _SpectraLoader(self, key)
+        for path, snap in _snapshot_objects(m):
+            snap.defer_spectrum(lambda path=path, loader=loader: loader.arrays(path))
+        return m
+
+    def _backfill_summaries(self, db: sqlite3.Connection, keys: list[int],
+                            decode: Callable[[dict], Any]) -> None:
+        """Fill the summary columns of rows written before they existed."""
+        set_clause = ", ".join(f"{c} = ?" for c in _METADATA_COLUMNS)
+        values = [_metadata(self._decode_row(key, decode)) + (key,) for key in keys]
+        with db:
+            db.executemany(f"UPDATE measurements SET {set_clause} WHERE key = ?", values)
+        gt_log(f"📇 Filled in the summary columns of {len(keys)} SQLite library rows")
+
+    def reset(self) -> None:
+        self._written = []
+        self._keys = []
+
+    # MARK: - JSON library
+
+    def _sync_with_json_library(self, db: sqlite3.Connection, decode: Callable[[dict], Any]) -> None:
+        """Import the JSON library if it changed since the last sync and this table did not."""
+        if not self.legacy_json_path:
+            return
+        state = _json_library_state(self.legacy_json_path)
+        if state is None:
+            return
+        synced = self._meta(db, "jsonState")
+        if synced == state:
+            return
+        if synced is None and self._meta(db, "migrated_from_json") is None:
+            # Never synced: import only into an empty table.
+            if not db.execute("SELECT 1 FROM measurements LIMIT 1").fetchone():
+                self._import_json_library(db, decode, "Migrated")
+            else:
+                with db:
+                    self._set_meta(db, "jsonState", state)
+                    self._set_meta(db, "sqliteChanged", "1")
+            return
+        if synced is not None and self._meta(db, "sqliteChanged") != "1":
+            self._import_json_library(db, decode, "Re-imported")
+            return
+        # Both sides may hold measurements the other lacks.  Keep this table; the
+        # user settles it by switching backends, which writes one into the other.
+        gt_log(f"⚠️ {self.legacy_json_path} changed since it was last in sync with the SQLite "
+               f"measurement library, which has changes of its own: the libraries have "
+               f"diverged.  Keeping the SQLite library; switch backends to write one into the other")
+        with db:
+            self._set_meta(db, "jsonState", state)
+            self._set_meta(db, "sqliteChanged", "1")
+
+    def _import_json_library(self, db: sqlite3.Connection, decode: Callable[[dict], Any],
+                             verb: str) -> None:
+        from views.measurement_store import JournaledMeasurementStore
+
+        assert self.legacy_json_path is not None
+        legacy = JournaledMeasurementStore(self.legacy_json_path).load(decode)
+        if self._replace_rows(db, legacy):
+            gt_log(f"📦 {verb} {len(legacy)} measurements from {self.legacy_json_path} to SQLite")
+
+    def _replace_rows(self, db: sqlite3.Connection, measurements: list) -> bool:
+        """Make the table hold exactly *measurements*, in sync with the JSON library."""
+        try:
+            rows = [(pos,) + _encode_row(m) for pos, m in enumerate(measurements)]
+            with db:
+                db.execute("DELETE FROM measurements")
+                keys = [db.execute(self._insert_sql(), row).lastrowid for row in rows]
+                self._mark_json_synced(db)
+        except (sqlite3.Error, OSError) as exc:
+            gt_log(f"Failed to save measurements: {exc}")
+            return False
+        self._written = list(measurements)
+        self._keys = keys
+        return True
+
+    def _mark_json_synced(self, db: sqlite3.Connection) -> None:
+        if self.legacy_json_path:
+            self._set_meta(db, "migrated_from_json", self.legacy_json_path)
+            state = _json_library_state(self.legacy_json_path)
+            if state is not None:
+                self._set_meta(db, "jsonState", state)
+        self._set_meta(db, "sqliteChanged", "0")
+
+    def replace_all(self, measurements: list) -> bool:
+        """Replace the whole table with *measurements* (switching to this backend).
+
+        The JSON library is taken to hold the same list.  Returns False if the
+        transaction failed (the table is unchanged)."""
+        with self._lock:
+            return self._replace_rows(self._conn(), measurements)
+
+    def mark_json_synced(self) -> None:
+        """Record that the JSON library now holds this table's list (switching away)."""
+        with self._lock:
+            db = self._conn()
+            with db:
+                self._mark_json_synced(db)
+
+    def has_unsynced_changes(self) -> bool:
+        """True if this table changed since the JSON library last matched it."""
+        with self._lock:
+            return self._meta(self._conn(), "sqliteChanged") == "1"
+
+    # MARK: - Save
+
+    @staticmethod
+    def _insert_sql() -> str:
+        columns = ("position",) + _METADATA_COLUMNS + ("record", "spectra")
+        return (f"INSERT INTO measurements ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))})")
+
+    def save(self, measurements: list, encode: "Callable[[list], str] | None" = None) -> bool:
+        """Sync the table with *measurements*: insert new objects, delete dropped
+        ones and renumber positions.  Unchanged measurements are not re-encoded.
+        Returns False if the transaction failed (the table is unchanged)."""
+        return self._sync(measurements, reencode=False)
+
+    def rewrite(self, measurements: list, encode: "Callable[[list], str] | None" = None) -> bool:
+        """Like save(), but re-encode every row (e.g. after an in-memory heal)."""
+        return self._sync(measurements, reencode=True)
+
+    def _sync(self, measurements: list, reencode: bool) -> bool:
+        with self._lock:
+            old_keys = {id(m): key for m, key in zip(self._written, self._keys)}
+            kept: list[tuple[int, int, Any]] = []   # (position, key, measurement)
+            new: list[tuple[int, Any]] = []
+            for pos, m in enumerate(measurements):
+                key = old_keys.pop(id(m), None)
+                if key is None:
+                    new.append((pos, m))
+                else:
+                    kept.append((pos, key, m))
+            old_positions = {key: pos for pos, key in enumerate(self._keys)}
+            try:
+                # Encode before deleting: a replaced measurement may share (deferred)
+                # snapshots with the row it replaces.
+                inserts = [(pos,) + _encode_row(m) for pos, m in new]
+                updates = [(_encode_row(m), key) for _, key, m in kept] if reencode else []
+                moves = [(pos, key) for pos, key, _ in kept if old_positions.get(key) != pos]
+                db = self._conn()
+                with db:
+                    db.executemany("DELETE FROM measurements WHERE key = ?",
+                                   [(key,) for key in old_keys.values()])
+                    db.executemany("UPDATE measurements SET position = ? WHERE key = ?", moves)
+                    set_clause = ", ".join(f"{c} = ?" for c in _METADATA_COLUMNS + ("record", "spectra"))
+                    db.executemany(f"UPDATE measurements SET {set_clause} WHERE key = ?",
+                                   [values + (key,) for values, key in updates])
+                    keys_by_pos = {pos: key for pos, key, _ in kept}
+                    for values in inserts:
+                        cursor = db.execute(self._insert_sql(), values)
+                        keys_by_pos[values[0]] = cursor.lastrowid
+                    if old_keys or moves or updates or inserts:
+                        self._set_meta(db, "sqliteChanged", "1")
+            except (sqlite3.Error, OSError) as exc:
+                gt_log(f"Failed to save measurements: {exc}")
+                return False
+            self._written = list(measurements)
+            self._keys = [keys_by_pos[pos] for pos in range(len(measurements))]
+            return True
+
+    # MARK: - Queries
+
+    def summaries(self) -> list:
+        """The MeasurementSummary of every row in library order, from the summary
+        columns only (what load() builds its deferred measurements from)."""
+        with self._lock:
+            rows = self._conn().execute(
+                f"SELECT {', '.join(_SUMMARY_FIELDS)} FROM measurements ORDER BY position"
+            ).fetchall()
+        return [_summary_from_row(row) for row in rows]
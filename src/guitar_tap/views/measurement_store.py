@@ -0,0 +1,312 @@
+"""
+Journaled measurement library store.
+
+Python-only.  Swift persists ``savedMeasurements`` through SwiftData / a single
+encode of the array; the Python port rewrote the whole of
+``saved_measurements.json`` (every spectrum, ``indent=2``) on every save, rename
+or delete.  ``JournaledMeasurementStore`` keeps that file as the canonical
+library — still a plain ``.guitartap`` JSON array — and records each change as
+one line appended to a sidecar journal, so a save costs O(one measurement):
+
+  saved_measurements.json     base snapshot, ``measurements_to_json`` form
+  saved_measurements.journal  JSON Lines:
+      {"base": "<sha1 of the base file>"}          header
+      {"op": "append",  "measurements": [{…}, …]}
+      {"op": "replace", "index": i, "measurement": {…}}
+      {"op": "delete",  "index": i}
+
+Loading replays the journal over the base.  Once the journal outgrows the base
+(or a change is not a single append/replace/delete) the library is compacted:
+the full array is written to the base file and the journal removed.  The header
+digest ties a journal to the base it was written against, so a crash between
+the base rename and the journal removal cannot apply the journal twice; a torn
+last line (crash mid-append) is ignored.
+
+A summary index (saved_measurements.index.json, views/measurement_summary_index.py)
+is kept beside the library and rewritten after each write; when it matches the
+files on disk, ``load`` returns deferred measurements built from it instead of
+decoding every record.
+
+The change is inferred by comparing the saved list with the list last written,
+element by element by identity: ``TapToneMeasurement`` edits go through
+``with_``, which returns a new object, so the mutators in
+TapToneAnalyzerMeasurementManagementMixin need no bookkeeping of their own.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any, Callable
+
+from guitar_tap.utilities.logging import gt_log
+from views.measurement_summary_index import (
+    DeferredRecords,
+    index_path,
+    read_index,
+    summary_of,
+    write_index,
+)
+
+# Never compact below this journal size, however small the base file is.
+_MIN_COMPACT_BYTES = 1 << 20
+
+
+def _encode_line(entry: dict) -> str:
+    return json.dumps(entry, ensure_ascii=False, sort_keys=True, separators=(",", ":")) + "\n"
+
+
+class JournaledMeasurementStore:
+    """Base JSON array plus an append-only change journal for one library path."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.journal_path = os.path.splitext(path)[0] + ".journal"
+        self.index_path = index_path(path)
+        # Snapshot encoding for journaled records (TapToneMeasurement.to_dict);
+        # set by the caller to match its *encode*.
+        self.format_version: int = 1
+        # The list as last written (or loaded) — compared by identity on save().
+        self._written: list = []
+        self._base_digest: str | None = None
+        self._base_size: int = 0
+        self._journal_size: int = 0
+
+    # MARK: - Load
+
+    def load(self, decode: Callable[[dict], Any]) -> list:
+        """The library's measurements: deferred ones from the summary index when it
+        is current, otherwise read the base file, replay the journal, and decode
+        every record (then write a fresh index)."""
+        self.reset()
+        measurements = self._load_from_index(decode)
+        if measurements is None:
+            records = self._load_records()
+            measurements = [decode(d) for d in records]
+            if records:
+                self._write_index(measurements, {id(m): d for m, d in zip(measurements, records)})
+        self._written = list(measurements)
+        return measurements
+
+    def reset(self) -> None:
+        """Forget the on-disk state, so the next save() rewrites the library."""
+        self._written = []
+        self._base_digest = None
+        self._base_size = 0
+        self._journal_size = 0
+
+    def _load_records(self) -> list[dict]:
+        records, self._base_digest, self._base_size, self._journal_size = self._read_records()
+        return records
+
+    def _read_records(self, repair: bool = True) -> tuple[list[dict], "str | None", int, int]:
+        """(records, base digest, base size, applied journal size) as on disk now.
+
+        With ``repair=False`` a torn journal tail is skipped but left in place —
+        for readers that do not own the library state (deferred records).
+        """
+        if not os.path.exists(self.path):
+            return [], None, 0, 0
+        with open(self.path, "rb") as f:
+            data = f.read()
+        raw = json.loads(data)
+        records = raw if isinstance(raw, list) else [raw]
+        digest = hashlib.sha1(data).hexdigest()
+        journal_size = 0
+        if os.path.exists(self.journal_path):
+            journal_size = self._replay(records, digest, repair)
+        return records, digest, len(data), journal_size
+
+    def _replay(self, records: list[dict], base_digest: str, repair: bool) -> int:
+        with open(self.journal_path, "rb") as f:
+            lines = f.read().splitlines(keepends=True)
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except ValueError:
+            header = {}
+        if header.get("base") != base_digest:
+            # Written against an earlier base (compaction finished, journal removal
+            # did not) — everything in it is already in the base file.
+            gt_log("📒 Ignoring stale measurements journal")
+            return 0
+        applied = len(lines[0])
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+                op = entry.get("op")
+                if op == "append":
+                    records.extend(entry["measurements"])
+                elif op == "replace":
+                    records[entry["index"]] = entry["measurement"]
+                elif op == "delete":
+                    del records[entry["index"]]
+            except (ValueError, KeyError, IndexError, TypeError):
+                # Torn last record (crash mid-append): drop the tail so the next
+                # append starts on a clean line.
+                if repair:
+                    gt_log("📒 Measurements journal ends in a torn record — ignoring the tail")
+                    with open(self.journal_path, "r+b") as f:
+                        f.truncate(applied)
+                break
+            applied += len(line)
+        return applied
+
+    # MARK: - Summary index
+
+    def _library_state(self) -> dict:
+        """The index's fingerprint of the files it describes."""
+        def stat(path: str) -> tuple[int, int]:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return 0, 0
+            return st.st_size, st.st_mtime_ns
+
+        base_size, base_mtime = stat(self.path)
+        journal_size, journal_mtime = stat(self.journal_path)
+        return {"base": self._base_digest, "journal": self._journal_size,
+                "baseSize": base_size, "baseMtimeNs": base_mtime,
+                "journalSize": journal_size, "journalMtimeNs": journal_mtime}
+
+    def _load_from_index(self, decode: Callable[[dict], Any]) -> "list | None":
+        loaded = read_index(self.index_path)
+        if loaded is None or not os.path.exists(self.path):
+            return None
+        library, summaries = loaded
+        self._base_digest = library.get("base")
+        self._journal_size = library.get("journal", 0)
+        if self._library_state() != library:
+            self.reset()
+            return None
+        self._base_size = library["baseSize"]
+        records = DeferredRecords(lambda: self._read_records(repair=False)[0],
+                                  decode, len(summaries))
+        return records.measurements(summaries)
+
+    def _write_index(self, measurements: list, records: "dict[int, dict] | None" = None) -> None:
+        """Rewrite the index for *measurements*; only unsummarised ones are summarised.
+
+        *records* maps ``id(m)`` to the record just encoded for *m*, if any (it
+        supplies the content hash without encoding *m* again).
+        """
+        records = records or {}
+        try:
+            summaries = []
+            for m in measurements:
+                summary = summary_of(m, records.get(id(m)))
+                if summary.content_hash is None:
+                    summary = summary_of(m, m.to_dict(self.format_version))
+                summaries.append(summary)
+        except Exception as exc:  # the index is an optimisation — never fail a save
+            gt_log(f"Failed to summarise measurements for the index: {exc}")
+            try:
+                os.remove(self.index_path)
+            except OSError:
+                pass
+            return
+        write_index(self.index_path, self._library_state(), summaries)
+
+    # MARK: - Save
+
+    def save(self, measurements: list, encode: Callable[[list], str]) -> bool:
+        """Persist *measurements*, journaling the change when it is a single
+        append, replace or delete relative to the last write; otherwise rewrite.
+
+        *encode* is ``measurements_to_json`` — used only for a full rewrite.
+        Returns False if nothing could be written.
+        """
+        entry = self._diff(measurements)
+        if entry is None:
+            return True
+        if (entry.get("op") == "rewrite"
+                or self._base_digest is None
+                or self._journal_size > max(self._base_size, _MIN_COMPACT_BYTES)):
+            return self.rewrite(measurements, encode)
+        try:
+            self._append(entry)
+        except OSError as exc:
+            gt_log(f"Failed to journal measurements change ({exc}) — rewriting library")
+            return self.rewrite(measurements, encode)
+        self._written = list(measurements)
+        if entry["op"] == "append":
+            encoded = dict(zip(map(id, measurements[-len(entry["measurements"]):]),
+                               entry["measurements"]))
+        elif entry["op"] == "replace":
+            encoded = {id(measurements[entry["index"]]): entry["measurement"]}
+        else:
+            encoded = {}
+        self._write_index(measurements, encoded)
+        return True
+
+    def rewrite(self, measurements: list, encode: Callable[[list], str]) -> bool:
+        """Write the full array to the base file and drop the journal (compaction).
+
+        Returns False (library unchanged on disk) if the write failed.
+        """
+        data = encode(measurements).encode("utf-8")
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+            self._base_digest = hashlib.sha1(data).hexdigest()
+            self._base_size = len(data)
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            self._journal_size = 0
+        except OSError as exc:
+            gt_log(f"Failed to save measurements: {exc}")
+            return False
+        self._written = list(measurements)
+        self._write_index(measurements)
+        return True
+
+    def _append(self, entry: dict) -> None:
+        text = _encode_line(entry)
+        if self._journal_size == 0:
+            text = _encode_line({"base": self._base_digest}) + text
+            mode = "w"
+        else:
+            mode = "a"
+        with open(self.journal_path, mode, encoding="utf-8") as f:
+            f.write(text)
+        self._journal_size += len(text.encode("utf-8"))
+
+    def _diff(self, new: list) -> "dict | None":
+        """The journal entry turning the last-written list into *new*, None if
+        they are identical, or ``{"op": "rewrite"}``."""
+        old = self._written
+        n_old, n_new = len(old), len(new)
+        if n_new >= n_old:
+            changed = [i for i in range(n_old) if new[i] is not old[i]]
+            if not changed:
+                if n_new == n_old:
+                    return None
+                return {"op": "append", "measurements": [m.to_dict(self.format_version) for m in new[n_old:]]}
+            if len(changed) == 1 and n_new == n_old:
+                i = changed[0]
+                return {"op": "replace", "index": i, "measurement": new[i].to_dict(self.format_version)}
+        elif n_new == n_old - 1 and n_new > 0:
+            i = next((i for i in range(n_new) if new[i] is not old[i]), n_new)
+            if all(new[j] is old[j + 1] for j in range(i, n_new)):
+                return {"op": "delete", "index": i}
+        return {"op": "rewrite"}
+
+
+# MARK: - Per-path store registry
+
+_stores: dict[str, Any] = {}
+
+
+def store_for(path: str, factory: Callable[[str], Any] = JournaledMeasurementStore):
+    """The store for library *path* (one per path, so tests' redirected library
+    and the user's library never share journal state).
+
+    *factory* builds the store on first use — JournaledMeasurementStore, or a
+    SqliteMeasurementStore for the SQLite library.
+    """
+    store = _stores.get(path)
+    if store is None:
+        store = _stores[path] = factory(path)
+    return store
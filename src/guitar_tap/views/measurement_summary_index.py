@@ -0,0 +1,288 @@
+"""
+Measurement library summary index.
+
+Python-only.  Opening the library used to decode every record into a full
+``TapToneMeasurement`` although the Saved Measurements list (MeasurementsDialog,
+MeasurementRowView) only shows a name, a date, a type, the tap-tone ratio and a
+few headline numbers.  ``JournaledMeasurementStore`` now keeps a sidecar beside
+the library:
+
+  saved_measurements.index.json
+      {"version": 1,
+       "library": {"base": "<sha1>", "journal": <bytes replayed>,
+                   "baseSize": …, "baseMtimeNs": …,
+                   "journalSize": …, "journalMtimeNs": …},
+       "summaries": [{…MeasurementSummary…}, …]}
+
+one ``MeasurementSummary`` per record, in library order.  It is rewritten after
+every successful library write; only measurements not summarised before (new
+or edited — edits go through ``TapToneMeasurement.with_``, so a new object) are
+summarised again.  ``library`` records the size and mtime of the base file and
+journal it describes: if either changed behind the index's back (crash between
+the two writes, torn journal tail, another build writing the library) the index
+is ignored and the library loaded in full.
+
+With a valid index the store returns *deferred* measurements
+(``TapToneMeasurement.deferred``) carrying the summary and the cheap identity
+fields; the first read of any other field parses the library once and decodes
+that one record.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, fields, replace
+from typing import Any, Callable
+
+from guitar_tap.utilities.logging import gt_log
+
+SUMMARY_INDEX_VERSION = 1
+
+
+# MARK: - Summary
+
+@dataclass(frozen=True)
+class MeasurementSummary:
+    """What the measurements list needs of one saved measurement."""
+
+    id: str
+    timestamp: str
+    measurement_name: str | None = None
+    notes: str | None = None
+    # Resolved from the snapshots (TapToneMeasurement.resolved_measurement_type).
+    measurement_type: str | None = None
+    guitar_type: str | None = None
+    is_comparison: bool = False
+    comparison_count: int = 0
+    has_spectrum: bool = False
+    peak_count: int = 0
+    decay_time: float | None = None
+    tap_tone_ratio: float | None = None
+    # Definitive Air/Top/Back (guitar measurements).
+    air_hz: float | None = None
+    top_hz: float | None = None
+    back_hz: float | None = None
+    # Plate/brace headline properties.
+    e_long_gpa: float | None = None
+    e_cross_gpa: float | None = None
+    g_lc_gpa: float | None = None
+    # sha1 of the stored record (record_digest); None until the record is written.
+    content_hash: str | None = None
+
+    @property
+    def is_comparable(self) -> bool:
+        """Selectable in compare mode: has a spectrum and is not itself a comparison."""
+        return self.has_spectrum and not self.is_comparison
+
+    @property
+    def title(self) -> str:
+        """The row title — the name, or a placeholder by kind."""
+        return self.measurement_name or ("Comparison" if self.is_comparison else "Measurement")
+
+    @staticmethod
+    def from_measurement(m, record: dict | None = None) -> "MeasurementSummary":
+        """Summarise *m*; *record* is its ``to_dict`` when already at hand (content hash)."""
+        from models import guitar_mode as gm
+
+        snap = m.spectrum_snapshot or m.longitudinal_snapshot
+        values: dict[str, Any] = dict(
+            id=m.id,
+            timestamp=m.timestamp,
+            measurement_name=m.measurement_name,
+            notes=m.notes,
+            measurement_type=m.resolved_measurement_type,
+            guitar_type=(snap.guitar_type if snap else None) or m.guitar_type,
+            is_comparison=m.is_comparison,
+            comparison_count=len(m.comparison_entries or []),
+            has_spectrum=m.spectrum_snapshot is not None,
+            peak_count=len(m.peaks),
+            decay_time=m.decay_time,
+            content_hash=record_digest(record) if record is not None else None,
+        )
+        if m.is_comparison:
+            return MeasurementSummary(**values)
+        if not m.is_material:
+            values["tap_tone_ratio"] = m.tap_tone_ratio
+            for key, mode in (("air_hz", gm.GuitarMode.AIR), ("top_hz", gm.GuitarMode.TOP),
+                              ("back_hz", gm.GuitarMode.BACK)):
+                peak = m.definitive_peak(mode)
+                values[key] = peak.frequency if peak is not None else None
+            return MeasurementSummary(**values)
+        try:
+            from views.tap_analysis_results_view import pdf_report_data_from_measurement
+            report = pdf_report_data_from_measurement(m)
+        except Exception as exc:
+            gt_log(f"Summary index: no material properties for {m.id}: {exc}")
+            return MeasurementSummary(**values)
+        if report.plate_properties is not None:
+            plate = report.plate_properties
+            values["e_long_gpa"] = plate.youngsModulusLongGPa
+            values["e_cross_gpa"] = plate.youngsModulusCrossGPa
+            g_lc = plate.gore_shear_modulus
+            values["g_lc_gpa"] = g_lc / 1e9 if g_lc is not None else None
+        elif report.brace_properties is not None:
+            values["e_long_gpa"] = report.brace_properties.youngsModulusLongGPa
+        return MeasurementSummary(**values)
+
+    # MARK: - Serialisation
+
+    def to_dict(self) -> dict[str, Any]:
+        return {_KEYS[f.name]: getattr(self, f.name) for f in fields(self)}
+
+    @staticmethod
+    def from_dict(d: dict) -> "MeasurementSummary":
+        return MeasurementSummary(**{name: d[key] for name, key in _KEYS.items() if key in d})
+
+
+_KEYS = {
+    "id": "id",
+    "timestamp": "timestamp",
+    "measurement_name": "measurementName",
+    "notes": "notes",
+    "measurement_type": "measurementType",
+    "guitar_type": "guitarType",
+    "is_comparison": "isComparison",
+    "comparison_count": "comparisonCount",
+    "has_spectrum": "hasSpectrum",
+    "peak_count": "peakCount",
+    "decay_time": "decayTime",
+    "tap_tone_ratio": "tapToneRatio",
+    "air_hz": "airHz",
+    "top_hz": "topHz",
+    "back_hz": "backHz",
+    "e_long_gpa": "youngsModulusLongGPa",
+    "e_cross_gpa": "youngsModulusCrossGPa",
+    "g_lc_gpa": "shearModulusGPa",
+    "content_hash": "contentHash",
+}
+
+
+def record_digest(record: dict) -> str:
+    """sha1 of a stored record in canonical form (sorted keys, compact)."""
+    text = json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def summary_of(m, record: dict | None = None) -> MeasurementSummary:
+    """The summary of *m*, computed once per object.
+
+    Memoised on the object; assigning one of its fields (or
+    ``TapToneMeasurement.mark_modified``) drops the memo.
+    Deferred measurements carry theirs from the index.  A *record* fills in a
+    missing content hash.
+    """
+    summary = m.__dict__.get("_summary")
+    if summary is None:
+        summary = MeasurementSummary.from_measurement(m, record)
+    elif summary.content_hash is None and record is not None:
+        summary = replace(summary, content_hash=record_digest(record))
+    else:
+        return summary
+    m.__dict__["_summary"] = summary
+    return summary
+
+
+# MARK: - Sidecar file
+
+def index_path(library_path: str) -> str:
+    """saved_measurements.index.json beside saved_measurements.json."""
+    return os.path.splitext(library_path)[0] + ".index.json"
+
+
+def read_index(path: str) -> "tuple[dict, list[MeasurementSummary]] | None":
+    """(library state, summaries) from the index at *path*, or None if absent or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            raw = json.loads(f.read())
+        if raw.get("version") != SUMMARY_INDEX_VERSION:
+            return None
+        return raw["library"], [MeasurementSummary.from_dict(d) for d in raw["summaries"]]
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError, TypeError, AttributeError, OSError) as exc:
+        gt_log(f"📇 Ignoring unreadable measurements index: {exc}")
+        return None
+
+
+def write_index(path: str, library: dict, summaries: "list[MeasurementSummary]") -> None:
+    """Write the index atomically; on failure remove it so it cannot go stale."""
+    data = json.dumps(
+        {"version": SUMMARY_INDEX_VERSION, "library": library,
+         "summaries": [s.to_dict() for s in summaries]},
+        ensure_ascii=False, sort_keys=True, separators=(",", ":"),
+    ).encode("utf-8")
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError as exc:
+        gt_log(f"Failed to write measurements index: {exc}")
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# MARK: - Deferred records
+
+class DeferredRecords:
+    """Decodes the records behind one index load, on demand.
+
+    *read_records* returns the library's current records (base plus journal).
+    They are read once, on the first request, and grouped by id; records of the
+    same id (a file imported twice) are told apart by content hash.  Records not
+    yet handed out are dropped once every deferred measurement is resolved (the
+batch itself goes with the last loader).
+    """
+
+    def __init__(self, read_records: Callable[[], list[dict]],
+                 decode: Callable[[dict], Any], count: int) -> None:
+        self._read_records = read_records
+        self._decode = decode
+        self._pending = count
+        self._by_id: dict[str, list[dict]] | None = None
+        self._decoded: dict[int, Any] = {}
+        self._lock = threading.Lock()
+
+    def measurements(self, summaries: "list[MeasurementSummary]") -> list:
+        from models.tap_tone_measurement import TapToneMeasurement
+
+        return [
+            TapToneMeasurement.deferred(
+                {"id": s.id, "timestamp": s.timestamp, "measurement_name": s.measurement_name,
+                 "notes": s.notes, "decay_time": s.decay_time, "was_healed": False,
+                 "_summary": s},
+                lambda s=s: self._load(s),
+            )
+            for s in summaries
+        ]
+
+    def _load(self, summary: MeasurementSummary):
+        with self._lock:
+            # Two threads may race to resolve the same measurement: decode once.
+            done = self._decoded.get(id(summary))
+            if done is not None:
+                return done
+            if self._by_id is None:
+                self._by_id = {}
+                for d in self._read_records():
+                    self._by_id.setdefault(d.get("id"), []).append(d)
+            candidates = self._by_id.get(summary.id) or []
+            record = None
+            if len(candidates) > 1:
+                record = next((d for d in candidates
+                               if record_digest(d) == summary.content_hash), None)
+            if record is None and candidates:
+                record = candidates[0]
+            if record is None:
+                raise LookupError(f"measurement {summary.id} is no longer in the library")
+            candidates.remove(record)
+            done = self._decoded[id(summary)] = self._decode(record)
+            self._pending -= 1
+            if self._pending <= 0:
+                self._by_id = {}
+            return done
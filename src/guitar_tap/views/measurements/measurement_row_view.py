@@ -8,6 +8,10 @@ that displays one TapToneMeasurement with three lines of metadata.
   Line 2 : [N peaks] [• Ratio: X.XX] [• Decay: X.XXs]
   Line 3 : [notes, word-wrapped]   (optional)
 
+Everything shown comes from the measurement's MeasurementSummary
+(views/measurement_summary_index.py), so a row never decodes a record that the
+library loaded deferred from its summary index.
+
 Shows PointingHandCursor on hover.  Emits clicked() on left-button release
 and doubleClicked() on left-button double-click.  In normal mode the list
 view connects doubleClicked to load the measurement; in compare mode
@@ -20,50 +24,14 @@ from __future__ import annotations
 
 
 from models import TapToneMeasurement
-from models import guitar_mode as GM
-from models import guitar_type as GT
 from PySide6 import QtCore, QtGui, QtWidgets
 from utilities.date_format import format_display_datetime
+from views.measurement_summary_index import summary_of
 
 # "⋯" actions button: transparent text when idle, grey on hover (no layout shift).
 _ELLIPSIS_IDLE_QSS = "QToolButton { color: rgba(136,136,136,0); border: none; font-size: 11px; padding: 0 2px; }"
 _ELLIPSIS_HOVER_QSS = "QToolButton { color: rgba(136,136,136,255); border: none; font-size: 11px; padding: 0 2px; }"
 
-# ── Helper ────────────────────────────────────────────────────────────────────
-
-def _resolve_guitar_type(s: str | None) -> GT.GuitarType:
-    if s:
-        try:
-            return GT.GuitarType(s)
-        except ValueError:
-            pass
-    return GT.GuitarType.CLASSICAL
-
-
-def tap_tone_ratio(m: TapToneMeasurement) -> float | None:
-    """Compute the AIR:TOP frequency ratio for a measurement, or None."""
-    if not m.peaks:
-        return None
-    try:
-        gt = _resolve_guitar_type(m.guitar_type)
-        id_map = GM.GuitarMode.classify_all(m.peaks, gt)
-        air = next(
-            (p.frequency for p in m.peaks
-             if id_map.get(p.id, GM.GuitarMode.UNKNOWN).normalized == GM.GuitarMode.AIR),
-            None,
-        )
-        top = next(
-            (p.frequency for p in m.peaks
-             if id_map.get(p.id, GM.GuitarMode.UNKNOWN).normalized == GM.GuitarMode.TOP),
-            None,
-        )
-        if air and top and air > 0:
-            return top / air
-    except Exception:
-        pass
-    return None
-
-
 # ── Widget ────────────────────────────────────────────────────────────────────
 
 class MeasurementRowView(QtWidgets.QWidget):
@@ -89,6 +57,7 @@ class MeasurementRowView(QtWidgets.QWidget):
     ) -> None:
         super().__init__(parent)
         self._pressed = False
+        s = summary_of(m)
 
         if not compare_mode:
             self.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
@@ -120,25 +89,25 @@ class MeasurementRowView(QtWidgets.QWidget):
         line1 = QtWidgets.QHBoxLayout()
         line1.setSpacing(6)
 
-        loc = QtWidgets.QLabel(m.measurement_name or ("Comparison" if m.is_comparison else "Measurement"))
+        loc = QtWidgets.QLabel(s.title)
         loc.setStyleSheet("font-weight: bold; font-size: 13px;")
         loc.setWordWrap(True)
         line1.addWidget(loc)
         line1.addStretch()
 
-        if m.is_comparison:
+        if s.is_comparison:
             # Chart icon — mirrors SF Symbol "chart.bar.doc.horizontal" used in Swift
             chart_icon = QtWidgets.QLabel("📊")
             chart_icon.setStyleSheet("font-size: 11px;")
             chart_icon.setToolTip("Comparison record")
             line1.addWidget(chart_icon)
-        elif m.spectrum_snapshot is not None:
+        elif s.has_spectrum:
             wave = QtWidgets.QLabel("〜")
             wave.setStyleSheet("color: #28a028; font-size: 11px;")
             wave.setToolTip("Has spectrum snapshot")
             line1.addWidget(wave)
 
-        time_lbl = QtWidgets.QLabel(format_display_datetime(m.timestamp))
+        time_lbl = QtWidgets.QLabel(format_display_datetime(s.timestamp))
         time_lbl.setStyleSheet("color: #888888; font-size: 10px;")
         line1.addWidget(time_lbl)
 
@@ -167,23 +136,21 @@ class MeasurementRowView(QtWidgets.QWidget):
         content.addLayout(line1)
 
         # Line 2: for comparison records show spectrum count; for regular show peaks/ratio/decay
-        if m.is_comparison:
-            n = len(m.comparison_entries) if m.comparison_entries else 0
-            meta = QtWidgets.QLabel(f"{n} spectra compared")
+        if s.is_comparison:
+            meta = QtWidgets.QLabel(f"{s.comparison_count} spectra compared")
         else:
-            parts: list[str] = [f"{len(m.peaks)} peaks"]
-            ratio = tap_tone_ratio(m)
-            if ratio is not None:
-                parts.append(f"Ratio: {ratio:.2f}")
-            if m.decay_time is not None:
-                parts.append(f"Decay: {m.decay_time:.2f}s")
+            parts: list[str] = [f"{s.peak_count} peaks"]
+            if s.tap_tone_ratio is not None:
+                parts.append(f"Ratio: {s.tap_tone_ratio:.2f}")
+            if s.decay_time is not None:
+                parts.append(f"Decay: {s.decay_time:.2f}s")
             meta = QtWidgets.QLabel("  •  ".join(parts))
         meta.setStyleSheet("color: #888888; font-size: 10px;")
         content.addWidget(meta)
 
         # Line 3: notes (word-wrapped, expands to fit)
-        if m.notes:
-            notes_lbl = QtWidgets.QLabel(m.notes)
+        if s.notes:
+            notes_lbl = QtWidgets.QLabel(s.notes)
             notes_lbl.setStyleSheet("color: #888888; font-size: 10px;")
             notes_lbl.setWordWrap(True)
             content.addWidget(notes_lbl)
@@ -11,6 +11,10 @@ Row content (matches MeasurementRowView.swift):
   Line 2 : N peaks  •  Ratio: X.XX (if available)  •  Decay: X.XXs (if available)
   Line 3 : notes, max 2 lines (if any)
 
+The list renders from each measurement's MeasurementSummary (summary_of), so
+opening the dialog never decodes a record the library loaded deferred from its
+summary index; records are decoded when one is loaded, compared or exported.
+
 Click a row    → opens MeasurementDetailDialog
 Right-click    → context menu: Load into View | View Details | Edit Name & Notes |
                  Export Measurement | Export Spectrum | Export PDF Report | Delete
@@ -26,6 +30,8 @@ from PySide6 import QtCore, QtGui, QtWidgets
 from views import tap_analysis_results_view as M
 from views.measurements import edit_measurement_view as EMV
 from views.measurements import measurement_detail_view as MDD
+from views.measurement_import import MeasurementImportWorker
+from views.measurement_summary_index import summary_of
 from views.measurements.measurement_row_view import MeasurementRowView
 
 # ── Main dialog ───────────────────────────────────────────────────────────────
@@ -54,6 +60,7 @@ class MeasurementsDialog(QtWidgets.QDialog):
 
         self._compare_mode: bool = False
         self._compare_indices: set[int] = set()  # mirrors Swift selectedCompareIndices: Set<Int>
+        self._import_worker: MeasurementImportWorker | None = None  # background import, if running
 
         self._build_ui()
         self._rebuild_list()
@@ -150,10 +157,7 @@ class MeasurementsDialog(QtWidgets.QDialog):
             f"Total: {n} measurement{'s' if n != 1 else ''}"
         )
 
-        comparable = sum(
-            1 for m in self._measurements
-            if m.spectrum_snapshot is not None and not m.is_comparison
-        )
+        comparable = sum(1 for m in self._measurements if summary_of(m).is_comparable)
         self._compare_btn.setEnabled(
             comparable >= 2 if not self._compare_mode else True
         )
@@ -166,7 +170,7 @@ class MeasurementsDialog(QtWidgets.QDialog):
 
         for idx, m in enumerate(self._measurements):
             # Comparison records are never eligible for compare-mode selection.
-            eligible = m.spectrum_snapshot is not None and not m.is_comparison
+            eligible = summary_of(m).is_comparable
             selected = idx in self._compare_indices  # index-based, mirrors Swift selectedCompareIndices
 
             item = QtWidgets.QListWidgetItem()
@@ -213,10 +217,7 @@ class MeasurementsDialog(QtWidgets.QDialog):
             self._compare_btn.setText(f"Compare ({count})")
             self._compare_btn.setEnabled(count >= 2)
         else:
-            comparable = sum(
-                1 for m in self._measurements
-                if m.spectrum_snapshot is not None and not m.is_comparison
-            )
+            comparable = sum(1 for m in self._measurements if summary_of(m).is_comparable)
             self._compare_btn.setText("Compare…")
             self._compare_btn.setEnabled(comparable >= 2)
 
@@ -239,7 +240,7 @@ class MeasurementsDialog(QtWidgets.QDialog):
         — which share the same UUID — each have an independent selection state.
         Mirrors Swift toggleCompareSelection(at:for:).
         """
-        if m.spectrum_snapshot is None or m.is_comparison:
+        if not summary_of(m).is_comparable:
             return
         if index in self._compare_indices:
             self._compare_indices.discard(index)
@@ -670,12 +671,49 @@ class MeasurementsDialog(QtWidgets.QDialog):
         try:
             with open(path, "rb") as f:
                 data = f.read()
-            # mirrors Swift importMeasurements(from: Data) — model owns decode+append
-            imported = self._analyzer.import_measurements_from_data(data)
-        except Exception as exc:
+        except OSError as exc:
             QtWidgets.QMessageBox.warning(self, "Import Error", str(exc))
             return
 
+        # Python-only: Swift's importMeasurements(from: Data) decodes inline.  A large
+        # backup is decoded off the GUI thread (across a process pool) with progress,
+        # then merged by the model in one append + one library write.
+        worker = MeasurementImportWorker(data, self)
+        progress = QtWidgets.QProgressDialog("Importing measurements…", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Import")
+        progress.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(300)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+
+        def on_progress(done: int, total: int) -> None:
+            progress.setMaximum(total)
+            progress.setValue(done)
+            progress.setLabelText(f"Importing measurements… {done} of {total}")
+
+        def on_finished(measurements: list) -> None:
+            progress.close()
+            self._import_worker = None
+            self._finish_import(self._analyzer.add_imported_measurements(measurements))
+
+        def on_failed(message: str) -> None:
+            progress.close()
+            self._import_worker = None
+            QtWidgets.QMessageBox.warning(self, "Import Error", message)
+
+        def on_canceled() -> None:
+            worker.cancel()
+            self._import_worker = None
+
+        worker.progress.connect(on_progress)
+        worker.finished.connect(on_finished)
+        worker.failed.connect(on_failed)
+        progress.canceled.connect(on_canceled)
+        self._import_worker = worker
+        worker.start()
+
+    def _finish_import(self, imported: "list[TapToneMeasurement]") -> None:
+        """Post-import UI once the measurements are in the library (mirrors Swift importFromFile)."""
         if len(imported) == 1:
             # Auto-load single imported measurement (matches Swift importFromFile).
             # Suppress the mic warning so we can fold it into the success message
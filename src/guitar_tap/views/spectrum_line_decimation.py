@@ -0,0 +1,71 @@
+"""
+Viewport decimation of the live spectrum line.
+
+Python-only.  Swift Charts renders the spectrum through its own pipeline; in the
+Python port ``FftCanvas.set_draw_data`` used to hand the full FFT (32 769 bins)
+to ``fft_line.setData`` on every frame, although the visible window is usually a
+few hundred bins wide on a plot about a thousand pixels wide.
+
+``decimate_for_view`` slices the arrays to the visible frequency range (plus a
+margin) and, when more bins remain than the plot can show, reduces them to a
+min/max envelope with one bucket per pixel.  Each bucket keeps the bins holding
+its minimum and its maximum, at their own frequencies and in their own order,
+so no peak or notch is lost and the envelope lines up with the peak markers.
+The number of points drawn is therefore bounded by the plot's width, not by the
+FFT size.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+# Share of the visible span kept beyond each edge, so the line reaches the plot
+# edges (and small pans stay covered) before the next re-decimation.
+VIEW_MARGIN = 0.1
+
+
+def decimate_for_view(
+    freqs: np.ndarray,
+    mags: np.ndarray,
+    x_min: float,
+    x_max: float,
+    pixels: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """The points of (*freqs*, *mags*) worth drawing in [*x_min*, *x_max*].
+
+    *freqs* must be ascending.  The arrays are sliced to the range widened by
+    ``VIEW_MARGIN`` (and one bin beyond it on each side, so the line crosses the
+    plot edges); if the slice still holds more than two points per pixel it is
+    reduced to its two end bins and each of *pixels* buckets' minimum and
+    maximum.
+    """
+    n = min(len(freqs), len(mags))
+    if n == 0:
+        return freqs[:0], mags[:0]
+    margin = (x_max - x_min) * VIEW_MARGIN
+    i0 = max(int(np.searchsorted(freqs[:n], x_min - margin, side="left")) - 1, 0)
+    i1 = min(int(np.searchsorted(freqs[:n], x_max + margin, side="right")) + 1, n)
+    x = freqs[i0:i1]
+    y = mags[i0:i1]
+    pixels = max(int(pixels), 1)
+    if len(x) <= 2 * pixels:
+        return x, y
+
+    # Equal-sized buckets; the last is padded with its own final value, which
+    # cannot change its minimum or maximum.
+    size = -(-len(y) // pixels)
+    buckets = -(-len(y) // size)
+    padded = np.empty(buckets * size, dtype=y.dtype)
+    padded[:len(y)] = y
+    padded[len(y):] = y[-1]
+    grid = padded.reshape(buckets, size)
+    start = np.arange(buckets) * size
+    lo = start + np.argmin(grid, axis=1)
+    hi = start + np.argmax(grid, axis=1)
+    # The slice's end bins bracket the envelope so the line still spans it.
+    idx = np.empty(2 * buckets + 2, dtype=np.intp)
+    idx[0], idx[-1] = 0, len(y) - 1
+    idx[1:-1:2] = np.minimum(lo, hi)
+    idx[2:-1:2] = np.maximum(lo, hi)
+    idx = np.minimum(idx, len(y) - 1)      # padding maps back to the last bin
+    return x[idx], y[idx]
@@ -17,6 +17,12 @@ JSON format:
     are keyed by peak UUID
   - spectrumSnapshot embeds freq/mag arrays so the file is self-contained
   - Format is cross-compatible with Swift GuitarTap .guitartap files
+  - Edits between compactions are journaled to saved_measurements.journal
+    (views/measurement_store.py), so a save writes one measurement, not the
+    whole library
+  - saved_measurements.index.json holds one summary per measurement
+    (views/measurement_summary_index.py); a current index lets the library
+    open without decoding records until they are used
 """
 
 from __future__ import annotations
@@ -33,7 +39,9 @@ from guitar_tap.utilities.logging import gt_log
 
 __all__ = [
     "load_all_measurements",
+    "save_measurements",
     "save_all_measurements",
+    "switch_measurement_library_backend",
     "measurements_to_json",
     "measurements_from_json",
     "export_measurement_json",
@@ -42,6 +50,7 @@ __all__ = [
     "pdf_report_data_from_measurement",
     "PDFReportData",
     "measurements_file",
+    "measurements_database_file",
     "render_spectrum_image_for_measurement",
     "render_spectrum_image_for_comparison",
     "render_spectrum_image_for_multi_tap",
@@ -67,6 +76,7 @@ MULTI_TAP_AVG_COLOR = _AnalyzerMixin._MULTI_TAP_AVG_COLOR
 
 # Spectrum image rendering lives in exportable_spectrum_chart.py (mirrors ExportableSpectrumChart.swift).
 from views.exportable_spectrum_chart import render_spectrum_image_for_measurement  # noqa: E402
+from views.measurement_store import store_for  # noqa: E402
 from views.utilities import extensions as _ext  # noqa: E402
 
 # ── Export directory tracking ─────────────────────────────────────────────────
@@ -91,7 +101,7 @@ def last_export_dir() -> str:
     bookmark storage in MeasurementFileExporter.
     """
     from views.utilities.tap_settings_view import AppSettings
-    stored = AppSettings._s().value(_EXPORT_DIR_KEY)
+    stored = AppSettings._get(_EXPORT_DIR_KEY, None)
     if stored and os.path.isdir(stored):
         return stored
     return default_export_dir()
@@ -100,7 +110,7 @@ def last_export_dir() -> str:
 def update_export_dir(chosen_path: str) -> None:
     """Persist the directory of *chosen_path* as the new last-used export dir."""
     from views.utilities.tap_settings_view import AppSettings
-    AppSettings._s().setValue(_EXPORT_DIR_KEY, os.path.dirname(chosen_path))
+    AppSettings._set(_EXPORT_DIR_KEY, os.path.dirname(chosen_path))
 
 
 # ── Persistence paths ─────────────────────────────────────────────────────────
@@ -134,41 +144,134 @@ def measurements_file() -> str:
     return os.path.join(data_dir, "saved_measurements.json")
 
 
+def measurements_database_file() -> str:
+    """The SQLite library (saved_measurements.sqlite) beside saved_measurements.json."""
+    return os.path.splitext(measurements_file())[0] + ".sqlite"
+
+
+def _library_store(backend: str | None = None):
+    """The store for *backend* — by default the configured one
+    (AppSettings.measurement_library_backend)."""
+    from views.utilities.tap_settings_view import AppSettings
+
+    if backend is None:
+        backend = AppSettings.measurement_library_backend()
+    if backend == "sqlite":
+        from views.measurement_sqlite_store import SqliteMeasurementStore
+        legacy = measurements_file()
+        return store_for(measurements_database_file(),
+                         lambda path: SqliteMeasurementStore(path, legacy_json_path=legacy))
+    store = store_for(measurements_file())
+    store.format_version = AppSettings.snapshot_format_version()
+    return store
+
+
+def switch_measurement_library_backend(backend: str,
+                                       measurements: list[TapToneMeasurement]) -> bool:
+    """Make *backend* ("json" or "sqlite") the library, writing *measurements*
+    (the in-memory library) into it in full first.
+
+    The library being left is not rewritten — it already holds the list — so
+    both files end up with the same measurements and the SQLite store records
+    the two as in sync (see views/measurement_sqlite_store.py).  Returns False,
+    leaving the setting unchanged, if the target could not be written.
+
+    Python-only.
+    """
+    from views.measurement_persistence_worker import flush_pending_saves
+    from views.utilities.tap_settings_view import AppSettings
+
+    if backend == AppSettings.measurement_library_backend():
+        return True
+    flush_pending_saves()  # the old backend must hold the list before we copy it
+    if backend == "sqlite":
+        ok = _library_store("sqlite").replace_all(measurements)
+    else:
+        ok = _library_store("json").rewrite(measurements, measurements_to_json)
+        if ok and os.path.exists(measurements_database_file()):
+            _library_store("sqlite").mark_json_synced()
+    if not ok:
+        return False
+    AppSettings.set_measurement_library_backend(backend)
+    gt_log(f"📦 Measurement library switched to {backend} ({len(measurements)} measurements)")
+    return True
+
+
+def _warn_if_sqlite_library_diverged() -> None:
+    """JSON backend: warn if the SQLite library holds changes the JSON one lacks
+    (the setting was changed by hand, not through the Settings dialog)."""
+    if not os.path.exists(measurements_database_file()):
+        return
+    try:
+        if _library_store("sqlite").has_unsynced_changes():
+            gt_log(f"⚠️ {measurements_database_file()} has measurements saved since it was "
+                   f"last in sync with {measurements_file()}: the libraries have diverged.  "
+                   f"Using the JSON library; switching to SQLite in Settings replaces the "
+                   f"SQLite library with it")
+    except Exception as exc:
+        gt_log(f"Could not check the SQLite measurement library: {exc}")
+
+
 # ── Persistence API ───────────────────────────────────────────────────────────
 
 def load_all_measurements() -> list[TapToneMeasurement]:
-    """Load all measurements from saved_measurements.json.
-
-    Reads through the single ``measurements_from_json`` decoder so that loading
-    the persisted library and importing a shared ``.guitartap`` file are the same
-    code path (mirrors Swift's one decodeMeasurements)."""
-    path = measurements_file()
-    if not os.path.exists(path):
-        return []
+    """Load all measurements from the library — saved_measurements.json (plus its
+    journal) or, with the SQLite backend, saved_measurements.sqlite.
+
+    Decodes records with ``TapToneMeasurement.from_dict`` (deferred until first
+    use when the summary index is current), the same decoder
+    ``measurements_from_json`` uses, so loading the persisted library and
+    importing a shared ``.guitartap`` file are the same code path (mirrors
+    Swift's one decodeMeasurements)."""
+    from views.measurement_persistence_worker import flush_pending_saves
+    from views.utilities.tap_settings_view import AppSettings
+    flush_pending_saves()  # never read the library under a queued write
+    if AppSettings.measurement_library_backend() == "json":
+        _warn_if_sqlite_library_diverged()
+    store = _library_store()
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return measurements_from_json(f.read())
+        return store.load(TapToneMeasurement.from_dict)
     except Exception as exc:
         gt_log(f"Failed to load measurements: {exc}")
+        store.reset()
         return []
 
 
-def measurements_to_json(measurements: "list[TapToneMeasurement]") -> str:
+def measurements_to_json(measurements: "list[TapToneMeasurement]",
+                         format_version: "int | None" = None) -> str:
     """The on-disk library form (saved_measurements.json) — a `.guitartap` JSON array.
-    Shared by the internal persistence and by Export All, so a backup IS the library file."""
-    return json.dumps([m.to_dict() for m in measurements], indent=2, ensure_ascii=False, sort_keys=True)
-
-
-def save_all_measurements(measurements: list[TapToneMeasurement]) -> None:
-    """Write the full measurements list to disk atomically."""
-    path = measurements_file()
-    try:
-        tmp = path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            f.write(measurements_to_json(measurements))
-        os.replace(tmp, path)
-    except OSError as exc:
-        gt_log(f"Failed to save measurements: {exc}")
+    Shared by the internal persistence and by Export All, so a backup IS the library file.
+
+    *format_version* defaults to AppSettings.snapshot_format_version (see
+    SpectrumSnapshot.to_dict).
+
+    Byte-identical to ``json.dumps([m.to_dict() ...], indent=2, sort_keys=True)``
+    but assembled from each measurement's memoised ``to_json()``, so only
+    measurements changed since the last save or export are encoded again."""
+    if format_version is None:
+        from views.utilities.tap_settings_view import AppSettings
+        format_version = AppSettings.snapshot_format_version()
+    if not measurements:
+        return "[]"
+    # Nesting a record one level into the array indents every line but the first
+    # by two more spaces; JSON strings never contain a raw newline.
+    return "[\n  " + ",\n  ".join(
+        m.to_json(format_version).replace("\n", "\n  ") for m in measurements
+    ) + "\n]"
+
+
+def save_measurements(measurements: list[TapToneMeasurement]) -> bool:
+    """Persist the measurements list, writing only what changed since the last save.
+
+    A single append, replace or delete is journaled (O(one measurement));
+    anything else rewrites the library.  See views/measurement_store.py.
+    Returns False if the library could not be written."""
+    return _library_store().save(measurements, measurements_to_json)
+
+
+def save_all_measurements(measurements: list[TapToneMeasurement]) -> bool:
+    """Write the full measurements list to disk atomically (compacts the journal)."""
+    return _library_store().rewrite(measurements, measurements_to_json)
 
 
 def export_measurement_json(m: TapToneMeasurement) -> str:
@@ -4555,8 +4555,8 @@ class MainWindow(QtWidgets.QMainWindow):
         _snap = m.spectrum_snapshot or m.longitudinal_snapshot
         if _snap is not None:
             snap = _snap
-            freq_arr = np.array(snap.frequencies, dtype=np.float64)
-            mag_arr  = np.array(snap.magnitudes, dtype=np.float64)
+            freq_arr = np.array(snap.frequencies_array, dtype=np.float64)
+            mag_arr  = np.array(snap.magnitudes_array, dtype=np.float64)
             # set_frozen_spectrum keeps frozen_frequencies and frozen_magnitudes in
             # sync.  For plate/brace measurements load_measurement() clears
             # frozen_frequencies (plate mode doesn't use the combined frozen
@@ -6474,6 +6474,50 @@ class MainWindow(QtWidgets.QMainWindow):
         an.addWidget(dump_audio_widget)
         an.addWidget(_hsep())
 
+        # Measurement library backend (Python-only; Swift uses SwiftData). Applied on
+        # Done: switching writes the current library into the selected backend in full.
+        LIBRARY_BACKEND_NAMES = {"json": "JSON file", "sqlite": "SQLite database"}
+        library_row = QtWidgets.QHBoxLayout()
+        library_row.addWidget(QtWidgets.QLabel("Measurement Library:"))
+        library_row.addStretch()
+        library_combo = QtWidgets.QComboBox()
+        for backend in AS.AppSettings.MEASUREMENT_LIBRARY_BACKENDS:
+            library_combo.addItem(LIBRARY_BACKEND_NAMES[backend], backend)
+        library_combo.setCurrentIndex(library_combo.findData(
+            AS.AppSettings.measurement_library_backend()
+        ))
+        library_row.addWidget(library_combo)
+        an.addLayout(library_row)
+        library_desc = QtWidgets.QLabel(
+            "Where saved measurements are stored. The SQLite database opens large "
+            "libraries faster; switching copies every saved measurement across."
+        )
+        library_desc.setFont(caption)
+        library_desc.setWordWrap(True)
+        an.addWidget(library_desc)
+        an.addWidget(_hsep())
+
+        # Live FFT hop size (Python-only; Swift always uses non-overlapping frames).
+        # Applied on Done to the running analyzer and persisted for the next start.
+        hop_row = QtWidgets.QHBoxLayout()
+        hop_row.addWidget(QtWidgets.QLabel("Spectrum Update:"))
+        hop_row.addStretch()
+        hop_combo = QtWidgets.QComboBox()
+        for hop in AS.AppSettings.FFT_HOP_SIZES:
+            label = "No overlap" if hop == 65536 else f"{65536 // hop}× overlap"
+            hop_combo.addItem(f"{label} ({hop} samples)", hop)
+        hop_combo.setCurrentIndex(hop_combo.findData(AS.AppSettings.fft_hop_size()))
+        hop_row.addWidget(hop_combo)
+        an.addLayout(hop_row)
+        hop_desc = QtWidgets.QLabel(
+            "How far the live FFT window advances between frames. Overlapping "
+            "frames refresh the spectrum more often at the same resolution."
+        )
+        hop_desc.setFont(caption)
+        hop_desc.setWordWrap(True)
+        an.addWidget(hop_desc)
+        an.addWidget(_hsep())
+
         reset_analysis_btn = QtWidgets.QPushButton(qta.icon("mdi.undo"), "Reset Analysis Settings")
 
         def _reset_analysis_settings() -> None:
@@ -7109,6 +7153,25 @@ class MainWindow(QtWidgets.QMainWindow):
             # Dump Capture Audio
             AS.AppSettings.set_dump_capture_audio(dump_audio_cb.isChecked())
 
+            # Live FFT hop size
+            hop = int(hop_combo.currentData())
+            AS.AppSettings.set_fft_hop_size(hop)
+            mic = self.fft_canvas.analyzer.mic
+            mic.set_hop_size(min(hop, mic.fft_size))
+
+            # Measurement library backend
+            library_backend = library_combo.currentData()
+            if library_backend != AS.AppSettings.measurement_library_backend():
+                from views.tap_analysis_results_view import switch_measurement_library_backend
+                if not switch_measurement_library_backend(
+                    library_backend, list(self.fft_canvas.analyzer.saved_measurements)
+                ):
+                    QtWidgets.QMessageBox.warning(
+                        dlg, "Measurement Library",
+                        "The measurement library could not be copied to the selected "
+                        "backend (see log). The current library is still in use.",
+                    )
+
             # Peak threshold → AppSettings + main-window slider + graph
             try:
                 final_db = int(float(peak_thresh_field.text()))
@@ -7327,6 +7390,9 @@ class MainWindow(QtWidgets.QMainWindow):
         # reached while the thread is still running, which causes Qt to
         # fatal-abort (SIGABRT) during Python's atexit cleanup.
         self.fft_canvas.shutdown()
+        # Finish any queued measurement-library write before the process exits.
+        from views.measurement_persistence_worker import persistence_worker
+        persistence_worker().close()
         super().closeEvent(event)
 
 
@@ -17,11 +17,13 @@ from views.tap_analysis_results_view import (
     measurements_file,
     pdf_report_data_from_measurement,
     save_all_measurements,
+    save_measurements,
 )
 
 __all__ = [
     "measurements_file",
     "load_all_measurements",
+    "save_measurements",
     "save_all_measurements",
     "export_measurement_json",
     "import_measurements_from_json",
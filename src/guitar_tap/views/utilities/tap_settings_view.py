@@ -8,7 +8,9 @@
 
 from __future__ import annotations
 
+import contextlib
 import os
+from typing import Callable
 
 from PySide6 import QtCore
 
@@ -29,35 +31,150 @@ def _meas_key(meas_type) -> str:
     return str(meas_type)
 
 
+class _SettingsNotifier(QtCore.QObject):
+    """Qt-signal form of AppSettings change notification, for UI listeners.
+
+    ``changed`` carries the QSettings key that was written, or "" when the
+    whole cache was dropped (AppSettings.invalidate_cache()).
+    """
+
+    changed = QtCore.Signal(str)
+
+
 class AppSettings:
     """Read/write persistent settings using QSettings.
 
     All values are accessed via class-level properties so callers never
     construct the QSettings object themselves.
+
+    Reads are served from a process-wide, write-through cache: the suite is
+    loaded once on first access, every ``_set`` / ``_remove`` updates both
+    QSettings and the cache, and each write is announced synchronously, on the
+    writing thread, to the ``add_change_listener`` callbacks — so derived
+    caches (TapDisplaySettings) drop their values before the write returns —
+    and then on ``notifier().changed`` if a UI listener created the notifier.
+
+    Inside ``in_memory_suite()`` reads and writes stay in the cache and never
+    reach QSettings (headless batch analysis).  Code that writes the suite behind AppSettings' back calls
+    ``invalidate_cache()``.
     """
 
     _ORG = "Dolcesfogato"
     _APP = "guitar_tap"
 
+    _cache: "dict[str, object] | None" = None
+    _cache_org: "str | None" = None
+    _notifier: "_SettingsNotifier | None" = None
+    _listeners: "list[Callable[[str], None]]" = []
+    _in_memory: bool = False
+
     # ------------------------------------------------------------------ #
     # Internal helpers
     # ------------------------------------------------------------------ #
     @classmethod
-    def _s(cls) -> QtCore.QSettings:
+    def _org(cls) -> str:
         # Mirror Swift's XCTestConfigurationFilePath check: redirect to an
         # isolated suite when running under pytest so tests never touch the
         # user's real preferences.
         if "PYTEST_CURRENT_TEST" in os.environ:
-            return QtCore.QSettings("Dolcesfogato.tests", cls._APP)
-        return QtCore.QSettings(cls._ORG, cls._APP)
+            return "Dolcesfogato.tests"
+        return cls._ORG
+
+    @classmethod
+    def _s(cls) -> QtCore.QSettings:
+        return QtCore.QSettings(cls._org(), cls._APP)
+
+    @classmethod
+    def _values(cls) -> "dict[str, object]":
+        """The cached suite contents, loaded in one pass on first use."""
+        org = cls._org()
+        cache = cls._cache
+        if cls._in_memory and cache is not None:
+            return cache
+        if cache is None or cls._cache_org != org:
+            s = QtCore.QSettings(org, cls._APP)
+            cache = {key: s.value(key) for key in s.allKeys()}
+            cls._cache, cls._cache_org = cache, org
+        return cache
 
     @classmethod
     def _get(cls, key: str, default):
-        return cls._s().value(key, default)
+        return cls._values().get(key, default)
 
     @classmethod
     def _set(cls, key: str, value) -> None:
-        cls._s().setValue(key, value)
+        cache = cls._values()
+        if not cls._in_memory:
+            cls._s().setValue(key, value)
+        cache[key] = value
+        cls._changed(key)
+
+    @classmethod
+    def _remove(cls, key: str) -> None:
+        cache = cls._values()
+        if not cls._in_memory:
+            cls._s().remove(key)
+        cache.pop(key, None)
+        cls._changed(key)
+
+    @classmethod
+    def add_change_listener(cls, callback: "Callable[[str], None]") -> None:
+        """Call *callback(key)* after every write ("" when the cache is dropped).
+
+        Called directly on the writing thread, before the write returns; no Qt
+        object is involved, so it works from any thread and after the
+        QApplication is gone.
+        """
+        cls._listeners.append(callback)
+
+    @classmethod
+    def notifier(cls) -> _SettingsNotifier:
+        """The settings-change notifier for UI listeners (created on first use).
+
+        Create it on the GUI thread.  Derived caches use add_change_listener.
+        """
+        if cls._notifier is None:
+            cls._notifier = _SettingsNotifier()
+        return cls._notifier
+
+    @classmethod
+    def _changed(cls, key: str) -> None:
+        for callback in list(cls._listeners):
+            callback(key)
+        notifier = cls._notifier
+        if notifier is not None:
+            try:
+                notifier.changed.emit(key)
+            except RuntimeError:  # deleted with its QApplication
+                cls._notifier = None
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop the cache so the next read reloads from QSettings."""
+        if not cls._in_memory:
+            cls._cache = None
+        cls._changed("")
+
+    @classmethod
+    @contextlib.contextmanager
+    def in_memory_suite(cls):
+        """Serve every read and write from a private copy of the suite while active.
+
+        Python-only.  Used by headless batch analysis (batch_analyze.py): the
+        analyzer still reads the user's settings, but what it writes — each
+        file's measurement type, the forced-off Dump Capture Audio — never
+        reaches the user's preferences or another worker process.  The previous
+        cache is restored on exit.
+        """
+        saved = cls._cache, cls._cache_org, cls._in_memory
+        cls._cache = dict(cls._values())
+        cls._in_memory = True
+        cls._changed("")
+        try:
+            yield
+        finally:
+            cls._cache, cls._cache_org, cls._in_memory = saved
+            cls._changed("")
 
     @classmethod
     def _get_bool(cls, key: str, default: bool) -> bool:
@@ -179,8 +296,8 @@ class AppSettings:
             cls._set(cls._DEVICE_FP_KEY, str(fingerprint))
             cls._set(cls._DEVICE_FP_LEGACY_KEY, str(fingerprint))  # keep legacy in sync
         else:
-            cls._s().remove(cls._DEVICE_FP_KEY)
-            cls._s().remove(cls._DEVICE_FP_LEGACY_KEY)
+            cls._remove(cls._DEVICE_FP_KEY)
+            cls._remove(cls._DEVICE_FP_LEGACY_KEY)
 
     # ------------------------------------------------------------------ #
     # Display magnitude range (dB)
@@ -300,6 +417,60 @@ class AppSettings:
     def set_dump_capture_audio(cls, v: bool) -> None:
         cls._set("analysis/dump_capture_audio", v)
 
+    # ------------------------------------------------------------------ #
+    # Live FFT hop size (Python-only)
+    #
+    # Samples between consecutive 65 536-point live frames.  65536 is the
+    # Swift-compatible non-overlapping default; smaller hops overlap the
+    # frames for a faster spectrum update at the same resolution.
+    # ------------------------------------------------------------------ #
+    FFT_HOP_SIZES = (65536, 16384, 8192, 4096)
+
+    @classmethod
+    def fft_hop_size(cls) -> int:
+        try:
+            v = int(cls._get("analysis/fft_hop_size", 65536))
+        except (TypeError, ValueError):
+            return 65536
+        return v if v in cls.FFT_HOP_SIZES else 65536
+
+    @classmethod
+    def set_fft_hop_size(cls, v: int) -> None:
+        cls._set("analysis/fft_hop_size", int(v))
+
+    # ------------------------------------------------------------------ #
+    # Measurement library backend (Python-only)
+    #
+    # "json"   — saved_measurements.json + journal (default, Swift-compatible file)
+    # "sqlite" — saved_measurements.sqlite: indexed metadata, spectra loaded on demand;
+    #            migrates the JSON library on first use.
+    # ------------------------------------------------------------------ #
+    MEASUREMENT_LIBRARY_BACKENDS = ("json", "sqlite")
+
+    @classmethod
+    def measurement_library_backend(cls) -> str:
+        v = str(cls._get("storage/measurement_library", "json"))
+        return v if v in cls.MEASUREMENT_LIBRARY_BACKENDS else "json"
+
+    @classmethod
+    def set_measurement_library_backend(cls, v: str) -> None:
+        cls._set("storage/measurement_library", v)
+
+    # Snapshot encoding for saved/exported .guitartap files (Python-only):
+    # 1 — frequenciesData blobs, readable by Swift and the web app (default);
+    # 2 — uniform frequency axes written as a parametric frequencyAxis (smaller).
+    @classmethod
+    def snapshot_format_version(cls) -> int:
+        try:
+            v = int(cls._get("storage/snapshot_format_version", 1))
+        except (TypeError, ValueError):
+            return 1
+        return v if v in (1, 2) else 1
+
+    @classmethod
+    def set_snapshot_format_version(cls, v: int) -> None:
+        cls._set("storage/snapshot_format_version", int(v))
+
     # ------------------------------------------------------------------ #
     # Tap-detection threshold (0–100 scale, 60 → −40 dBFS)
     # ------------------------------------------------------------------ #
@@ -36,14 +36,19 @@ def _clear_test_sandbox():
     isolated = QtCore.QSettings("Dolcesfogato.tests", "guitar_tap")
     isolated.clear()
     isolated.sync()
+    # AppSettings caches the suite in memory; drop anything read before the wipe.
+    from views.utilities.tap_settings_view import AppSettings
+    AppSettings.invalidate_cache()
 
     # Measurements file — delete the isolated JSON if it exists.
     import tempfile
     test_file = os.path.join(
         tempfile.gettempdir(), "com.guitartap.tests", "saved_measurements.json"
     )
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    base = os.path.splitext(test_file)[0]
+    for path in (test_file, base + ".journal", base + ".index.json", base + ".sqlite"):
+        if os.path.exists(path):
+            os.remove(path)
 
     yield
     # No teardown needed; the isolated storage is separate from real user data.
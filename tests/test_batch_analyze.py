@@ -0,0 +1,114 @@
+"""Pin the headless batch analyzer behind ``python -m guitar_tap analyze``.
+
+Python-only (Swift has no CLI).  analyze_file is the per-process worker; it is
+exercised in-process here so the test does not depend on the pool start method.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+import batch_analyze
+from models.measurement_type import MeasurementType
+
+G1_WAV = os.path.join(os.path.dirname(__file__), "Recording 5.wav")
+G1_TOP_FREQ = 164.09756
+
+
+class TestBatchAnalyze:
+
+    def test_analyze_file_writes_loadable_guitartap(self, tmp_path):
+        from views.tap_analysis_results_view import measurements_from_json, measurements_file
+
+        library = measurements_file()
+        before = os.path.getmtime(library) if os.path.exists(library) else None
+
+        result = batch_analyze.analyze_file(
+            G1_WAV, MeasurementType.GENERIC.value, 1, str(tmp_path), tap_threshold=-40.0,
+        )
+
+        assert result.ok, result.error
+        assert result.taps == 1
+        assert result.output_path == str(tmp_path / "Recording 5.guitartap")
+        with open(result.output_path, encoding="utf-8") as f:
+            [measurement] = measurements_from_json(f.read())
+        assert measurement.measurement_name == "Recording 5"
+        assert any(abs(p.frequency - G1_TOP_FREQ) < 1.0 for p in measurement.peaks)
+        # build_measurement, not save_measurement — the library is untouched.
+        after = os.path.getmtime(library) if os.path.exists(library) else None
+        assert after == before
+
+    def test_user_settings_are_not_written_and_nothing_is_dumped(self, tmp_path, monkeypatch):
+        from models.wav_dump_folder import WavDumpFolder
+        from views.utilities.tap_settings_view import AppSettings
+
+        acquired = []
+        monkeypatch.setattr(WavDumpFolder, "acquire_dump_folder",
+                            staticmethod(lambda: acquired.append(True)))
+        saved = AppSettings.measurement_type(), AppSettings.dump_capture_audio()
+        AppSettings.set_measurement_type(MeasurementType.BRACE)
+        AppSettings.set_dump_capture_audio(True)
+        try:
+            result = batch_analyze.analyze_file(
+                G1_WAV, MeasurementType.GENERIC.value, 1, str(tmp_path), tap_threshold=-40.0,
+            )
+            assert result.ok, result.error
+            assert AppSettings.measurement_type() == MeasurementType.BRACE
+            AppSettings.invalidate_cache()   # what QSettings itself holds
+            assert AppSettings.measurement_type() == MeasurementType.BRACE
+            assert AppSettings.dump_capture_audio() is True
+            assert acquired == []
+        finally:
+            AppSettings.set_measurement_type(saved[0])
+            AppSettings.set_dump_capture_audio(saved[1])
+
+    def test_worker_imports_do_not_load_the_main_window(self):
+        import subprocess
+
+        src = os.path.join(os.path.dirname(__file__), "..", "src")
+        code = (
+            "import sys\n"
+            f"sys.path[:0] = [{os.path.join(src, 'guitar_tap')!r}, {src!r}]\n"
+            "import batch_analyze\n"
+            "from models.tap_tone_analyzer import TapToneAnalyzer\n"
+            "from views.tap_analysis_results_view import measurements_to_json\n"
+            "from views.utilities.tap_settings_view import AppSettings\n"
+            "print('views.tap_tone_analysis_view' in sys.modules)\n"
+        )
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        out = subprocess.run([sys.executable, "-c", code], env=env, check=True,
+                             capture_output=True, text=True).stdout
+        assert out.strip().splitlines()[-1] == "False"
+
+    def test_failure_is_reported_not_raised(self, tmp_path):
+        bogus = tmp_path / "not-audio.wav"
+        bogus.write_bytes(b"not a wav file")
+        result = batch_analyze.analyze_file(
+            str(bogus), MeasurementType.GENERIC.value, 1, str(tmp_path),
+        )
+        assert not result.ok
+        assert result.output_path is None
+
+    def test_find_recordings_filters_and_sorts(self, tmp_path):
+        for name in ("b.wav", "a.WAV", "c.flac", "notes.txt"):
+            (tmp_path / name).write_bytes(b"")
+        (tmp_path / "sub.wav").mkdir()
+        names = [os.path.basename(p) for p in batch_analyze.find_recordings(str(tmp_path))]
+        assert names == ["a.WAV", "b.wav", "c.flac"]
+
+    def test_main_rejects_bad_arguments(self, tmp_path, capsys):
+        assert batch_analyze.main([str(tmp_path / "missing")]) == 2
+        assert batch_analyze.main([str(tmp_path), "--taps", "0"]) == 2
+        assert batch_analyze.main([str(tmp_path)]) == 1  # empty directory
+
+    def test_summary_reports_every_file(self):
+        ok = batch_analyze.FileResult("/x/a.wav", "/x/a.guitartap", 0.5, 5.0, 1, 12)
+        bad = batch_analyze.FileResult("/x/b.wav", None, 0.1, 0.0, 0, 0, error="boom")
+        text = batch_analyze._format_summary([ok, bad], wall_s=0.5, jobs=2)
+        assert "a.guitartap" in text and "FAILED: boom" in text
+        assert "2 file(s), 1 failed" in text
+
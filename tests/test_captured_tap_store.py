@@ -0,0 +1,112 @@
+"""Pin CapturedTapStore — the compact storage behind TapToneAnalyzer.captured_taps.
+
+Python-only (Swift keeps arrays of (magnitudes, frequencies, captureTime)
+tuples): one float32 n_taps × n_bins matrix plus a shared frequency axis, that
+still reads like the old list of 3-tuples.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from guitar_tap.models.captured_tap_store import CapturedTapStore
+from guitar_tap.models.tap_tone_analyzer import TapToneAnalyzer
+
+N_BINS = 32769  # 65536-point guitar FFT
+FREQS = np.arange(N_BINS) * (48000.0 / 65536)
+
+
+def _tap(level: float) -> np.ndarray:
+    return np.full(N_BINS, level, dtype=np.float64)
+
+
+class TestCapturedTapStore:
+
+    def test_reads_like_a_list_of_tuples(self):
+        store = CapturedTapStore(capacity=2)
+        when = dt.datetime(2026, 1, 2, 3, 4, 5, 678000)
+        for i in range(5):  # past the initial capacity
+            store.append((_tap(-10.0 - i), FREQS, when))
+        assert len(store) == 5 and store
+        mags, freqs, captured_at = store[-1]
+        assert mags.dtype == np.float32 and np.all(mags == -14.0)
+        assert freqs is store.frequencies
+        assert captured_at == when
+        assert [float(t[0][0]) for t in store] == [-10.0, -11.0, -12.0, -13.0, -14.0]
+        assert store.magnitudes.shape == (5, N_BINS)
+
+    def test_clear_keeps_allocation_and_resets_average(self):
+        store = CapturedTapStore()
+        store.add(_tap(-10.0), FREQS)
+        allocated = store.magnitudes.base
+        store.clear()
+        assert len(store) == 0 and store.power.count == 0
+        store.add(_tap(-20.0), FREQS)
+        assert store.magnitudes.base is allocated
+        np.testing.assert_allclose(store.power.mean_db(), -20.0)
+
+    def test_mismatched_bin_count_is_rejected(self):
+        store = CapturedTapStore()
+        assert store.add(_tap(-10.0), FREQS)
+        assert not store.add(np.zeros(100), np.arange(100.0))
+        assert len(store) == 1
+
+    def test_memory_per_tap_is_over_10x_smaller_than_lists(self):
+        taps = 10
+        store = CapturedTapStore(capacity=taps)
+        for i in range(taps):
+            store.add(_tap(-30.0 - i), FREQS)
+        # Old layout per tap: two N-element lists of boxed floats (8-byte slot + 24-byte float).
+        old_per_tap = 2 * N_BINS * (8 + sys.getsizeof(1.0))
+        assert old_per_tap / (store.nbytes / taps) > 10
+
+
+class TestAnalyzerCapturedTaps:
+
+    def test_assigning_a_list_builds_a_store(self):
+        sut = TapToneAnalyzer.for_testing()
+        sut.captured_taps = [(list(_tap(-10.0)), list(FREQS), dt.datetime.now())]
+        assert isinstance(sut.captured_taps, CapturedTapStore)
+        assert len(sut.captured_taps) == 1
+
+    def test_average_spectra_uses_the_store_views(self):
+        sut = TapToneAnalyzer.for_testing()
+        sut._append_captured_tap(_tap(-10.0), FREQS)
+        sut._append_captured_tap(_tap(-20.0), FREQS)
+        mags, freqs = sut.average_spectra(from_taps=sut.captured_taps)
+        expected = 10.0 * np.log10((10 ** -1.0 + 10 ** -2.0) / 2.0)
+        np.testing.assert_allclose(mags, expected, atol=1e-6)
+        assert isinstance(mags, list) and isinstance(freqs, list)
+        assert len(freqs) == N_BINS
+
+    def test_dropped_plate_tap_is_not_counted(self, monkeypatch):
+        from types import SimpleNamespace
+
+        from guitar_tap.models.material_tap_phase import MaterialTapPhase
+
+        sut = TapToneAnalyzer.for_testing()
+        sut._append_captured_tap(_tap(-10.0), FREQS)
+        sut.current_tap_count = 1
+        rearmed = []
+        monkeypatch.setattr(sut, "align_capture_to_onset", lambda s, **kw: s)
+        monkeypatch.setattr(sut.mic, "compute_gated_fft",
+                            lambda s, rate: (list(np.full(100, -20.0)), list(np.arange(100.0))))
+        monkeypatch.setattr(sut, "find_dominant_peak",
+                            lambda **kw: SimpleNamespace(frequency=60.0, magnitude=-20.0))
+        monkeypatch.setattr(sut, "re_enable_detection_for_next_plate_tap",
+                            lambda: rearmed.append(True))
+        counts = []
+        sut.tapCountChanged.connect(lambda n, total: counts.append(n))
+
+        sut.finish_gated_fft_capture(np.zeros(4096, dtype=np.float32), 48000.0,
+                                     MaterialTapPhase.CAPTURING_LONGITUDINAL)
+
+        assert len(sut.captured_taps) == 1
+        assert sut.current_tap_count == 1 and counts == []
+        assert rearmed == [True]
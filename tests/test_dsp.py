@@ -14,6 +14,9 @@ import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from guitar_tap.models.realtime_fft_analyzer_fft_processing import (
+    FftPlan,
+    dft_anal,
+    fft_plan,
     peak_interp,
     peak_q_factor,
 )
@@ -219,3 +222,54 @@ class TestQFactor:
         q = peak_q_factor(mag, ploc, iploc, ipmag, sample_freq, n_f)
         # Either returns 0 (boundary not found) or a very small value — must not crash.
         assert q[0] >= 0.0, f"Q must be non-negative even in degenerate case; got {q[0]}"
+
+
+# ---------------------------------------------------------------------------
+# FFT plan (Python-only — Swift reuses a single vDSP fftSetup)
+# ---------------------------------------------------------------------------
+
+def _reference_dft_anal(chunk, window_function, n):
+    """The original full-complex-FFT dft_anal, kept here as the parity oracle."""
+    h1 = (window_function.size + 1) // 2
+    h2 = window_function.size // 2
+    fftbuffer = np.zeros(n)
+    windowed = chunk * (window_function / sum(window_function))
+    fftbuffer[:h1] = windowed[h2:]
+    fftbuffer[-h2:] = windowed[:h2]
+    abs_fft = abs(np.fft.fft(fftbuffer)[: n // 2 + 1])
+    abs_fft[1:-1] *= 2.0
+    abs_fft[abs_fft < np.finfo(float).eps] = np.finfo(float).eps
+    return 20 * np.log10(abs_fft), abs_fft
+
+
+class TestFftPlan:
+    """The cached rfft plan must reproduce the original dft_anal output."""
+
+    @pytest.mark.parametrize("window", [np.ones(4096), np.hanning(4096), np.hanning(3000)])
+    def test_plan_matches_reference(self, window):
+        rng = np.random.default_rng(3)
+        chunk = (0.2 * rng.standard_normal(window.size)).astype(np.float32)
+        ref_db, ref_lin = _reference_dft_anal(chunk, window, 4096)
+        db, lin = dft_anal(chunk, window, 4096)
+        np.testing.assert_allclose(lin, ref_lin, rtol=1e-9, atol=1e-15)
+        np.testing.assert_allclose(db, ref_db, rtol=0, atol=1e-9)
+
+    def test_plan_is_cached_and_outputs_are_fresh(self):
+        plan = fft_plan(4096, "rectangular")
+        assert fft_plan(4096, "rectangular") is plan
+        assert fft_plan(8192, "rectangular") is not plan
+        a = np.sin(np.arange(4096) * 0.3).astype(np.float32)
+        db1, _ = plan.execute(a)
+        db2, _ = plan.execute(np.zeros(4096, dtype=np.float32))
+        assert not np.shares_memory(db1, db2)
+        np.testing.assert_array_equal(db1, plan.execute(a)[0])
+
+    def test_invalid_sizes_rejected(self):
+        with pytest.raises(ValueError):
+            fft_plan(3000)
+        with pytest.raises(ValueError):
+            FftPlan(1024, np.ones(2048))
+        with pytest.raises(ValueError):
+            fft_plan(1024, "blackman")
+        with pytest.raises(ValueError):
+            fft_plan(1024, "hann")   # the gated path has its own 1/N-scaled FFT
@@ -0,0 +1,107 @@
+"""Pin find_dominant_peak's selection after vectorisation.
+
+The band slice, median noise floor, local-maximum test, Q and HPS scores are
+now array operations over every candidate (Python-only).  These tests keep the
+previous per-bin implementation as a reference and require the same
+ResonantPeak for synthetic plate/brace-like spectra, in both list and float32
+ndarray form, on both selection strategies.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+from guitar_tap.models.tap_tone_analyzer import TapToneAnalyzer  # noqa: E402
+
+SAMPLE_RATE = 48000.0
+N_BINS = 16385
+
+
+def _reference_dominant_index(a, magnitudes, frequencies, min_hz, max_hz, prefer_lowest):
+    """Per-bin candidate scan and selection (the implementation before vectorisation)."""
+    n = len(magnitudes)
+    start_idx = next((i for i, f in enumerate(frequencies) if f >= min_hz), 0)
+    end_idx = next((i for i, f in enumerate(frequencies) if f > max_hz), n)
+    if start_idx >= end_idx:
+        return None
+    window_size = 5
+    noise_floor = sorted(magnitudes[start_idx:end_idx])[(end_idx - start_idx) // 2]
+    linear = [10.0 ** (max(m, -160.0) / 20.0) for m in magnitudes]
+    candidates = []  # (index, magnitude, hps, q)
+    for i in range(start_idx + window_size, end_idx - window_size):
+        mag = magnitudes[i]
+        if mag <= noise_floor:
+            continue
+        if any(magnitudes[i + o] >= mag for o in range(-window_size, window_size + 1) if o):
+            continue
+        hps = linear[i]
+        for k in (2, 3):
+            if i * k < n:
+                hps *= linear[i * k]
+        q, _ = a._calculate_q_factor(magnitudes, frequencies, i, mag)
+        candidates.append((i, mag, hps, q))
+    if not candidates:
+        return None
+    pool = [c for c in candidates if c[3] >= 3.0] or candidates
+    by_magnitude = sorted(pool, key=lambda c: c[1], reverse=True)
+    if prefer_lowest:
+        return min((c for c in pool if c[1] >= by_magnitude[0][1] - 6.0), key=lambda c: c[0])[0]
+    current = by_magnitude[0]
+    for c in by_magnitude[1:]:
+        if c[0] < current[0] and current[1] - c[1] < 6.0 and c[2] >= current[2] * 0.1:
+            current = c
+    return current[0]
+
+
+def _spectrum(seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Noise floor plus a handful of resonances of assorted widths and levels."""
+    rng = np.random.default_rng(seed)
+    freqs = np.arange(N_BINS) * (SAMPLE_RATE / 2 / (N_BINS - 1))
+    mags = -90.0 + 3.0 * rng.standard_normal(N_BINS)
+    for _ in range(rng.integers(3, 9)):
+        f0 = rng.uniform(30.0, 1800.0)
+        width = rng.uniform(1.0, 40.0)
+        level = rng.uniform(-50.0, -15.0)
+        mags = np.maximum(mags, level - 40.0 * ((freqs - f0) / width) ** 2)
+    return mags.astype(np.float32), freqs.astype(np.float32)
+
+
+@pytest.mark.parametrize("seed", range(12))
+@pytest.mark.parametrize("prefer_lowest", [False, True])
+@pytest.mark.parametrize("as_list", [False, True])
+def test_matches_per_bin_reference(seed, prefer_lowest, as_list):
+    a = TapToneAnalyzer.for_testing()
+    mags, freqs = _spectrum(seed)
+    if as_list:
+        mags, freqs = mags.tolist(), freqs.tolist()
+    min_hz, max_hz = (20.0, 2000.0) if seed % 2 else (60.0, 900.0)
+
+    peak = a.find_dominant_peak(mags, freqs, min_hz, max_hz, prefer_lowest)
+    expected_idx = _reference_dominant_index(a, mags, freqs, min_hz, max_hz, prefer_lowest)
+
+    assert expected_idx is not None and peak is not None
+    freq, mag = a._parabolic_interpolate(mags, freqs, expected_idx)
+    quality, bandwidth = a._calculate_q_factor(mags, freqs, expected_idx, mag)
+    assert (peak.frequency, peak.magnitude) == (freq, mag)
+    assert (peak.quality, peak.bandwidth) == (quality, bandwidth)
+
+
+def test_flat_band_has_no_peak():
+    a = TapToneAnalyzer.for_testing()
+    freqs = np.linspace(0.0, 24000.0, 4096, dtype=np.float32)
+    assert a.find_dominant_peak(np.full(4096, -90.0, dtype=np.float32), freqs) is None
+    assert a.find_dominant_peak([-90.0] * 8, freqs[:8].tolist()) is None
+
+
+def test_upper_median_matches_sorted_index():
+    values = np.random.default_rng(0).standard_normal(1001).astype(np.float32)
+    for n in (1, 2, 7, 1000, 1001):
+        expected = sorted(values[:n].tolist())[n // 2]
+        assert TapToneAnalyzer._upper_median(values[:n]) == expected
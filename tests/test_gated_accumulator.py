@@ -0,0 +1,81 @@
+"""Pin the float32 buffers behind _accumulate_gated_samples.
+
+Python-only storage detail (Swift uses [Float] arrays): the pre-roll, the
+gated accumulator and the deferred level-crossing snapshot are SampleRingBuffers.
+The captured window must still be exactly pre-roll + following audio, in order.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from guitar_tap.models.tap_tone_analyzer import TapToneAnalyzer
+
+RATE = 48000.0
+CHUNK = 1024
+
+
+def _analyzer() -> tuple[TapToneAnalyzer, list]:
+    a = TapToneAnalyzer.for_testing()
+    emitted: list = []
+    thread = a.mic.proc_thread
+    thread.gatedCaptureComplete.disconnect(a.finish_gated_fft_capture)
+    thread.gatedCaptureComplete.connect(lambda s, r, p: emitted.append((s, p)))
+    return a, emitted
+
+
+def _feed(a: TapToneAnalyzer, samples: np.ndarray) -> None:
+    for i in range(0, len(samples), CHUNK):
+        a._accumulate_gated_samples(samples[i:i + CHUNK], RATE)
+
+
+def _ramp(n: int, start: int = 0) -> np.ndarray:
+    return np.arange(start, start + n, dtype=np.float32)
+
+
+class TestGatedAccumulator:
+
+    def test_pre_roll_keeps_only_the_latest_window(self):
+        a, _ = _analyzer()
+        _feed(a, _ramp(50 * CHUNK))
+        n = a._pre_roll_samples
+        assert len(a._pre_roll_buf) == n
+        np.testing.assert_array_equal(a._pre_roll_buf.view(), _ramp(n, 50 * CHUNK - n))
+
+    def test_guitar_window_is_pre_roll_then_following_audio(self):
+        a, emitted = _analyzer()
+        _feed(a, _ramp(20 * CHUNK))
+        pre_roll = a._pre_roll_buf.view().copy()
+        a.start_guitar_gated_capture()
+        target = a._gated_capture_samples
+        _feed(a, _ramp(target, 20 * CHUNK))
+
+        assert len(emitted) == 1
+        window, phase = emitted[0]
+        assert phase is None
+        assert window.dtype == np.float32 and window.shape == (target,)
+        np.testing.assert_array_equal(window[:len(pre_roll)], pre_roll)
+        np.testing.assert_array_equal(
+            window[len(pre_roll):], _ramp(target - len(pre_roll), 20 * CHUNK)
+        )
+        assert len(a._gated_accum) == 0
+
+    def test_file_end_flush_zero_pads_partial_window(self):
+        a, emitted = _analyzer()
+        _feed(a, _ramp(20 * CHUNK))
+        a.start_guitar_gated_capture()
+        seeded = len(a._gated_accum)
+        _feed(a, _ramp(4 * CHUNK, 20 * CHUNK))
+
+        a._flush_gated_capture_on_file_end()
+
+        window, _ = emitted[-1]
+        assert window.shape == (a.mic.fft_size,)
+        filled = seeded + 4 * CHUNK
+        assert np.all(window[filled:] == 0.0)
+        np.testing.assert_array_equal(window[seeded:filled], _ramp(4 * CHUNK, 20 * CHUNK))
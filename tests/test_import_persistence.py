@@ -68,6 +68,8 @@ class TestImportPersistence:
 
         assert result is True, "import_measurements(json) should return True for valid JSON"
         assert len(sut.savedMeasurements) == 1, "One measurement should be in savedMeasurements"
+        # Library writes are queued to the persistence thread; wait for them.
+        assert sut.flush_saved_measurements(timeout=10.0)
         assert os.path.exists(measurements_file()), (
             "saved_measurements.json should exist on disk after import"
         )
@@ -81,6 +83,7 @@ class TestImportPersistence:
 
         sut.import_measurements_from_data(data)
 
+        assert sut.flush_saved_measurements(timeout=10.0)
         assert os.path.exists(measurements_file()), (
             "saved_measurements.json should exist on disk after import_measurements_from_data"
         )
@@ -0,0 +1,80 @@
+"""
+Float32 JSON quantisation (utilities/json_float.py) — Python-only.
+
+``f32_list`` quantises whole arrays with NumPy; it must produce exactly what
+``f32`` produces element by element — same values, same int/float types, so the
+same JSON text as Swift's ``Float`` encoding.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+from models.resonant_peak import ResonantPeak  # noqa: E402
+from utilities.json_float import f32, f32_list  # noqa: E402
+
+
+def _same(values: list) -> None:
+    expected = [f32(v) for v in values]
+    got = f32_list(values)
+    assert json.dumps(got) == json.dumps(expected)
+    assert [type(v) for v in got] == [type(v) for v in expected]
+
+
+class TestF32List:
+
+    @pytest.mark.parametrize("low, high", [
+        (20.0, 20000.0),        # frequencies
+        (-120.0, 0.0),          # magnitudes (dB)
+        (0.0, 500.0),           # quality / bandwidth
+    ])
+    def test_matches_f32_over_field_ranges(self, low, high):
+        rng = np.random.default_rng(7)
+        values = rng.uniform(low, high, 20000)
+        _same(values.tolist())
+        _same(np.round(values, 2).tolist())      # typed-in values
+
+    def test_matches_f32_over_every_magnitude(self):
+        rng = np.random.default_rng(11)
+        bits = rng.integers(0, 2**32, 50000, dtype=np.uint64).astype(np.uint32).view(np.float32)
+        _same([float(v) for v in bits if math.isfinite(v)])
+
+    def test_ties_round_to_even(self):
+        # Exact float32 values halfway between two shortest candidates.
+        _same([19289.9375, -48.3203125, 2514968.75, -1956194.25] * 40)
+
+    def test_integral_non_finite_and_none(self):
+        values = [1.0, -100.0, 0.0, -0.0, 1e20, 0.5, 0.1, float("inf"), 1e-45, 3] * 20
+        _same(values)
+        got = f32_list(values)
+        assert got[0] == 1 and type(got[0]) is int
+        assert f32_list([1.5, None] * 100)[:2] == [1.5, None]
+        assert f32_list(None) is None and f32_list([]) == []
+        assert math.isnan(f32_list([float("nan")] * 200)[0])
+
+
+class TestResonantPeakToDicts:
+
+    def test_bulk_encoding_matches_per_peak(self):
+        rng = np.random.default_rng(3)
+        peaks = [
+            ResonantPeak(id=f"p{i}", frequency=float(f), magnitude=float(m), quality=float(q),
+                         bandwidth=float(f / q), timestamp="2026-01-01T00:00:00Z",
+                         pitch_note="A4", pitch_cents=float(c), pitch_frequency=440.0)
+            for i, (f, m, q, c) in enumerate(zip(rng.uniform(50, 1000, 60),
+                                                rng.uniform(-90, -10, 60),
+                                                rng.uniform(5, 80, 60),
+                                                rng.uniform(-50, 50, 60)))
+        ]
+        for label in (True, False):
+            assert ResonantPeak.to_dicts(peaks, label) == [p.to_dict(label) for p in peaks]
+        assert ResonantPeak.to_dicts([]) == []
@@ -0,0 +1,91 @@
+"""
+Memoised measurement encoding (TapToneMeasurement.to_json) — Python-only.
+
+The library text assembled from memoised records must be byte-identical to
+encoding every record afresh, unchanged measurements must not be encoded again,
+and any change to a measurement must drop its memo.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+from models.spectrum_snapshot import SNAPSHOT_FORMAT_PARAMETRIC_AXIS, SNAPSHOT_FORMAT_V1  # noqa: E402
+from models.tap_tone_measurement import TapToneMeasurement  # noqa: E402
+from views.measurement_summary_index import summary_of  # noqa: E402
+from views.tap_analysis_results_view import (  # noqa: E402
+    measurements_from_json,
+    measurements_to_json,
+)
+
+_HERE = os.path.dirname(__file__)
+
+
+@pytest.fixture
+def ms() -> list[TapToneMeasurement]:
+    out = []
+    for name in ("contreras-classical-1774731564.guitartap",
+                 "plate-umik-1-3-tap-swift-ipad-1784314709.guitartap"):
+        with open(os.path.join(_HERE, name), encoding="utf-8") as f:
+            out += measurements_from_json(f.read())
+    return out
+
+
+@pytest.fixture
+def encodes(monkeypatch) -> list[str]:
+    calls: list[str] = []
+    real = TapToneMeasurement.to_dict
+
+    def counting(self, format_version=SNAPSHOT_FORMAT_V1):
+        calls.append(self.id)
+        return real(self, format_version)
+
+    monkeypatch.setattr(TapToneMeasurement, "to_dict", counting)
+    return calls
+
+
+class TestMeasurementEncodingCache:
+
+    @pytest.mark.parametrize("version", [SNAPSHOT_FORMAT_V1, SNAPSHOT_FORMAT_PARAMETRIC_AXIS])
+    def test_library_text_matches_a_fresh_encode(self, ms, version):
+        expected = json.dumps([m.to_dict(version) for m in ms],
+                              indent=2, ensure_ascii=False, sort_keys=True)
+        assert measurements_to_json(ms, version) == expected
+        assert measurements_to_json(ms, version) == expected      # from the memo
+        assert measurements_to_json([], version) == "[]"
+
+    def test_only_edited_measurements_are_encoded_again(self, ms, encodes):
+        measurements_to_json(ms, SNAPSHOT_FORMAT_V1)
+        assert encodes == [m.id for m in ms]
+
+        encodes.clear()
+        ms[1] = ms[1].with_(measurement_name="Renamed", notes=None)
+        text = measurements_to_json(ms, SNAPSHOT_FORMAT_V1)
+        assert encodes == [ms[1].id]
+        assert json.loads(text)[1]["measurementName"] == "Renamed"
+
+        encodes.clear()
+        measurements_to_json(ms, SNAPSHOT_FORMAT_PARAMETRIC_AXIS)   # memo is per version
+        assert encodes == [m.id for m in ms]
+
+    def test_field_changes_drop_the_memo(self, ms, encodes):
+        m = ms[0]
+        peak = m.peaks[0]
+        before = summary_of(m)
+        m.to_json()
+        m.peak_mode_overrides = {peak.id: "Dipole"}
+        assert "Dipole" in m.to_json()
+        assert summary_of(m) is not before
+
+        m.annotation_offsets[peak.id] = [123.0, -45.0]    # in place: caller marks it
+        m.mark_modified()
+        record = json.loads(m.to_json())
+        assert record["peakAnnotationOffsets"][-1] == {"absFreqHz": 123.0, "absDB": -45.0}
+        assert record == m.to_dict()
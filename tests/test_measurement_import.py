@@ -0,0 +1,144 @@
+"""
+Large-import pipeline (utilities/measurement_decoding.py,
+views/measurement_import.py) — Python-only.
+
+The splitter must cut a ``.guitartap`` array into exactly the elements
+``json.loads`` sees (and refuse anything else), the process-pool decode must
+return what ``measurements_from_json`` returns, in file order, with progress,
+and the merge must append everything with a single library write.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+from models.tap_tone_measurement import TapToneMeasurement  # noqa: E402
+from utilities import measurement_decoding as MI  # noqa: E402
+from views.measurement_import import MeasurementImportWorker  # noqa: E402
+from views.tap_analysis_results_view import (  # noqa: E402
+    measurements_from_json,
+    measurements_to_json,
+)
+
+_HERE = os.path.dirname(__file__)
+
+
+@pytest.fixture
+def backup() -> bytes:
+    """A multi-measurement backup, with names that look like JSON structure."""
+    with open(os.path.join(_HERE, "contreras-classical-1774731564.guitartap"), "rb") as f:
+        guitar = measurements_from_json(f.read())
+    with open(os.path.join(_HERE, "plate-umik-1-3-tap-swift-ipad-1784314709.guitartap"), "rb") as f:
+        plate = measurements_from_json(f.read())
+    ms = []
+    for i in range(6):
+        for m in guitar + plate:
+            ms.append(m.with_(measurement_name=f'{i} [x] {{"y": "\\"}}', notes="a]b}c"))
+    return measurements_to_json(ms).encode("utf-8")
+
+
+class TestSplitMeasurementArray:
+
+    def test_elements_match_json_loads(self, backup):
+        parts = MI.split_measurement_array(backup)
+        assert [json.loads(p) for p in parts] == json.loads(backup)
+
+    def test_compact_and_empty_arrays(self):
+        assert MI.split_measurement_array(b'\xef\xbb\xbf [ {"a":"]"} ,{"b":[1,{}]}]\n') == [
+            b'{"a":"]"}', b'{"b":[1,{}]}']
+        assert MI.split_measurement_array(b"[]") == []
+
+    @pytest.mark.parametrize("data", [
+        b'{"id": "x"}',                 # single object: ordinary decoder
+        b'[{"a": 1} {"b": 2}]',         # missing comma
+        b'[{"a": 1},, {"b": 2}]',
+        b'[{"a": 1}, 2]',               # not an object
+        b'[{"a": 1}, "s"]',
+        b'[{"a": 1}',                   # truncated
+        b'[{"a": 1}] trailing',
+    ])
+    def test_refuses_anything_but_an_array_of_objects(self, data):
+        assert MI.split_measurement_array(data) is None
+
+
+class TestDecodeMeasurements:
+
+    def test_parallel_decode_matches_serial_in_order(self, backup, monkeypatch):
+        monkeypatch.setattr(MI, "PARALLEL_MIN_RECORDS", 1)
+        seen: list[tuple[int, int]] = []
+        ms = MI.decode_measurements(backup, progress=lambda d, t: seen.append((d, t)), jobs=2)
+
+        expected = measurements_from_json(backup)
+        assert [m.to_dict() for m in ms] == [m.to_dict() for m in expected]
+        assert all(isinstance(m, TapToneMeasurement) for m in ms)
+        assert seen[0] == (0, len(expected)) and seen[-1] == (len(expected), len(expected))
+        assert [d for d, _ in seen] == sorted(d for d, _ in seen)
+
+    def test_small_files_decode_in_process(self, backup, monkeypatch):
+        monkeypatch.setattr(MI, "ProcessPoolExecutor", None)   # would fail if used
+        assert len(MI.decode_measurements(backup, jobs=8)) == len(json.loads(backup))
+
+    def test_errors_and_cancellation(self, backup, monkeypatch):
+        with pytest.raises(ValueError):
+            MI.decode_measurements(b"[1, 2]")
+        monkeypatch.setattr(MI, "PARALLEL_MIN_RECORDS", 1)
+        cancelled = threading.Event()
+        cancelled.set()
+        with pytest.raises(MI.ImportCancelled):
+            MI.decode_measurements(backup, jobs=2, cancelled=cancelled)
+
+
+class TestMeasurementImportWorker:
+
+    def test_worker_reports_progress_then_result(self, backup):
+        from PySide6 import QtCore
+
+        direct = QtCore.Qt.ConnectionType.DirectConnection
+        worker = MeasurementImportWorker(backup)
+        seen, results, errors = [], [], []
+        worker.progress.connect(lambda d, t: seen.append((d, t)), direct)
+        worker.finished.connect(results.append, direct)
+        worker.failed.connect(errors.append, direct)
+        worker.start()
+        assert worker.wait(timeout=60.0)
+        assert errors == [] and len(results) == 1
+        assert len(results[0]) == len(json.loads(backup)) and seen[-1][0] == len(results[0])
+
+    def test_failure_is_reported(self):
+        from PySide6 import QtCore
+
+        worker = MeasurementImportWorker(b"not json")
+        errors: list[str] = []
+        worker.failed.connect(errors.append, QtCore.Qt.ConnectionType.DirectConnection)
+        worker.start()
+        assert worker.wait(timeout=10.0)
+        assert len(errors) == 1 and "decode failed" in errors[0]
+
+
+class TestAddImportedMeasurements:
+
+    def test_merge_is_one_library_write(self, backup, monkeypatch):
+        from PySide6 import QtWidgets
+
+        from models.tap_tone_analyzer import TapToneAnalyzer
+        from views.measurement_persistence_worker import persistence_worker
+
+        QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+        sut = TapToneAnalyzer()
+        sut.savedMeasurements.clear()
+        submits: list[int] = []
+        monkeypatch.setattr(persistence_worker(), "submit",
+                            lambda ms, rewrite=False: submits.append(len(ms)))
+
+        imported = measurements_from_json(backup)
+        assert sut.add_imported_measurements(imported) is imported
+        assert submits == [len(imported)]
+        assert sut.savedMeasurements[-len(imported):] == imported
@@ -0,0 +1,102 @@
+"""
+Background measurement persistence (views/measurement_persistence_worker.py) — Python-only.
+
+Bursts of submissions must be coalesced into one write of the newest snapshot,
+a forced rewrite must survive coalescing, failures must be reported through
+the ``persisted`` signal, and flush()/close() must leave nothing unwritten.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+from PySide6 import QtCore  # noqa: E402
+
+from views import tap_analysis_results_view as M  # noqa: E402
+from views.measurement_persistence_worker import MeasurementPersistenceWorker  # noqa: E402
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Record (kind, list) for every library write instead of touching disk."""
+    calls: list[tuple[str, list]] = []
+    result = {"ok": True}
+    gate = threading.Event()
+    gate.set()
+
+    def fake(kind):
+        def save(ms):
+            gate.wait(5.0)
+            calls.append((kind, ms))
+            return result["ok"]
+        return save
+
+    monkeypatch.setattr(M, "save_measurements", fake("save"))
+    monkeypatch.setattr(M, "save_all_measurements", fake("rewrite"))
+    return calls, result, gate
+
+
+@pytest.fixture
+def worker():
+    w = MeasurementPersistenceWorker()
+    yield w
+    w.close()
+
+
+class TestMeasurementPersistenceWorker:
+
+    def test_burst_is_coalesced_into_newest_snapshot(self, writes, worker):
+        calls, _, _ = writes
+        worker.COALESCE_SECONDS = 0.5
+        library: list = []
+        for i in range(20):
+            library.append(i)
+            worker.submit(library)
+        assert worker.flush(timeout=5.0)
+        assert calls == [("save", list(range(20)))]
+        assert worker.is_idle
+
+    def test_submit_snapshots_the_list(self, writes, worker):
+        calls, _, gate = writes
+        gate.clear()                       # hold the writer inside the first write
+        library = [1]
+        worker.submit(library)
+        library.append(2)                  # mutated after submit — not seen by that write
+        gate.set()
+        assert worker.flush(timeout=5.0)
+        assert calls[0][1] == [1]
+
+    def test_forced_rewrite_survives_coalescing(self, writes, worker):
+        calls, _, _ = writes
+        worker.COALESCE_SECONDS = 0.5
+        worker.submit([1], rewrite=True)
+        worker.submit([1, 2])
+        assert worker.flush(timeout=5.0)
+        assert calls == [("rewrite", [1, 2])]
+
+    def test_failure_is_reported_through_signal(self, writes, worker):
+        _, result, _ = writes
+        result["ok"] = False
+        reports: list[tuple[bool, str]] = []
+        worker.persisted.connect(lambda ok, msg: reports.append((ok, msg)),
+                                 QtCore.Qt.ConnectionType.DirectConnection)
+        worker.submit([1])
+        assert worker.flush(timeout=5.0)
+        assert len(reports) == 1 and reports[0][0] is False and reports[0][1]
+
+    def test_close_flushes_and_later_submits_write_inline(self, writes):
+        calls, _, _ = writes
+        w = MeasurementPersistenceWorker()
+        w.COALESCE_SECONDS = 5.0            # close() must not wait out the burst
+        w.submit([1])
+        w.close()
+        assert calls == [("save", [1])]
+        w.submit([1, 2])
+        assert calls[-1] == ("save", [1, 2])
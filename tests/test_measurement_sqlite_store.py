@@ -0,0 +1,230 @@
+"""
+SQLite measurement library (views/measurement_sqlite_store.py) — Python-only.
+
+Loading must not decode any record or spectrum until one is read (the list is
+built from the summary columns), the JSON library must migrate on first use and
+be re-imported or reported when it changes behind the SQLite library's back, and
+a reload must reproduce the in-memory list exactly (same ``to_dict`` as the JSON
+library).
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+from models.tap_tone_measurement import TapToneMeasurement  # noqa: E402
+from views.measurement_sqlite_store import SqliteMeasurementStore  # noqa: E402
+from views.tap_analysis_results_view import (  # noqa: E402
+    measurements_from_json,
+    measurements_to_json,
+)
+
+_HERE = os.path.dirname(__file__)
+
+
+def _fixture(name: str) -> list[TapToneMeasurement]:
+    with open(os.path.join(_HERE, name), encoding="utf-8") as f:
+        return measurements_from_json(f.read())
+
+
+def _reload(path: str) -> list:
+    store = SqliteMeasurementStore(path)
+    try:
+        return store.load(TapToneMeasurement.from_dict)
+    finally:
+        store.close()
+
+
+@pytest.fixture
+def guitar_and_plate():
+    return (_fixture("contreras-classical-1774731564.guitartap")
+            + _fixture("plate-umik-1-3-tap-swift-ipad-1784314709.guitartap"))
+
+
+@pytest.fixture
+def library(tmp_path, guitar_and_plate):
+    path = str(tmp_path / "saved_measurements.sqlite")
+    store = SqliteMeasurementStore(path)
+    store.load(TapToneMeasurement.from_dict)
+    ms = list(guitar_and_plate)
+    store.save(ms, measurements_to_json)
+    yield path, store, ms
+    store.close()
+
+
+class TestSqliteLibrary:
+
+    def test_reload_matches_json_library_and_defers_spectra(self, library):
+        path, _, ms = library
+        loaded = _reload(path)
+        snaps = [m.spectrum_snapshot or m.longitudinal_snapshot for m in loaded]
+        assert all(s.is_spectrum_deferred for s in snaps)
+        assert measurements_to_json(loaded) == measurements_to_json(ms)
+        assert not any(s.is_spectrum_deferred for s in snaps)
+
+    def test_summary_columns(self, library):
+        _, store, ms = library
+        rows = store.summaries()
+        assert [r.id for r in rows] == [m.id for m in ms]
+        guitar, plate = rows[0], rows[-1]
+        assert guitar.air_hz and guitar.top_hz
+        assert guitar.e_long_gpa is None
+        assert guitar.has_spectrum is True and guitar.is_comparison is False
+        assert guitar.tap_tone_ratio == ms[0].tap_tone_ratio
+        assert plate.measurement_type == ms[-1].resolved_measurement_type
+        assert plate.e_long_gpa > 0 and plate.e_cross_gpa > 0
+        assert plate.air_hz is None
+
+    def test_list_is_built_from_summary_columns_without_decoding(self, library):
+        from views.measurement_summary_index import summary_of
+
+        path, store, ms = library
+        loaded = SqliteMeasurementStore(path).load(TapToneMeasurement.from_dict)
+        assert all(m.is_record_deferred for m in loaded)
+        summaries = [summary_of(m) for m in loaded]
+        assert all(m.is_record_deferred for m in loaded)
+        assert summaries == store.summaries()
+        assert [s.measurement_name for s in summaries] == [m.measurement_name for m in ms]
+
+    def test_rows_from_before_the_summary_columns_are_backfilled(self, tmp_path, library):
+        path, store, ms = library
+        store.close()
+        with sqlite3.connect(path) as db:
+            db.execute("UPDATE measurements SET summary_version = NULL, tap_tone_ratio = NULL")
+        loaded = _reload(path)
+        assert [m.tap_tone_ratio for m in loaded] == [m.tap_tone_ratio for m in ms]
+        with sqlite3.connect(path) as db:
+            assert db.execute("SELECT COUNT(*) FROM measurements "
+                              "WHERE summary_version IS NULL").fetchone()[0] == 0
+
+    def test_rename_delete_and_reorder_sync(self, library):
+        path, store, ms = library
+        ms[0] = ms[0].with_(measurement_name="renamed", notes="n")
+        store.save(ms, measurements_to_json)
+        ms.append(ms.pop(0))
+        store.save(ms, measurements_to_json)
+        del ms[0]
+        store.save(ms, measurements_to_json)
+        loaded = _reload(path)
+        assert [m.measurement_name for m in loaded] == [m.measurement_name for m in ms]
+        assert measurements_to_json(loaded) == measurements_to_json(ms)
+
+    def test_edit_of_lazily_loaded_measurement_keeps_its_spectra(self, library):
+        path, _, ms = library
+        store = SqliteMeasurementStore(path)
+        loaded = store.load(TapToneMeasurement.from_dict)
+        loaded[0] = loaded[0].with_(measurement_name="edited", notes="")
+        store.save(loaded, measurements_to_json)
+        store.close()
+        again = _reload(path)
+        assert again[0].measurement_name == "edited"
+        assert again[0].spectrum_snapshot.magnitudes == ms[0].spectrum_snapshot.magnitudes
+
+    def test_migrates_json_library_once(self, tmp_path, guitar_and_plate):
+        json_path = str(tmp_path / "saved_measurements.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            f.write(measurements_to_json(guitar_and_plate))
+        db_path = str(tmp_path / "saved_measurements.sqlite")
+
+        store = SqliteMeasurementStore(db_path, legacy_json_path=json_path)
+        loaded = store.load(TapToneMeasurement.from_dict)
+        assert measurements_to_json(loaded) == measurements_to_json(guitar_and_plate)
+        store.save([], measurements_to_json)
+        store.close()
+
+        # Emptied by the user — must not re-import the JSON backup.
+        store = SqliteMeasurementStore(db_path, legacy_json_path=json_path)
+        assert store.load(TapToneMeasurement.from_dict) == []
+        store.close()
+        assert os.path.exists(json_path)
+
+    def test_record_column_holds_no_spectrum_data(self, library):
+        path, _, _ = library
+        with sqlite3.connect(path) as db:
+            records = [r for (r,) in db.execute("SELECT record FROM measurements")]
+        assert records and not any("magnitudesData" in r for r in records)
+
+
+class TestJsonLibrarySync:
+    """The JSON library and the SQLite library never silently drift apart."""
+
+    @pytest.fixture
+    def migrated(self, tmp_path, guitar_and_plate):
+        json_path = str(tmp_path / "saved_measurements.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            f.write(measurements_to_json(guitar_and_plate[:1]))
+        db_path = str(tmp_path / "saved_measurements.sqlite")
+        store = SqliteMeasurementStore(db_path, legacy_json_path=json_path)
+        store.load(TapToneMeasurement.from_dict)
+        store.close()
+        return json_path, db_path
+
+    @staticmethod
+    def _load(db_path, json_path):
+        store = SqliteMeasurementStore(db_path, legacy_json_path=json_path)
+        try:
+            return store.load(TapToneMeasurement.from_dict), store.has_unsynced_changes()
+        finally:
+            store.close()
+
+    def test_json_saved_meanwhile_is_reimported(self, migrated, guitar_and_plate):
+        json_path, db_path = migrated
+        with open(json_path, "w", encoding="utf-8") as f:   # saved on the JSON backend
+            f.write(measurements_to_json(guitar_and_plate))
+        loaded, changed = self._load(db_path, json_path)
+        assert [m.id for m in loaded] == [m.id for m in guitar_and_plate]
+        assert not changed
+
+    def test_both_changed_keeps_sqlite_and_warns(self, migrated, guitar_and_plate, monkeypatch):
+        import views.measurement_sqlite_store as S
+
+        json_path, db_path = migrated
+        store = SqliteMeasurementStore(db_path, legacy_json_path=json_path)
+        ms = store.load(TapToneMeasurement.from_dict)
+        store.save(ms + guitar_and_plate[1:], measurements_to_json)
+        store.close()
+        with open(json_path, "w", encoding="utf-8") as f:
+            f.write(measurements_to_json([]))
+        logged = []
+        monkeypatch.setattr(S, "gt_log", logged.append)
+        loaded, changed = self._load(db_path, json_path)
+        assert len(loaded) == len(guitar_and_plate) and changed
+        assert any("diverged" in line for line in logged)
+
+    def test_switching_backends_writes_the_library_across(self, tmp_path, guitar_and_plate,
+                                                          monkeypatch):
+        import views.tap_analysis_results_view as R
+        from views.measurement_store import JournaledMeasurementStore
+        from views.utilities.tap_settings_view import AppSettings
+
+        json_path = str(tmp_path / "saved_measurements.json")
+        db_path = str(tmp_path / "saved_measurements.sqlite")
+        monkeypatch.setattr(R, "measurements_file", lambda: json_path)
+        monkeypatch.setattr(R, "measurements_database_file", lambda: db_path)
+        backend = ["json"]
+        monkeypatch.setattr(AppSettings, "measurement_library_backend",
+                            classmethod(lambda cls: backend[0]))
+        monkeypatch.setattr(AppSettings, "set_measurement_library_backend",
+                            classmethod(lambda cls, v: backend.__setitem__(0, v)))
+
+        assert R.switch_measurement_library_backend("sqlite", list(guitar_and_plate))
+        assert backend == ["sqlite"]
+        loaded, changed = self._load(db_path, json_path)
+        assert [m.id for m in loaded] == [m.id for m in guitar_and_plate]
+
+        ms = guitar_and_plate[:1]
+        R._library_store().save(ms, measurements_to_json)
+        assert R._library_store().has_unsynced_changes()
+        assert R.switch_measurement_library_backend("json", ms)
+        assert backend == ["json"]
+        json_lib = JournaledMeasurementStore(json_path).load(TapToneMeasurement.from_dict)
+        assert [m.id for m in json_lib] == [m.id for m in ms]
+        assert not R._library_store("sqlite").has_unsynced_changes()
+        R._library_store("sqlite").close()
@@ -0,0 +1,115 @@
+"""
+Journaled measurement library (views/measurement_store.py) — Python-only.
+
+A single append, rename or delete must be journaled without rewriting the
+base library file, a reload must reproduce the in-memory list exactly, and
+compaction / crash recovery must never lose or double-apply a change.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+from models.tap_tone_measurement import TapToneMeasurement  # noqa: E402
+from views import measurement_store  # noqa: E402
+from views.measurement_store import JournaledMeasurementStore  # noqa: E402
+from views.tap_analysis_results_view import measurements_to_json  # noqa: E402
+
+
+def _m(name: str) -> TapToneMeasurement:
+    return TapToneMeasurement.create(peaks=[], measurement_name=name)
+
+
+def _reload(path: str) -> list:
+    return JournaledMeasurementStore(path).load(TapToneMeasurement.from_dict)
+
+
+@pytest.fixture
+def library(tmp_path):
+    path = str(tmp_path / "saved_measurements.json")
+    store = JournaledMeasurementStore(path)
+    store.load(TapToneMeasurement.from_dict)
+    ms = [_m("A"), _m("B"), _m("C")]
+    store.save(ms, measurements_to_json)
+    return path, store, ms
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class TestJournal:
+
+    def test_first_save_writes_canonical_base(self, library):
+        path, store, ms = library
+        assert _read(path).decode("utf-8") == measurements_to_json(ms)
+        assert not os.path.exists(store.journal_path)
+
+    def test_single_changes_are_journaled_not_rewritten(self, library):
+        path, store, ms = library
+        base = _read(path)
+
+        ms.append(_m("D"))
+        store.save(ms, measurements_to_json)
+        ms[1] = ms[1].with_(measurement_name="B renamed", notes="n")
+        store.save(ms, measurements_to_json)
+        ms.pop(0)
+        store.save(ms, measurements_to_json)
+        store.save(ms, measurements_to_json)  # no change — nothing written
+
+        assert _read(path) == base
+        with open(store.journal_path, encoding="utf-8") as f:
+            assert len(f.readlines()) == 1 + 3  # header + append, replace, delete
+        assert measurements_to_json(_reload(path)) == measurements_to_json(ms)
+
+    def test_reordering_rewrites_and_drops_journal(self, library):
+        path, store, ms = library
+        ms.append(_m("D"))
+        store.save(ms, measurements_to_json)
+        ms.reverse()
+        store.save(ms, measurements_to_json)
+        assert not os.path.exists(store.journal_path)
+        assert _read(path).decode("utf-8") == measurements_to_json(ms)
+
+    def test_compacts_once_journal_outgrows_base(self, library, monkeypatch):
+        path, store, ms = library
+        monkeypatch.setattr(measurement_store, "_MIN_COMPACT_BYTES", 0)
+        for i in range(8):
+            ms[0] = ms[0].with_(measurement_name="A", notes="x" * 200 * (i + 1))
+            store.save(ms, measurements_to_json)
+        assert measurements_to_json(_reload(path)) == measurements_to_json(ms)
+        assert b"x" * 200 in _read(path)  # at least one compaction happened
+
+    def test_stale_journal_is_not_replayed(self, library):
+        path, store, ms = library
+        ms.append(_m("D"))
+        store.save(ms, measurements_to_json)
+        journal = _read(store.journal_path)
+        # Crash after the compacted base was renamed into place but before the
+        # journal was removed.
+        store.rewrite(ms, measurements_to_json)
+        with open(store.journal_path, "wb") as f:
+            f.write(journal)
+        assert [m.measurement_name for m in _reload(path)] == ["A", "B", "C", "D"]
+
+    def test_torn_tail_is_ignored_and_trimmed(self, library):
+        path, store, ms = library
+        ms.append(_m("D"))
+        store.save(ms, measurements_to_json)
+        with open(store.journal_path, "ab") as f:
+            f.write(b'{"op":"append","measurements":[{"id"')
+
+        reopened = JournaledMeasurementStore(path)
+        loaded = reopened.load(TapToneMeasurement.from_dict)
+        assert [m.measurement_name for m in loaded] == ["A", "B", "C", "D"]
+
+        loaded.append(_m("E"))
+        reopened.save(loaded, measurements_to_json)
+        assert [m.measurement_name for m in _reload(path)] == ["A", "B", "C", "D", "E"]
@@ -0,0 +1,144 @@
+"""
+Measurement library summary index (views/measurement_summary_index.py) — Python-only.
+
+A save must leave a summary index beside the library; a reload with a current
+index must return deferred measurements that decode nothing until a full field
+is read, the index must be rebuilt incrementally, and an index that no longer
+matches the library files must be ignored.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+from models.guitar_mode import GuitarMode  # noqa: E402
+from models.tap_tone_measurement import TapToneMeasurement  # noqa: E402
+from views import measurement_summary_index as msi  # noqa: E402
+from views.measurement_store import JournaledMeasurementStore  # noqa: E402
+from views.tap_analysis_results_view import (  # noqa: E402
+    measurements_from_json,
+    measurements_to_json,
+)
+
+_HERE = os.path.dirname(__file__)
+
+
+def _fixture(name: str) -> list[TapToneMeasurement]:
+    with open(os.path.join(_HERE, name), encoding="utf-8") as f:
+        return measurements_from_json(f.read())
+
+
+@pytest.fixture
+def library(tmp_path):
+    path = str(tmp_path / "saved_measurements.json")
+    store = JournaledMeasurementStore(path)
+    store.load(TapToneMeasurement.from_dict)
+    ms = (_fixture("contreras-classical-1774731564.guitartap")
+          + _fixture("plate-umik-1-3-tap-swift-ipad-1784314709.guitartap"))
+    store.save(ms, measurements_to_json)
+    return path, store, ms
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    calls: list[str] = []
+    real = TapToneMeasurement.from_dict
+
+    def counting(d):
+        calls.append(d.get("id"))
+        return real(d)
+
+    return calls, counting
+
+
+class TestSummaryIndex:
+
+    def test_save_writes_summaries_with_headline_values(self, library):
+        path, store, ms = library
+        loaded = msi.read_index(store.index_path)
+        assert loaded is not None
+        _, summaries = loaded
+        assert [s.id for s in summaries] == [m.id for m in ms]
+        guitar, plate = summaries[0], summaries[-1]
+        assert guitar.air_hz == pytest.approx(ms[0].definitive_peak(GuitarMode.AIR).frequency)
+        assert guitar.tap_tone_ratio == pytest.approx(ms[0].tap_tone_ratio)
+        assert plate.e_long_gpa is not None and plate.e_cross_gpa is not None
+        assert all(s.content_hash for s in summaries)
+        assert summaries[0].content_hash == msi.record_digest(ms[0].to_dict())
+
+    def test_reload_is_deferred_until_a_full_field_is_read(self, library, decodes):
+        path, _, ms = library
+        calls, counting = decodes
+        reloaded = JournaledMeasurementStore(path).load(counting)
+
+        assert calls == []
+        assert all(m.is_record_deferred for m in reloaded)
+        assert [msi.summary_of(m).title for m in reloaded] == [
+            m.measurement_name or "Measurement" for m in ms]
+        assert reloaded[0].measurement_name == ms[0].measurement_name
+        assert calls == []
+
+        first = reloaded[0]
+        peaks = first.peaks                       # resolves this record only
+        assert calls == [ms[0].id]
+        assert type(first) is TapToneMeasurement and not first.is_record_deferred
+        assert [p.id for p in peaks] == [p.id for p in ms[0].peaks]
+        assert reloaded[1].is_record_deferred
+        fresh = JournaledMeasurementStore(path).load(TapToneMeasurement.from_dict)
+        assert reloaded[1] == fresh[1]            # __eq__ resolves both sides
+        assert not reloaded[1].is_record_deferred and not fresh[1].is_record_deferred
+        assert measurements_to_json(reloaded) == measurements_to_json(ms)
+        assert reloaded == measurements_from_json(measurements_to_json(ms))
+
+    def test_index_is_rebuilt_incrementally(self, library, monkeypatch):
+        path, store, ms = library
+        summarised: list[str] = []
+        real = msi.MeasurementSummary.from_measurement
+        monkeypatch.setattr(msi.MeasurementSummary, "from_measurement",
+                            staticmethod(lambda m, record=None: summarised.append(m.id)
+                                         or real(m, record)))
+        ms[1] = ms[1].with_(measurement_name="Renamed", notes=None)
+        store.save(ms, measurements_to_json)
+        assert summarised == [ms[1].id]
+        _, summaries = msi.read_index(store.index_path)
+        assert summaries[1].measurement_name == "Renamed"
+
+        reloaded = JournaledMeasurementStore(path).load(TapToneMeasurement.from_dict)
+        assert msi.summary_of(reloaded[1]).measurement_name == "Renamed"
+        assert reloaded[1].notes is None and reloaded[1].is_record_deferred
+
+    def test_stale_index_is_ignored(self, library, decodes):
+        path, store, ms = library
+        other = JournaledMeasurementStore(path)   # a second writer the index never saw
+        other.load(TapToneMeasurement.from_dict)
+        with open(store.index_path, "rb") as f:
+            index_before = f.read()
+        ms2 = list(ms) + [TapToneMeasurement.create(peaks=[], measurement_name="New")]
+        other.save(ms2, measurements_to_json)
+        with open(store.index_path, "wb") as f:  # put the old index back
+            f.write(index_before)
+
+        calls, counting = decodes
+        reloaded = JournaledMeasurementStore(path).load(counting)
+        assert len(calls) == len(ms2)
+        assert not any(m.is_record_deferred for m in reloaded)
+        assert reloaded[-1].measurement_name == "New"
+
+    def test_duplicate_ids_resolve_by_content_hash(self, tmp_path):
+        path = str(tmp_path / "saved_measurements.json")
+        store = JournaledMeasurementStore(path)
+        store.load(TapToneMeasurement.from_dict)
+        a = TapToneMeasurement.create(peaks=[], measurement_name="A", notes="first")
+        b = TapToneMeasurement.from_dict(dict(a.to_dict(), notes="second"))
+        store.save([a, b], measurements_to_json)
+
+        reloaded = JournaledMeasurementStore(path).load(TapToneMeasurement.from_dict)
+        assert reloaded[1].annotation_offsets is None   # resolve the second first
+        assert reloaded[1].to_dict() == b.to_dict()
+        assert reloaded[0].to_dict() == a.to_dict()
@@ -0,0 +1,157 @@
+"""Pin offline (accelerated) file playback — process_file_data(realtime=False).
+
+Python-only: Swift always paces file playback at the audio rate.  Offline mode
+drops the per-chunk sleep and runs every _main_async_after timer on a virtual
+audio clock, so it must produce the same measurement as real-time playback —
+just much faster.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+from models.measurement_type import MeasurementType
+
+GUITAR_WAV = os.path.join(os.path.dirname(__file__), "Recording.wav")
+GUITAR_TAPS = 8
+G1_WAV = os.path.join(os.path.dirname(__file__), "Recording 5.wav")
+G1_RING_OUT_SEC = 0.0853
+BRACE_WAV = os.path.join(os.path.dirname(__file__), "brace-umik-1-swift-mac-1778816093.wav")
+BRACE_TAP_THRESHOLD = -53.33838
+CALIBRATION_PATH = os.path.join(os.path.dirname(__file__), "7108913.txt")
+
+
+def _analyzer():
+    import soundfile as sf
+    from models.tap_tone_analyzer import TapToneAnalyzer
+    return TapToneAnalyzer.for_testing(sample_rate=int(sf.info(GUITAR_WAV).samplerate))
+
+
+def _play_guitar(realtime: bool):
+    sut = _analyzer()
+    sut.peak_min_threshold = -76.0
+    sut.tap_detection_threshold = -40.0
+    t0 = time.monotonic()
+    sut.play_file_for_testing(
+        path=GUITAR_WAV,
+        measurement_type=MeasurementType.GENERIC,
+        number_of_taps=GUITAR_TAPS,
+        realtime=realtime,
+    )
+    return sut, time.monotonic() - t0
+
+
+def _peaks(sut) -> list[tuple[float, float]]:
+    return [(round(p.frequency, 3), round(p.magnitude, 3)) for p in sut.all_peaks]
+
+
+class TestOfflinePlayback:
+
+    def test_guitar_multi_tap_matches_realtime(self):
+        rt, rt_elapsed = _play_guitar(realtime=True)
+        off, off_elapsed = _play_guitar(realtime=False)
+
+        assert off.is_measurement_complete
+        assert len(off.captured_taps) == len(rt.captured_taps) == GUITAR_TAPS
+        assert _peaks(off) == _peaks(rt)
+        # No pacing: the offline run must be far quicker than the paced one.
+        assert off_elapsed < rt_elapsed / 3
+        assert not off.mic.is_offline_playback
+        assert off._virtual_timers == []
+
+    def test_brace_offline_matches_realtime(self):
+        from models.tap_tone_analyzer import TapToneAnalyzer
+        import soundfile as sf
+
+        results = []
+        for realtime in (True, False):
+            sut = TapToneAnalyzer.for_testing(sample_rate=int(sf.info(BRACE_WAV).samplerate))
+            sut.tap_detection_threshold = BRACE_TAP_THRESHOLD
+            sut.play_file_for_testing(
+                path=BRACE_WAV,
+                measurement_type=MeasurementType.BRACE,
+                number_of_taps=1,
+                calibration_path=CALIBRATION_PATH,
+                realtime=realtime,
+            )
+            assert sut.is_measurement_complete
+            results.append(_peaks(sut))
+        assert results[0] == results[1]
+
+    def test_ringout_is_measured_on_the_audio_clock(self):
+        """The 3-s decay window is audio time offline, so the ring-out matches REG-G ringout."""
+        from models.tap_tone_analyzer import TapToneAnalyzer
+        import soundfile as sf
+
+        sut = TapToneAnalyzer.for_testing(sample_rate=int(sf.info(G1_WAV).samplerate))
+        sut.peak_min_threshold = -76.0
+        sut.tap_detection_threshold = -40.0
+        sut.play_file_for_testing(
+            path=G1_WAV, measurement_type=MeasurementType.GENERIC, number_of_taps=1, realtime=False,
+        )
+        assert sut.current_decay_time is not None
+        assert abs(sut.current_decay_time - G1_RING_OUT_SEC) < 0.03
+        assert not sut.is_tracking_decay
+
+    def test_incomplete_measurement_does_not_wait_for_the_wall_clock(self):
+        """Offline, a file that never completes returns once the virtual clock is drained."""
+        sut = _analyzer()
+        sut.peak_min_threshold = -76.0
+        sut.tap_detection_threshold = -40.0
+        t0 = time.monotonic()
+        sut.play_file_for_testing(
+            path=G1_WAV, measurement_type=MeasurementType.GENERIC, number_of_taps=3,
+            realtime=False,
+        )
+        assert not sut.is_measurement_complete
+        assert time.monotonic() - t0 < 2.0
+
+
+class TestVirtualClock:
+
+    @pytest.fixture
+    def offline(self):
+        sut = _analyzer()
+        sut.mic.is_offline_playback = True
+        yield sut
+        sut.mic.is_offline_playback = False
+
+    def test_timers_fire_in_due_order_when_clock_passes(self, offline):
+        fired: list[str] = []
+        offline.mic.audio_elapsed = 1.0
+        offline._main_async_after(200, lambda: fired.append("b"))
+        offline._main_async_after(100, lambda: fired.append("a"))
+        offline._main_async_after(100, lambda: fired.append("a2"))
+
+        offline._advance_virtual_clock(1.05)
+        assert fired == []
+        offline._advance_virtual_clock(1.25)
+        assert fired == ["a", "a2", "b"]
+
+    def test_rescheduled_timer_is_timed_from_its_due_time(self, offline):
+        fired: list[float] = []
+        offline.mic.audio_elapsed = 0.0
+
+        def first() -> None:
+            offline._main_async_after(100, lambda: fired.append(offline._virtual_now))
+
+        offline._main_async_after(100, first)
+        offline._advance_virtual_clock(0.5)
+        assert fired == [pytest.approx(0.2)]
+
+    def test_end_of_stream_drains_within_horizon_and_discards_rest(self, offline):
+        fired: list[str] = []
+        offline.mic.audio_elapsed = 0.0
+        offline._main_async_after(4000, lambda: fired.append("near"))
+        offline._main_async_after(60000, lambda: fired.append("far"))
+
+        offline._advance_virtual_clock(0.0, end_of_stream=True)
+        assert fired == ["near"]
+        assert offline._virtual_timers == []
@@ -423,3 +423,88 @@ class TestGuitarFullSavePeaks:
         saved = sut.guitar_full_save_peaks()
         assert len(saved) == len(displayed), "a loaded measurement is saved as-is (Re-analyze regenerates)"
         assert not any(self._is_air(p) for p in saved), "no full-set upgrade for a loaded measurement"
+
+
+# ---------------------------------------------------------------------------
+# ndarray input (Python-only — find_peaks runs as NumPy array operations)
+# ---------------------------------------------------------------------------
+
+
+def _peak_tuples(peaks):
+    return [(p.frequency, p.magnitude, p.quality, p.bandwidth, p.pitch_note) for p in peaks]
+
+
+class TestFindPeaksArrayInput:
+    """Lists and ndarrays of the same spectrum must yield the same peaks."""
+
+    def _spectrum(self):
+        a = make_spectrum(peak_hz=110.0, peak_db=-30.0)
+        b = make_spectrum(peak_hz=220.0, peak_db=-25.0)
+        c = make_spectrum(peak_hz=405.0, peak_db=-40.0, half_width_hz=12.0)
+        return combine_spectra(combine_spectra(a, b), c)
+
+    # (frequency, magnitude, Q, bandwidth) of _fine_spectrum's peaks as found by
+    # the list-based find_peaks that preceded the ndarray path, in its order.
+    EXPECTED_FINE_PEAKS = [
+        (220.0, -25.0, 18.75, 11.71875),
+        (110.0, -30.0, 7.6, 14.6484375),
+        (151.3, -33.0, 13.0, 11.71875),
+        (405.0, -40.0, 13.8, 29.296875),
+    ]
+
+    def _fine_spectrum(self):
+        """Four peaks, one between bins, on an 8193-bin (~2.9 Hz) grid."""
+        parts = [
+            make_spectrum(peak_hz=110.0, bin_count=8193, peak_db=-30.0),
+            make_spectrum(peak_hz=220.0, bin_count=8193, peak_db=-25.0),
+            make_spectrum(peak_hz=405.0, bin_count=8193, peak_db=-40.0, half_width_hz=12.0),
+            make_spectrum(peak_hz=151.3, bin_count=8193, peak_db=-33.0, half_width_hz=4.0),
+        ]
+        spectrum = parts[0]
+        for part in parts[1:]:
+            spectrum = combine_spectra(spectrum, part)
+        return spectrum
+
+    def test_matches_values_from_the_list_implementation(self):
+        mags, freqs = self._fine_spectrum()
+        for m, f in ((mags, freqs), (np.asarray(mags), np.asarray(freqs))):
+            peaks = make_sut().find_peaks(m, f, min_hz=50, max_hz=600, peak_min_override=-60)
+            assert [t[:4] for t in _peak_tuples(peaks)] == self.EXPECTED_FINE_PEAKS
+
+    def test_float64_array_matches_list(self):
+        sut = make_sut()
+        mags, freqs = self._spectrum()
+        from_list = sut.find_peaks(mags, freqs, min_hz=50, max_hz=600, peak_min_override=-60)
+        from_array = sut.find_peaks(
+            np.asarray(mags), np.asarray(freqs), min_hz=50, max_hz=600, peak_min_override=-60
+        )
+        assert len(from_list) >= 2
+        assert _peak_tuples(from_array) == _peak_tuples(from_list)
+
+    def test_float32_array_matches_list_of_float32(self):
+        sut = make_sut()
+        mags, freqs = self._spectrum()
+        mags32 = np.asarray(mags, dtype=np.float32)
+        from_list = sut.find_peaks(list(mags32), freqs, min_hz=50, max_hz=600, peak_min_override=-60)
+        from_array = sut.find_peaks(mags32, np.asarray(freqs), min_hz=50, max_hz=600,
+                                    peak_min_override=-60)
+        assert _peak_tuples(from_array) == _peak_tuples(from_list)
+
+    def test_analyze_magnitudes_plate_median_matches_list_path(self):
+        """Material live path: searchsorted band + np.partition median == sorted() median."""
+        from guitar_tap.models.measurement_type import MeasurementType
+
+        mags, freqs = self._spectrum()
+        saved = TDS.measurement_type()
+        TDS.set_measurement_type(MeasurementType.PLATE)
+        try:
+            results = []
+            for m, f in ((mags, freqs), (np.asarray(mags), np.asarray(freqs))):
+                sut = make_sut()
+                sut.is_detecting = True
+                sut.min_frequency, sut.max_frequency = 50, 600
+                sut.analyze_magnitudes(m, f, peak_magnitude=-25.0)
+                results.append(_peak_tuples(sut.all_peaks))
+            assert results[0] and results[0] == results[1]
+        finally:
+            TDS.set_measurement_type(saved)
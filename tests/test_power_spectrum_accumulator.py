@@ -0,0 +1,97 @@
+"""Pin the running power average behind average_spectra (Python-only).
+
+Folding taps one at a time must give the same spectrum as the Swift-parity
+batch formula 10·log10(mean(10^(dB/10))), and captured_taps resets must never
+leak stale taps into the average.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from guitar_tap.models.tap_tone_analyzer import TapToneAnalyzer
+from guitar_tap.utilities.power_spectrum_accumulator import PowerSpectrumAccumulator
+
+N_BINS = 257
+
+
+def _spectra(n: int, seed: int = 0) -> list[list[float]]:
+    """Random dB spectra, exactly representable in float32 (the capture-store precision)."""
+    rng = np.random.default_rng(seed)
+    return rng.uniform(-100.0, -10.0, size=(n, N_BINS)).astype(np.float32).astype(np.float64).tolist()
+
+
+def _reference_average(spectra: list[list[float]]) -> list[float]:
+    """Per-bin loop of Swift averageSpectra(from:)."""
+    power_sum = [0.0] * N_BINS
+    for mags in spectra:
+        for b in range(N_BINS):
+            power_sum[b] += 10.0 ** (mags[b] / 10.0)
+    return [10.0 * math.log10(p / len(spectra)) for p in power_sum]
+
+
+class TestPowerSpectrumAccumulator:
+
+    def test_mean_and_variance_match_batch(self):
+        spectra = np.asarray(_spectra(5))
+        acc = PowerSpectrumAccumulator(track_variance=True)
+        for mags in spectra:
+            acc.add(mags)
+        power = 10.0 ** (spectra / 10.0)
+        np.testing.assert_allclose(acc.mean_db(), 10.0 * np.log10(power.mean(axis=0)), rtol=1e-12)
+        np.testing.assert_allclose(acc.variance(), power.var(axis=0), rtol=1e-9, atol=1e-30)
+
+    def test_length_mismatch_marks_inconsistent(self):
+        acc = PowerSpectrumAccumulator()
+        acc.add([-10.0, -20.0])
+        acc.add([-10.0])
+        assert not acc.is_consistent
+
+
+class TestAnalyzerAveraging:
+
+    def _freqs(self) -> list[float]:
+        return [float(i) for i in range(N_BINS)]
+
+    def test_folded_average_matches_reference(self):
+        sut = TapToneAnalyzer.for_testing()
+        spectra = _spectra(6, seed=1)
+        for mags in spectra:
+            sut._append_captured_tap(mags, self._freqs())
+        mags, freqs = sut.average_spectra(from_taps=sut.captured_taps)
+        np.testing.assert_allclose(mags, _reference_average(spectra), rtol=0, atol=1e-9)
+        assert freqs == self._freqs()
+
+    def test_running_average_is_available_after_every_tap(self):
+        sut = TapToneAnalyzer.for_testing()
+        spectra = _spectra(3, seed=2)
+        assert sut.running_tap_average() is None
+        for i, mags in enumerate(spectra, start=1):
+            sut._append_captured_tap(mags, self._freqs())
+            mean_db, variance = sut.running_tap_average()
+            np.testing.assert_allclose(mean_db, _reference_average(spectra[:i]), atol=1e-9)
+            assert variance is not None and variance.shape == (N_BINS,)
+
+    def test_cleared_taps_do_not_leak_into_the_average(self):
+        sut = TapToneAnalyzer.for_testing()
+        for mags in _spectra(4, seed=3):
+            sut._append_captured_tap(mags, self._freqs())
+        sut.captured_taps.clear()  # a phase / sequence reset
+        fresh = _spectra(2, seed=4)
+        for mags in fresh:
+            sut._append_captured_tap(mags, self._freqs())
+        mags, _ = sut.average_spectra(from_taps=sut.captured_taps)
+        np.testing.assert_allclose(mags, _reference_average(fresh), atol=1e-9)
+
+    def test_other_tap_lists_are_averaged_directly(self):
+        sut = TapToneAnalyzer.for_testing()
+        sut._append_captured_tap(_spectra(1, seed=5)[0], self._freqs())
+        other = _spectra(3, seed=6)
+        mags, _ = sut.average_spectra([(m, self._freqs(), 0.0) for m in other])
+        np.testing.assert_allclose(mags, _reference_average(other), atol=1e-9)
@@ -0,0 +1,79 @@
+"""Pin SampleRingBuffer — the float32 FIFO behind RealtimeFFTAnalyzer._input_buffer.
+
+Python-only (Swift's inputBuffer is a plain [Float]): views must be contiguous,
+zero-copy, and return samples in arrival order across the wrap point.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from guitar_tap.utilities.sample_ring_buffer import SampleRingBuffer
+
+
+def _ramp(start: int, n: int) -> np.ndarray:
+    return np.arange(start, start + n, dtype=np.float32)
+
+
+class TestSampleRingBuffer:
+
+    def test_views_follow_fifo_order_across_wrap(self):
+        buf = SampleRingBuffer(8)
+        buf.append(_ramp(0, 6))
+        buf.discard(4)
+        buf.append(_ramp(6, 5))  # wraps past the end of the backing store
+        assert len(buf) == 7
+        np.testing.assert_array_equal(buf.view(), _ramp(4, 7))
+        np.testing.assert_array_equal(buf.oldest(3), _ramp(4, 3))
+        np.testing.assert_array_equal(buf.latest(3), _ramp(8, 3))
+
+    def test_views_are_zero_copy(self):
+        buf = SampleRingBuffer(8)
+        buf.append(_ramp(0, 5))
+        buf.discard(3)
+        buf.append(_ramp(5, 6))
+        v = buf.oldest(8)
+        assert v.flags["C_CONTIGUOUS"]
+        assert np.shares_memory(v, buf._data)
+
+    def test_requests_clamp_to_length(self):
+        buf = SampleRingBuffer(4)
+        buf.append([1.0, 2.0])
+        assert buf.oldest(10).shape == (2,)
+        assert buf.latest(10).shape == (2,)
+        buf.discard(10)
+        assert len(buf) == 0 and not buf
+
+    def test_overflow_grows_without_losing_samples(self):
+        buf = SampleRingBuffer(4)
+        buf.append(_ramp(0, 3))
+        buf.discard(2)
+        buf.append(_ramp(3, 9))
+        assert buf.capacity >= 10
+        np.testing.assert_array_equal(buf.view(), np.concatenate([_ramp(2, 1), _ramp(3, 9)]))
+
+    def test_clear_keeps_backing_store(self):
+        buf = SampleRingBuffer(4)
+        data = buf._data
+        buf.append(_ramp(0, 4))
+        buf.clear()
+        assert len(buf) == 0
+        assert buf._data is data
+
+    def test_rejects_non_positive_capacity(self):
+        with pytest.raises(ValueError):
+            SampleRingBuffer(0)
+
+    def test_replace_reuses_store(self):
+        buf = SampleRingBuffer(8)
+        data = buf._data
+        buf.append(_ramp(0, 6))
+        buf.replace(_ramp(10, 3))
+        np.testing.assert_array_equal(buf.view(), _ramp(10, 3))
+        assert buf._data is data
@@ -14,6 +14,7 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from guitar_tap.models.tap_tone_analyzer import TapToneAnalyzer
+from guitar_tap.utilities.session_recorder import SessionRecorder
 
 CHUNK = [0.0] * 1024  # one ~21 ms chunk at 48 kHz
 
@@ -24,7 +25,7 @@ def _armed() -> TapToneAnalyzer:
     a._is_session_recording = True
     a._session_pre_roll_active = True
     a._gated_capture_active = False
-    a._session_recording_buffer = []
+    a._session_recorder = SessionRecorder(48000.0)
     return a
 
 
@@ -34,8 +35,8 @@ def test_idle_before_first_tap_is_bounded():
     a = _armed()
     for _ in range(300):  # ~6.4 s of idle, well over the 2 s pre-roll
         a._maintain_session_recording(CHUNK)
-    assert len(a._session_recording_buffer) <= a.session_pre_roll_samples
-    assert len(a._session_recording_buffer) > a.session_pre_roll_samples - len(CHUNK)
+    assert len(a._session_recorder) <= a.session_pre_roll_samples
+    assert len(a._session_recorder) > a.session_pre_roll_samples - len(CHUNK)
 
 
 # ── The first tap freezes the latch ────────────────────────────────────────
@@ -58,7 +59,7 @@ def test_multi_tap_multi_phase_after_first_tap_is_fully_live():
         a._maintain_session_recording(CHUNK)
     a._gated_capture_active = True
     a._maintain_session_recording(CHUNK)  # freezes
-    expected = len(a._session_recording_buffer)
+    expected = len(a._session_recorder)
 
     # Long multi-tap / multi-phase session with big idle GAPS between taps — none of it may be
     # trimmed now that the latch is frozen.
@@ -71,7 +72,7 @@ def test_multi_tap_multi_phase_after_first_tap_is_fully_live():
         a._maintain_session_recording(CHUNK)
         expected += len(CHUNK)
 
-    assert len(a._session_recording_buffer) == expected, (
+    assert len(a._session_recorder) == expected, (
         "After the first tap the session must be COMPLETELY LIVE — no chunk trimmed"
     )
     assert a._session_pre_roll_active is False
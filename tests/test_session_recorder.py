@@ -0,0 +1,158 @@
+"""Pin SessionRecorder — the disk-streamed storage behind the session WAV.
+
+Python-only (Swift keeps sessionRecordingBuffer as [Float]): after freeze() the
+audio is streamed to a temp float32 WAV, redo truncations land in order with
+the writes, and finalize() produces exactly the samples that were kept.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from guitar_tap.utilities.session_recorder import SessionRecorder
+
+RATE = 48000.0
+
+
+def _ramp(start: int, n: int) -> np.ndarray:
+    return np.arange(start, start + n, dtype=np.float32)
+
+
+def _read(path) -> np.ndarray:
+    data, rate = sf.read(str(path), dtype="float32")
+    assert rate == int(RATE)
+    return data
+
+
+class TestSessionRecorder:
+
+    def test_head_is_trimmed_then_streamed_after_freeze(self, tmp_path):
+        rec = SessionRecorder(RATE, head_capacity=16)
+        rec.append(_ramp(0, 100))
+        rec.keep_latest(40)
+        assert len(rec) == 40 and not rec.frozen
+        rec.freeze()
+        rec.append(_ramp(100, 50))
+        rec.keep_latest(10)  # no-op once frozen
+        assert len(rec) == 90
+
+        out = tmp_path / "session.wav"
+        assert rec.finalize(str(out))
+        np.testing.assert_array_equal(_read(out), _ramp(60, 90))
+        assert rec._path is not None and not os.path.exists(rec._path)
+
+    def test_truncate_to_checkpoint_drops_the_rejected_phase(self, tmp_path):
+        rec = SessionRecorder(RATE)
+        rec.append(_ramp(0, 30))
+        rec.freeze()
+        checkpoint = len(rec)
+        rec.append(_ramp(30, 70))   # rejected phase
+        rec.truncate(checkpoint)
+        assert len(rec) == checkpoint
+        rec.append(_ramp(500, 20))  # redone phase
+
+        out = tmp_path / "session.wav"
+        assert rec.finalize(str(out))
+        np.testing.assert_array_equal(_read(out), np.concatenate([_ramp(0, 30), _ramp(500, 20)]))
+
+    def test_truncate_to_zero_returns_to_head_mode(self, tmp_path):
+        rec = SessionRecorder(RATE)
+        rec.append(_ramp(0, 30))
+        rec.freeze()
+        rec.append(_ramp(30, 30))
+        rec.truncate(0)
+        assert len(rec) == 0 and not rec.frozen
+        rec.append(_ramp(100, 50))
+        rec.keep_latest(20)
+
+        out = tmp_path / "session.wav"
+        assert rec.finalize(str(out))
+        np.testing.assert_array_equal(_read(out), _ramp(130, 20))
+
+    def test_discard_removes_the_temp_file(self):
+        rec = SessionRecorder(RATE)
+        rec.append(_ramp(0, 10))
+        rec.freeze()
+        path = rec._path
+        assert path is not None
+        rec.discard()
+        assert not os.path.exists(path)
+        assert len(rec) == 0
+
+    def test_unwritable_temp_file_fails_finalize_instead_of_hanging(self, tmp_path, monkeypatch):
+        import builtins
+
+        folder = tmp_path / "dump"
+        folder.mkdir()
+        rec = SessionRecorder(RATE, directory=str(folder))
+        rec.append(_ramp(0, 10))
+        real_open = open
+
+        def vanished(path, *args, **kwargs):
+            if path == rec._path:
+                raise FileNotFoundError(path)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", vanished)
+        rec.freeze()
+        rec.append(_ramp(10, 10))
+        out = tmp_path / "session.wav"
+        assert not rec.finalize(str(out))
+        monkeypatch.undo()
+        assert isinstance(rec.error, FileNotFoundError)
+        assert not out.exists()
+
+    def test_empty_recording_writes_nothing(self, tmp_path):
+        out = tmp_path / "session.wav"
+        assert not SessionRecorder(RATE).finalize(str(out))
+        assert not out.exists()
+
+
+class TestSessionRecordingFolder:
+    """The analyzer records a session only when Dump Capture Audio is on, and
+    streams it into the dump folder so finalizing is a rename."""
+
+    def test_temp_file_is_created_in_the_given_directory(self, tmp_path):
+        rec = SessionRecorder(RATE, directory=str(tmp_path))
+        rec.append(_ramp(0, 10))
+        rec.freeze()
+        assert os.path.dirname(rec._path) == str(tmp_path)
+        assert not rec._path.endswith(".wav")         # never mistaken for a dump
+        out = tmp_path / "session.wav"
+        assert rec.finalize(str(out))
+        assert sorted(os.listdir(tmp_path)) == ["session.wav"]
+
+    def _start(self, monkeypatch, tmp_path, dump: bool):
+        from PySide6 import QtWidgets
+
+        from guitar_tap.models.tap_tone_analyzer import TapToneAnalyzer
+        # The analyzer imports these as top-level ``models.*``.
+        from models.tap_display_settings import TapDisplaySettings
+        from models.wav_dump_folder import WavDumpFolder
+
+        QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+        monkeypatch.setattr(TapDisplaySettings, "dump_capture_audio", classmethod(lambda cls: dump))
+        monkeypatch.setattr(WavDumpFolder, "acquire_dump_folder",
+                            staticmethod(lambda: (tmp_path, lambda: None)))
+        a = TapToneAnalyzer()
+        a.start_tap_sequence(skip_warmup=True)
+        return a
+
+    def test_no_recorder_when_dump_capture_audio_is_off(self, monkeypatch, tmp_path):
+        a = self._start(monkeypatch, tmp_path, dump=False)
+        assert a._session_recorder is None
+        a._maintain_session_recording(np.zeros(256, dtype=np.float32))
+        a.finish_session_recording(label="Guitar_1tap")
+        assert os.listdir(tmp_path) == []
+
+    def test_recorder_streams_into_the_dump_folder(self, monkeypatch, tmp_path):
+        a = self._start(monkeypatch, tmp_path, dump=True)
+        assert a._session_recorder is not None
+        assert a._session_recorder.directory == str(tmp_path)
+        a._session_recorder.discard()
@@ -0,0 +1,139 @@
+"""
+Settings cache — AppSettings write-through cache and the TapDisplaySettings
+per-frame memo (Python-only).
+
+Reads must not construct a QSettings object once the suite is loaded, every
+write must reach QSettings and the cache, and a write made through AppSettings
+directly (as the views do) must be visible through TapDisplaySettings.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+from PySide6 import QtCore
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+import views.utilities.tap_settings_view as tsv  # noqa: E402
+from models.guitar_type import GuitarType  # noqa: E402
+from models.measurement_type import MeasurementType  # noqa: E402
+from models.tap_display_settings import TapDisplaySettings as TDS  # noqa: E402
+
+AppSettings = tsv.AppSettings
+
+
+@pytest.fixture
+def restore_settings():
+    saved = (AppSettings.measurement_type(), AppSettings.guitar_type(),
+             AppSettings.show_unknown_modes(), AppSettings.plate_length())
+    yield
+    mt, gt, show, length = saved
+    AppSettings.set_measurement_type(mt)
+    AppSettings.set_guitar_type(gt)
+    AppSettings.set_show_unknown_modes(show)
+    AppSettings.set_plate_length(length)
+
+
+class _NoQSettings:
+    def __init__(self, *args, **kwargs):
+        raise AssertionError("QSettings constructed on a cached read")
+
+
+def test_warm_reads_do_not_touch_qsettings(restore_settings, monkeypatch):
+    TDS.set_measurement_type(MeasurementType.PLATE)
+    TDS.measurement_type(), TDS.guitar_type(), TDS.show_unknown_modes(), TDS.plate_length()
+
+    monkeypatch.setattr(tsv.QtCore, "QSettings", _NoQSettings)
+    for _ in range(3):
+        assert TDS.measurement_type() == MeasurementType.PLATE
+        assert isinstance(TDS.guitar_type(), GuitarType)
+        assert isinstance(TDS.show_unknown_modes(), bool)
+        assert TDS.plate_length() > 0
+
+
+def test_setter_writes_through_to_qsettings(restore_settings):
+    TDS.set_plate_length(432.0)
+    assert TDS.plate_length() == 432.0
+    assert float(AppSettings._s().value("plate/length")) == 432.0
+
+
+def test_direct_appsettings_write_drops_memo(restore_settings):
+    AppSettings.set_measurement_type(MeasurementType.ACOUSTIC)
+    AppSettings.set_show_unknown_modes(True)
+    assert TDS.measurement_type() == MeasurementType.ACOUSTIC
+    assert TDS.show_unknown_modes() is True
+
+    # The views write through AppSettings, bypassing TapDisplaySettings.
+    AppSettings.set_measurement_type(MeasurementType.BRACE)
+    AppSettings.set_show_unknown_modes(False)
+    assert TDS.measurement_type() == MeasurementType.BRACE
+    assert TDS.show_unknown_modes() is False
+
+    TDS.set_guitar_type(GuitarType.CLASSICAL)
+    assert TDS.measurement_type() == MeasurementType.from_guitar_type(GuitarType.CLASSICAL)
+    assert TDS.guitar_type() == GuitarType.CLASSICAL
+
+
+def test_write_during_load_is_not_masked_by_a_stale_memo(restore_settings):
+    AppSettings.set_show_unknown_modes(False)
+    TDS.show_unknown_modes()
+    TDS._memo.pop("show_unknown_modes")
+
+    def load_straddling_a_write():
+        # Audio thread reads the old value; the main thread writes before it is cached.
+        stale = AppSettings.show_unknown_modes()
+        AppSettings.set_show_unknown_modes(True)
+        return stale
+
+    assert TDS._memoized("show_unknown_modes", load_straddling_a_write) is False
+    assert "show_unknown_modes" not in TDS._memo
+    assert TDS.show_unknown_modes() is True
+
+
+def test_memo_filled_on_a_worker_thread_is_cleared_by_a_main_thread_write(restore_settings):
+    import threading
+
+    AppSettings.set_measurement_type(MeasurementType.BRACE)
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(TDS.measurement_type()))
+    worker.start()
+    worker.join()
+    assert seen == [MeasurementType.BRACE]
+
+    TDS.set_measurement_type(MeasurementType.PLATE)
+    assert TDS.measurement_type() == MeasurementType.PLATE
+
+
+def test_writes_survive_a_deleted_notifier(restore_settings):
+    import shiboken6
+
+    AppSettings.set_show_unknown_modes(False)
+    assert TDS.show_unknown_modes() is False
+    shiboken6.delete(AppSettings.notifier())   # e.g. destroyed with its QApplication
+    AppSettings.set_show_unknown_modes(True)
+    assert TDS.show_unknown_modes() is True
+    assert AppSettings._notifier is None
+
+
+def test_invalidate_cache_picks_up_external_writes(restore_settings):
+    AppSettings.set_plate_length(250.0)
+    assert TDS.plate_length() == 250.0
+
+    external = AppSettings._s()
+    external.setValue("plate/length", 275.0)
+    assert TDS.plate_length() == 250.0  # cached until invalidated
+
+    AppSettings.invalidate_cache()
+    assert TDS.plate_length() == 275.0
+
+
+def test_remove_clears_cached_key():
+    AppSettings.set_selected_input_device_fingerprint("Mic:48000")
+    assert AppSettings._get(AppSettings._DEVICE_FP_KEY, None) == "Mic:48000"
+    AppSettings.set_selected_input_device_fingerprint(None)
+    assert AppSettings._get(AppSettings._DEVICE_FP_KEY, None) is None
+    assert AppSettings._s().value(AppSettings._DEVICE_FP_KEY) is None
@@ -0,0 +1,102 @@
+"""
+Viewport decimation of the live spectrum line (views/spectrum_line_decimation.py)
+— Python-only.
+
+The decimated line must cover the visible range (plus margin), keep every
+bucket's extremes at their true frequencies — so no peak is lost — stay within
+two points per pixel, and be redone when the plot's x-range changes.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+from views.spectrum_line_decimation import VIEW_MARGIN, decimate_for_view  # noqa: E402
+
+_N = 32769
+
+
+@pytest.fixture
+def spectrum() -> tuple[np.ndarray, np.ndarray]:
+    freqs = np.linspace(0.0, 24000.0, _N)
+    mags = np.random.default_rng(0).uniform(-90.0, -40.0, _N)
+    mags[9000] = -3.0           # a one-bin peak
+    mags[20000] = -120.0        # a one-bin notch
+    return freqs, mags
+
+
+class TestDecimateForView:
+
+    def test_narrow_window_is_sliced_not_decimated(self, spectrum):
+        freqs, mags = spectrum
+        x, y = decimate_for_view(freqs, mags, 75.0, 350.0, 1000)
+        margin = (350.0 - 75.0) * VIEW_MARGIN
+        assert x[0] < 75.0 - margin and x[-1] > 350.0 + margin
+        inside = (freqs >= x[0]) & (freqs <= x[-1])
+        np.testing.assert_array_equal(x, freqs[inside])
+        np.testing.assert_array_equal(y, mags[inside])
+
+    def test_wide_window_keeps_extremes_within_two_points_per_pixel(self, spectrum):
+        freqs, mags = spectrum
+        x, y = decimate_for_view(freqs, mags, 0.0, 24000.0, 800)
+        assert len(x) <= 2 * 800 + 2
+        assert x[0] == freqs[0] and x[-1] == freqs[-1]
+        assert np.all(np.diff(x) >= 0)
+        assert y.max() == -3.0 and x[np.argmax(y)] == freqs[9000]
+        assert y.min() == -120.0 and x[np.argmin(y)] == freqs[20000]
+        # Every point is a real bin, not an interpolation.
+        idx = np.searchsorted(freqs, x)
+        np.testing.assert_array_equal(mags[idx], y)
+
+    def test_degenerate_inputs(self, spectrum):
+        freqs, mags = spectrum
+        x, y = decimate_for_view(freqs[:0], mags[:0], 0.0, 100.0, 500)
+        assert len(x) == len(y) == 0
+        x, y = decimate_for_view(freqs, mags, 0.0, 24000.0, 0)     # before layout
+        assert 0 < len(x) <= 4 and y.max() == -3.0
+        x, y = decimate_for_view(freqs, mags[:100], 0.0, 24000.0, 1000)   # mid-switch
+        assert len(x) == len(y) == 100
+
+
+class TestFftLineRedraw:
+
+    def test_line_is_redecimated_when_the_x_range_changes(self, spectrum):
+        import pyqtgraph as pg
+        from PySide6 import QtWidgets
+
+        from views.fft_canvas import FftCanvas
+
+        QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+        class _Plot(pg.PlotWidget):
+            _set_fft_line = FftCanvas._set_fft_line
+            _redraw_fft_line = FftCanvas._redraw_fft_line
+
+            def __init__(self) -> None:
+                super().__init__()
+                self.fft_line = self.plot([], [])
+                self._line_freqs = self._line_mags = None
+                self.getPlotItem().vb.sigXRangeChanged.connect(self._redraw_fft_line)
+
+        plot = _Plot()
+        plot.resize(1000, 400)
+        plot.setXRange(75.0, 350.0, padding=0)
+        freqs, mags = spectrum
+        plot._set_fft_line(freqs, mags)
+        x, _ = plot.fft_line.getData()
+        assert x[-1] < 400.0
+
+        plot.setXRange(0.0, 24000.0, padding=0)
+        x, y = plot.fft_line.getData()
+        assert x[-1] == freqs[-1] and len(x) < 4000 and y.max() == -3.0
+
+        plot._set_fft_line(None, None)
+        plot.setXRange(100.0, 200.0, padding=0)
+        assert len(plot.fft_line.getData()[0] or []) == 0
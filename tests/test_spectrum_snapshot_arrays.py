@@ -0,0 +1,146 @@
+"""
+SpectrumSnapshot float32 array storage — Python-only.
+
+Decoded spectra are held as float32 ndarrays (np.frombuffer) and encoded with
+``tobytes()``; the ``frequencies`` / ``magnitudes`` lists must stay available
+and the Base64 blobs must be byte-identical to the struct-based codec.
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import struct
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+from models.spectrum_snapshot import SpectrumSnapshot  # noqa: E402
+
+
+def _struct_base64(floats) -> str:
+    """The previous encoder: one Python float per bin through struct."""
+    return base64.b64encode(struct.pack(f"<{len(floats)}f", *floats)).decode("ascii")
+
+
+def _struct_decode(b64: str) -> list[float]:
+    raw = base64.b64decode(b64)
+    return list(struct.unpack(f"<{len(raw) // 4}f", raw))
+
+
+@pytest.fixture
+def spectrum():
+    rng = np.random.default_rng(17)
+    freqs = (np.arange(4096) * 0.732421875).tolist()
+    mags = rng.uniform(-140.0, 0.0, 4096).tolist()
+    mags[10] = float("-inf")
+    return freqs, mags
+
+
+class TestSpectrumSnapshotArrays:
+
+    def test_encoding_is_byte_identical_to_struct_codec(self, spectrum):
+        freqs, mags = spectrum
+        d = SpectrumSnapshot(frequencies=freqs, magnitudes=mags).to_dict()
+        assert d["frequenciesData"] == _struct_base64(freqs)
+        assert d["magnitudesData"] == _struct_base64(mags)
+
+    def test_decode_keeps_float32_arrays_until_list_read(self, spectrum):
+        d = SpectrumSnapshot(frequencies=spectrum[0], magnitudes=spectrum[1]).to_dict()
+        snap = SpectrumSnapshot.from_dict(d)
+        assert "magnitudes" not in snap.__dict__
+        assert snap.magnitudes_array.dtype == np.float32
+        assert snap.to_dict()["magnitudesData"] == d["magnitudesData"]
+        assert "magnitudes" not in snap.__dict__
+
+        assert snap.magnitudes == _struct_decode(d["magnitudesData"])
+        assert isinstance(snap.magnitudes, list)
+        assert snap.frequencies == _struct_decode(d["frequenciesData"])
+
+    def test_list_edits_win_over_decoded_array(self, spectrum):
+        snap = SpectrumSnapshot.from_dict(
+            SpectrumSnapshot(frequencies=spectrum[0], magnitudes=spectrum[1]).to_dict())
+        snap.magnitudes[0] = -1.5
+        snap.frequencies = [1.0, 2.0]
+        d = snap.to_dict()
+        assert _struct_decode(d["magnitudesData"])[0] == -1.5
+        assert _struct_decode(d["frequenciesData"]) == [1.0, 2.0]
+
+    def test_equality_and_deferred_arrays(self, spectrum):
+        d = SpectrumSnapshot(frequencies=spectrum[0], magnitudes=spectrum[1]).to_dict()
+        a, b = SpectrumSnapshot.from_dict(d), SpectrumSnapshot.from_dict(d)
+        src = SpectrumSnapshot.from_dict(d)
+        b.defer_spectrum(lambda: (src.frequencies_array, src.magnitudes_array))
+        assert b.is_spectrum_deferred
+        assert b.magnitudes_array.dtype == np.float32
+        assert not b.is_spectrum_deferred
+        assert a == b
+
+
+class TestLazyDecode:
+
+    def test_from_dict_defers_decoding_and_round_trips_blobs_verbatim(self, spectrum, monkeypatch):
+        from models import spectrum_snapshot as ss
+
+        d = SpectrumSnapshot(frequencies=spectrum[0], magnitudes=spectrum[1]).to_dict()
+        calls = []
+        real = ss._decode_floats
+        monkeypatch.setattr(ss, "_decode_floats", lambda data: calls.append(1) or real(data))
+
+        snap = SpectrumSnapshot.from_dict(d)
+        assert snap.is_spectrum_deferred
+        assert snap.to_dict() == d
+        assert calls == []
+
+        assert snap.magnitudes[:3] == _struct_decode(d["magnitudesData"])[:3]
+        snap.frequencies_array, snap.magnitudes_array, snap.to_dict()
+        assert len(calls) == 2            # both blobs, decoded once
+        assert not snap.is_spectrum_deferred
+
+    def test_tap_entry_snapshots_load_lazily(self, spectrum):
+        from models.tap_tone_measurement import TapEntry
+
+        d = SpectrumSnapshot(frequencies=spectrum[0], magnitudes=spectrum[1]).to_dict()
+        entry = TapEntry.from_dict({"id": "t1", "tapIndex": 1, "snapshot": d, "peaks": []})
+        assert entry.snapshot.is_spectrum_deferred
+        assert entry.to_dict()["snapshot"] == d
+        assert entry.snapshot.is_spectrum_deferred
+
+
+class TestParametricFrequencyAxis:
+
+    def test_version_2_round_trips_to_identical_version_1_bytes(self, spectrum):
+        from models.spectrum_snapshot import SNAPSHOT_FORMAT_PARAMETRIC_AXIS
+
+        snap = SpectrumSnapshot(frequencies=spectrum[0], magnitudes=spectrum[1])
+        v1 = snap.to_dict()
+        v2 = snap.to_dict(SNAPSHOT_FORMAT_PARAMETRIC_AXIS)
+        assert "frequenciesData" not in v2 and v2["formatVersion"] == 2
+        assert v2["frequencyAxis"] == {"start": 0.0, "spacing": 0.732421875, "count": 4096}
+
+        again = SpectrumSnapshot.from_dict(v2)
+        assert again.to_dict() == v1                       # expanded back to the blob
+        assert again.to_dict(SNAPSHOT_FORMAT_PARAMETRIC_AXIS) == v2
+        assert again.frequencies == _struct_decode(v1["frequenciesData"])
+
+    def test_loaded_version_1_blob_is_compacted_when_writing_version_2(self, spectrum):
+        from models.spectrum_snapshot import SNAPSHOT_FORMAT_PARAMETRIC_AXIS
+
+        v1 = SpectrumSnapshot(frequencies=spectrum[0], magnitudes=spectrum[1]).to_dict()
+        v2 = SpectrumSnapshot.from_dict(v1).to_dict(SNAPSHOT_FORMAT_PARAMETRIC_AXIS)
+        assert "frequencyAxis" in v2
+        assert len(repr(v2)) < 0.6 * len(repr(v1))
+
+    def test_non_uniform_axis_keeps_blob(self, spectrum):
+        from models.spectrum_snapshot import SNAPSHOT_FORMAT_PARAMETRIC_AXIS
+
+        freqs = list(spectrum[0])
+        freqs[100] += 0.01
+        d = SpectrumSnapshot(frequencies=freqs, magnitudes=spectrum[1]).to_dict(
+            SNAPSHOT_FORMAT_PARAMETRIC_AXIS)
+        assert "frequencyAxis" not in d and "formatVersion" not in d
+        assert d["frequenciesData"] == _struct_base64(freqs)
@@ -0,0 +1,90 @@
+"""Pin the overlapping-hop STFT mode of RealtimeFFTAnalyzer.process_raw_samples.
+
+Python-only (Swift always drains fftSize samples per frame): with the default
+hop (== fft_size) frames never overlap; a smaller hop emits one frame per hop
+of new audio over the most recent fft_size samples.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "guitar_tap"))
+
+from guitar_tap.models.realtime_fft_analyzer import RealtimeFFTAnalyzer
+from guitar_tap.models.realtime_fft_analyzer_fft_processing import perform_fft
+from views.utilities.tap_settings_view import AppSettings  # noqa: E402
+
+CHUNK = 1024
+
+
+def _feed(mic: RealtimeFFTAnalyzer, samples: np.ndarray) -> list[np.ndarray]:
+    """Push *samples* through process_raw_samples in CHUNK blocks; return the dB frames."""
+    frames: list[np.ndarray] = []
+    mic.fft_frame_handler = lambda mag_y_db, *rest: frames.append(np.array(mag_y_db))
+    for i in range(0, len(samples), CHUNK):
+        mic.process_raw_samples(samples[i:i + CHUNK])
+    return frames
+
+
+def _signal(n: int) -> np.ndarray:
+    rng = np.random.default_rng(7)
+    return (0.1 * rng.standard_normal(n)).astype(np.float32)
+
+
+class TestStftHop:
+
+    def test_default_hop_is_non_overlapping(self):
+        mic = RealtimeFFTAnalyzer.for_testing()
+        assert mic.hop_size == mic.fft_size
+        frames = _feed(mic, _signal(3 * mic.fft_size + 5 * CHUNK))
+        assert len(frames) == 3
+
+    def test_small_hop_emits_one_frame_per_hop(self):
+        mic = RealtimeFFTAnalyzer.for_testing()
+        mic.set_hop_size(8192)
+        n = mic.fft_size + 4 * 8192
+        frames = _feed(mic, _signal(n))
+        # First frame once fft_size samples are buffered, then one per hop.
+        assert len(frames) == 5
+
+    def test_overlapping_frame_covers_latest_window(self):
+        mic = RealtimeFFTAnalyzer.for_testing()
+        hop = 4096
+        mic.set_hop_size(hop)
+        samples = _signal(mic.fft_size + 3 * hop)
+        frames = _feed(mic, samples)
+        assert len(frames) == 4
+        for k, frame in enumerate(frames):
+            expected, _, _ = perform_fft(
+                mic, samples[k * hop:k * hop + mic.fft_size], mic.fft_size
+            )
+            np.testing.assert_array_equal(frame, expected)
+
+    @pytest.mark.parametrize("bad", [0, -1, 65537])
+    def test_out_of_range_hop_rejected(self, bad):
+        mic = RealtimeFFTAnalyzer.for_testing()
+        with pytest.raises(ValueError):
+            mic.set_hop_size(bad)
+        assert mic.hop_size == mic.fft_size
+
+    def test_engine_start_applies_the_hop_setting(self):
+        class _Stream:
+            def start(self):
+                pass
+
+        mic = RealtimeFFTAnalyzer.for_testing()
+        mic.stream = _Stream()
+        mic.is_playing_file = True  # no buffer watchdog in a unit test
+        with AppSettings.in_memory_suite():
+            AppSettings.set_fft_hop_size(8192)
+            mic.start()
+            assert mic.hop_size == 8192
+            AppSettings.set_fft_hop_size(1234)  # not an offered choice
+            mic.start()
+            assert mic.hop_size == mic.fft_size
@@ -0,0 +1,103 @@
+"""Pin the TAP_DEBUG capture diagnostics.
+
+capture_window_profile must keep the exact text of the Swift-parity per-sample
+loop, and with tap debugging off a completed capture must not build any
+profile at all (Python-only: the diagnostics are gated by tap_debug_enabled()).
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from guitar_tap.models.tap_tone_analyzer import TapToneAnalyzer
+from guitar_tap.utilities import logging as gt_logging
+
+RATE = 48000.0
+CHUNK = 1024
+
+
+def _reference_profile(samples, label: str, segment_size: int = 1024) -> str:
+    """The original per-sample implementation (mirrors Swift captureWindowProfile)."""
+    count = len(samples)
+    if count == 0:
+        return f"{label}: (empty)"
+    lines = [f"{label}: {count} samples ({count}/{segment_size} segments)"]
+    seg = 0
+    offset = 0
+    while offset < count:
+        end = min(offset + segment_size, count)
+        sum_sq = 0.0
+        peak_abs = 0.0
+        for s in samples[offset:end]:
+            f = float(s)
+            sum_sq += f * f
+            peak_abs = max(peak_abs, abs(f))
+        rms = math.sqrt(sum_sq / (end - offset))
+        rms_db = 20.0 * math.log10(max(rms, 1e-10))
+        lines.append(
+            f"  seg[{seg:2d}] samples[{offset:5d}:{end:5d}] "
+            f"RMS={rms_db:7.1f} dB  peak={peak_abs:.6f}"
+        )
+        seg += 1
+        offset = end
+    return "\n".join(lines)
+
+
+class TestCaptureWindowProfile:
+
+    @pytest.mark.parametrize("count", [0, 1, 1024, 5000, 24000])
+    def test_matches_per_sample_reference(self, count):
+        rng = np.random.default_rng(count)
+        samples = (rng.standard_normal(count) * 0.1).astype(np.float32)
+        if count > 2048:
+            samples[1024:2048] = 0.0  # a silent segment hits the -200 dB floor
+        a = TapToneAnalyzer.for_testing()
+        assert a.capture_window_profile(samples, "W") == _reference_profile(samples, "W")
+
+    def test_accepts_lists(self):
+        a = TapToneAnalyzer.for_testing()
+        samples = [0.5, -0.25, 0.125]
+        assert a.capture_window_profile(samples, "L", 2) == _reference_profile(samples, "L", 2)
+
+
+class TestDiagnosticsAreLazy:
+
+    def _complete_capture(self, monkeypatch, enabled: bool) -> list[str]:
+        monkeypatch.setattr(gt_logging, "_tap_debug_enabled", enabled)
+        monkeypatch.setattr(gt_logging._file_logger, "_write", lambda message: None)
+        a = TapToneAnalyzer.for_testing()
+        thread = a.mic.proc_thread
+        thread.gatedCaptureComplete.disconnect(a.finish_gated_fft_capture)
+        emitted: list = []
+        thread.gatedCaptureComplete.connect(lambda s, r, p: emitted.append(s))
+        profiled: list[str] = []
+        original = a.capture_window_profile
+
+        def spy(samples, label, segment_size=1024):
+            profiled.append(label)
+            return original(samples, label, segment_size)
+
+        monkeypatch.setattr(a, "capture_window_profile", spy)
+        chunk = np.zeros(CHUNK, dtype=np.float32)
+        for _ in range(20):
+            a._accumulate_gated_samples(chunk, RATE)
+        a.start_guitar_gated_capture()
+        for _ in range(0, a._gated_capture_samples, CHUNK):
+            a._accumulate_gated_samples(chunk, RATE)
+        assert len(emitted) == 1
+        return profiled
+
+    def test_no_profile_when_tap_debug_is_off(self, monkeypatch):
+        assert self._complete_capture(monkeypatch, enabled=False) == []
+
+    def test_profile_built_when_tap_debug_is_on(self, monkeypatch, capsys):
+        profiled = self._complete_capture(monkeypatch, enabled=True)
+        assert "ACCUM_COMPLETE(None)" in profiled
+        assert "CAPTURE COMPLETE" in capsys.readouterr().out